@@ -25,6 +25,17 @@ class BytesIOConverter:
             flat_bytes = bytes([byte for subarray in value for byte in subarray])
             return io.BytesIO(flat_bytes)
 
+        def validate_from_file(value: Any) -> io.BytesIO:
+            # Spooled or on-disk handles from streaming downloads are only
+            # read into memory when they reach a serialisable model
+            if not (hasattr(value, "read") and hasattr(value, "seek")):
+                raise ValueError("Expected a readable and seekable binary file")
+            value.seek(0)
+            content = value.read()
+            if not isinstance(content, bytes):
+                raise ValueError("Expected a binary file")
+            return io.BytesIO(content)
+
         def serialize_bytesio(value: io.BytesIO) -> str:
             return base64.b64encode(value.getvalue()).decode()
 
@@ -59,6 +70,7 @@ class BytesIOConverter:
                     from_bytes_schema,
                     from_str_schema,
                     from_array_schema,  # Added array schema
+                    core_schema.no_info_plain_validator_function(validate_from_file),
                 ]
             ),
             serialization=core_schema.plain_serializer_function_ser_schema(
@@ -17,6 +17,7 @@ from pantheon_v2.core.prompt.models import PromptConfig
 from pantheon_v2.core.prompt.generic import GenericPrompt
 from pantheon_v2.core.prompt.chain import PromptChain
 from pantheon_v2.settings.settings import Settings
+from pantheon_v2.tools.core.tool_registry import ToolRegistry
 from pantheon_v2.tools.external.gcs.tool import GCSTool
 from pantheon_v2.tools.external.gcs.models import (
     DownloadFromGCSInput,
@@ -139,8 +140,8 @@ async def process_request(
     project_id: str,
 ) -> ModelResponse:
     """Process a single evaluation request."""
-    gcs_tool = GCSTool(config={"project_id": project_id})
-    await gcs_tool.initialize()
+    # Reuse one client per project instead of opening a new one per request
+    gcs_tool = await ToolRegistry.get_tool_instance(GCSTool, {"project_id": project_id})
 
     chain = await build_chain_for_test(
         chain_config=chain_config, test_vars=test_vars, gcs_tool=gcs_tool
@@ -16,6 +16,9 @@ from zamp_public_workflow_sdk.temporal.data_converters.pydantic_payload_converte
 
 from pantheon_v2.core.temporal.activities.registry import get_registered_activities
 from pantheon_v2.core.temporal.workflows.registry import get_registered_workflows
+from pantheon_v2.tools.core.tool_registry import ToolRegistry
+from pantheon_v2.tools.external.postgres.tool import PostgresTool
+from pantheon_v2.utils.db_metrics import log_database_metrics
 
 from pantheon_v2.settings.settings import Settings, LOCAL
 from pantheon_v2.core.temporal.constants import TASK_QUEUE
@@ -81,7 +84,13 @@ class TemporalWorkerManager:
 
             worker = await self._service.worker(worker_config)
             logger.info("Starting Temporal worker", task_queue=self.task_queue)
-            await worker.run()
+            try:
+                await worker.run()
+            finally:
+                # Tools are shared across activities for the worker's lifetime
+                await ToolRegistry.close_tool_instances()
+                await PostgresTool.dispose_engines()
+                log_database_metrics()
 
         except Exception as e:
             logger.error(
@@ -90,10 +90,17 @@ def update_approver_status(
         raise ValueError(f"Approver {email} not found in approval hierarchy")
 
 
-async def update_metadata_in_db(invoice_id: str, metadata: dict):
+async def update_metadata_in_db(
+    invoice_id: str, metadata: dict, status: Optional[str] = None
+):
+    """Store the approval metadata, and the invoice status in the same update if given"""
+    data = {"metadata": json.dumps(metadata)}
+    if status is not None:
+        data["status"] = status
+
     update_params = RelationalUpdateParams(
         table=INVOICE_TABLE,
-        data={"metadata": json.dumps(metadata)},
+        data=data,
         where={"id": invoice_id},
     )
 
@@ -1,6 +1,6 @@
 from temporalio import workflow
 import base64
-from typing import List
+from typing import List, Union
 import datetime
 
 from pantheon_v2.processes.common.accounts_payable.models.invoice_approval_models import (
@@ -15,6 +15,7 @@ from pantheon_v2.tools.core.internal_data_repository.models import (
 from pantheon_v2.tools.core.internal_data_repository.activities import (
     query_internal_relational_data,
     query_internal_blob_storage_folder,
+    list_internal_blob_storage_folder,
 )
 from pantheon_v2.tools.common.ocr.models import (
     OCRExtractInput,
@@ -23,7 +24,13 @@ from pantheon_v2.tools.common.ocr.models import (
 )
 from pantheon_v2.tools.core.internal_data_repository.models import (
     BlobStorageFolderResult,
+    BlobStorageFolderListResult,
     BlobStorageFile,
+    BlobStorageFileInfo,
+)
+from pantheon_v2.tools.core.blob_reference.models import (
+    BlobReference,
+    BlobStorageProvider,
 )
 from pantheon_v2.tools.common.ocr.activities import extract_ocr_data
 from pantheon_v2.processes.common.accounts_payable.constants.invoice_approval_constants import (
@@ -59,11 +66,21 @@ async def process_attachments(
     query_params = BlobStorageFolderQueryParams(
         bucket_name=bucket_name, folder_path=folder_path
     )
-    files: BlobStorageFolderResult = await workflow.execute_activity(
-        query_internal_blob_storage_folder,
-        args=[query_params],
-        start_to_close_timeout=datetime.timedelta(minutes=10),
-    )
+    files: Union[BlobStorageFolderListResult, BlobStorageFolderResult]
+    if workflow.patched("ocr-attachments-by-reference"):
+        # Only metadata is listed, the OCR activity downloads each file itself
+        files = await workflow.execute_activity(
+            list_internal_blob_storage_folder,
+            args=[query_params],
+            start_to_close_timeout=datetime.timedelta(minutes=10),
+        )
+    else:
+        # Executions started before references replay the folder download
+        files = await workflow.execute_activity(
+            query_internal_blob_storage_folder,
+            args=[query_params],
+            start_to_close_timeout=datetime.timedelta(minutes=10),
+        )
 
     if not files.files:
         raise ValueError(f"No files found in GCS path: {gcs_path}")
@@ -76,14 +93,28 @@ async def process_attachments(
     return processed_files
 
 
-async def process_single_file(file: BlobStorageFile) -> ProcessedFileInfo:
-    encoded_file = base64.b64encode(file.content).decode("utf-8")
+async def process_single_file(
+    file: Union[BlobStorageFileInfo, BlobStorageFile],
+) -> ProcessedFileInfo:
+    if isinstance(file, BlobStorageFile):
+        # Downloaded by a replayed folder query, sent inline as before
+        file_content = base64.b64encode(file.content).decode("utf-8")
+    else:
+        bucket_name = file.full_path.replace("gs://", "").split("/", 1)[0]
+        file_content = BlobReference(
+            provider=BlobStorageProvider.GCS,
+            bucket_name=bucket_name,
+            key=file.blob_name,
+            generation=file.generation,
+            size=file.size,
+            content_type=file.content_type,
+        )
 
     ocr_response: OCRExtractOutput[InvoiceData] = await workflow.execute_activity(
         extract_ocr_data,
         args=[
             OCRExtractInput(
-                file_content=[encoded_file],
+                file_content=[file_content],
                 extract_dto=InvoiceData,
                 extraction_type=ExtractionType.INVOICE,
             )
@@ -2,6 +2,7 @@ from pantheon_v2.processes.core.registry import WorkflowRegistry
 from temporalio import workflow
 import asyncio
 import datetime
+from typing import Optional
 from pantheon_v2.processes.common.accounts_payable.constants.invoice_approval_constants import (
     INVOICE_TABLE,
 )
@@ -109,13 +110,8 @@ class InvoiceApprovalWorkflow:
                 response, current_approver, params.invoice_id
             )
 
+            # The final status is stored with the approval metadata
             if not approval_result.should_continue:
-                status = (
-                    INVOICE_STATUS_DISAPPROVED
-                    if approval_result.status == "disapprove"
-                    else INVOICE_STATUS_APPROVED
-                )
-                await self._update_invoice_status(params.invoice_id, status)
                 break
 
             if approval_result.next_approver:
@@ -147,6 +143,20 @@ class InvoiceApprovalWorkflow:
             start_to_close_timeout=datetime.timedelta(seconds=30),
         )
 
+    async def _store_approval(
+        self, invoice_id: str, metadata: dict, status: Optional[str]
+    ) -> None:
+        """Store the approval metadata, and the final invoice status if given"""
+        if workflow.patched("invoice-status-with-metadata"):
+            await update_metadata_in_db(invoice_id, metadata, status=status)
+            return
+
+        # Executions started before the status moved into the metadata update
+        # replay it as a separate update
+        await update_metadata_in_db(invoice_id, metadata)
+        if status is not None:
+            await self._update_invoice_status(invoice_id, status)
+
     async def _fetch_initial_data(self, invoice_id: str) -> FetchHierarchyResponse:
         # Process attachments first
         await self._process_invoice_attachments(invoice_id)
@@ -214,9 +224,10 @@ class InvoiceApprovalWorkflow:
 
         update_approver_status(metadata, email, approval_response)
 
-        await update_metadata_in_db(invoice_id, metadata)
-
         if approval_response.status.lower() == APPROVAL_RESPONSE_DISAPPROVE:
+            await self._store_approval(
+                invoice_id, metadata, status=INVOICE_STATUS_DISAPPROVED
+            )
             logger.info("Invoice has been disapproved", invoice_id=invoice_id)
             return ApprovalActivityResponse(
                 next_approver=None,
@@ -226,6 +237,11 @@ class InvoiceApprovalWorkflow:
             )
 
         next_approver_email = get_next_approver(metadata)
+        await self._store_approval(
+            invoice_id,
+            metadata,
+            status=INVOICE_STATUS_APPROVED if next_approver_email is None else None,
+        )
 
         return ApprovalActivityResponse(
             next_approver=next_approver_email,
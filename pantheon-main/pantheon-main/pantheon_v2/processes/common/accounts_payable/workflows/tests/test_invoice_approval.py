@@ -24,6 +24,7 @@ from pantheon_v2.processes.common.accounts_payable.constants.invoice_approval_co
     APPROVAL_HIERARCHY_KEY,
     APPROVAL_RESPONSE_APPROVE,
     APPROVAL_RESPONSE_DISAPPROVE,
+    INVOICE_STATUS_APPROVED,
     STATUS_OK,
 )
 from pantheon_v2.processes.common.accounts_payable.models.invoice_approval_models import (
@@ -33,8 +34,15 @@ from pantheon_v2.processes.common.accounts_payable.models.invoice_approval_model
 )
 from pantheon_v2.tools.core.internal_data_repository.models import (
     BlobStorageFolderResult,
+    BlobStorageFolderListResult,
     BlobStorageFile,
+    BlobStorageFileInfo,
 )
+from pantheon_v2.tools.core.internal_data_repository.activities import (
+    query_internal_blob_storage_folder,
+    list_internal_blob_storage_folder,
+)
+from pantheon_v2.tools.core.blob_reference.models import BlobReference
 from pantheon_v2.processes.common.accounts_payable.workflows.helpers import (
     attachment_processor,
     approval_processor,
@@ -95,17 +103,18 @@ def mock_metadata_result():
 
 @pytest.fixture
 def mock_blob_result():
-    return BlobStorageFolderResult(
+    return BlobStorageFolderListResult(
         files=[
-            BlobStorageFile(
+            BlobStorageFileInfo(
                 name="test.pdf",
+                blob_name="attachments/test.pdf",
                 full_path="gs://test/attachments/test.pdf",
                 relative_path="attachments/test.pdf",
                 size=1000,
                 content_type="application/pdf",
+                generation=1,
                 created=datetime.datetime.now(),
                 updated=datetime.datetime.now(),
-                content=b"test content",
             )
         ]
     )
@@ -287,16 +296,17 @@ class TestInvoiceApprovalWorkflow:
     @pytest.mark.asyncio
     async def test_process_single_file(self, mock_ocr_response, workflow_env):
         """Test processing a single file with OCR"""
-        # Create BlobStorageFile instead of dict
-        test_file = BlobStorageFile(
+        # Only listing metadata is passed, OCR downloads the file itself
+        test_file = BlobStorageFileInfo(
             name="test.pdf",
+            blob_name="attachments/test.pdf",
             full_path="gs://test/attachments/test.pdf",
             relative_path="attachments/test.pdf",
             size=1000,
             content_type="application/pdf",
+            generation=1,
             created=datetime.datetime.now(),
             updated=datetime.datetime.now(),
-            content=b"test content",
         )
 
         with patch(
@@ -316,11 +326,80 @@ class TestInvoiceApprovalWorkflow:
             assert len(args) > 0
             assert isinstance(args[0], OCRExtractInput)
             assert args[0].extraction_type == ExtractionType.INVOICE
+            assert args[0].file_content[0].uri == "gs://test/attachments/test.pdf"
+            assert args[0].file_content[0].generation == 1
 
             # Verify result
             assert result.name == test_file.name  # Updated to use property access
             assert result.extracted_data == mock_ocr_response.extracted_data
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("patched", [True, False])
+    async def test_process_attachments_activity_sequence(
+        self, patched, mock_blob_result, mock_ocr_response
+    ):
+        """New runs list files for OCR by reference, replayed runs download them"""
+        now = datetime.datetime.now()
+        downloaded = BlobStorageFolderResult(
+            files=[
+                BlobStorageFile(
+                    name="test.pdf",
+                    full_path="gs://test/attachments/test.pdf",
+                    relative_path="attachments/test.pdf",
+                    size=12,
+                    content_type="application/pdf",
+                    created=now,
+                    updated=now,
+                    content=b"test content",
+                )
+            ]
+        )
+
+        with patch.object(workflow, "patched", return_value=patched), patch(
+            "pantheon_v2.processes.common.accounts_payable.workflows.helpers.attachment_processor.workflow.execute_activity"
+        ) as mock_activity:
+            mock_activity.side_effect = [
+                mock_blob_result if patched else downloaded,
+                mock_ocr_response,
+            ]
+
+            result = await attachment_processor.process_attachments(
+                FetchInvoiceQueryResult(approvers=[], gcspath="gs://test/attachments")
+            )
+
+        listing_activity = mock_activity.call_args_list[0].args[0]
+        ocr_content = mock_activity.call_args_list[1].kwargs["args"][0].file_content[0]
+        if patched:
+            assert listing_activity == list_internal_blob_storage_folder
+            assert isinstance(ocr_content, BlobReference)
+        else:
+            assert listing_activity == query_internal_blob_storage_folder
+            assert ocr_content == "dGVzdCBjb250ZW50"
+        assert result[0].extracted_data == mock_ocr_response.extracted_data
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("patched", [True, False])
+    async def test_store_approval_activity_sequence(self, patched):
+        """New runs store the final status with the metadata, replayed runs apart"""
+        with patch.object(workflow, "patched", return_value=patched), patch.object(
+            workflow, "execute_activity"
+        ) as mock_activity:
+            await InvoiceApprovalWorkflow()._store_approval(
+                "inv1", {"approval_hierarchy": []}, status=INVOICE_STATUS_APPROVED
+            )
+
+        updates = [call.kwargs["args"][0].data for call in mock_activity.call_args_list]
+        metadata = '{"approval_hierarchy": []}'
+        if patched:
+            assert updates == [
+                {"metadata": metadata, "status": INVOICE_STATUS_APPROVED}
+            ]
+        else:
+            assert updates == [
+                {"metadata": metadata},
+                {"status": INVOICE_STATUS_APPROVED},
+            ]
+
 
 class TestSlackProcessor:
     @pytest.mark.asyncio
@@ -11,6 +11,7 @@ from pantheon_v2.core.modelrouter.models.models import (
 from pantheon_v2.core.modelrouter.factory import ModelRouterFactory
 import structlog
 
+from pantheon_v2.tools.common.pandas.helper import has_numeric_headers
 from pantheon_v2.processes.common.table_detection_workflow.business_logic.models import (
     ColumnMappingOutput,
     ColumnMappingInput,
@@ -24,33 +25,32 @@ from pantheon_v2.processes.common.table_detection_workflow.business_logic.consta
 logger = structlog.get_logger(__name__)
 
 
-def prepare_table_context(df_json: str, sample_rows: int = 3) -> str:
+def build_table_context(df: pd.DataFrame, sample_rows: int = 3) -> str:
     """
-    Prepare table context by including headers and sample data in a transposed format.
+    Build table context from a DataFrame by including headers and sample data in a transposed format.
     If headers are numeric (likely row numbers), use the next row as headers.
     """
-    try:
-        df = pd.read_json(df_json, orient="split")
+    if has_numeric_headers(df):
+        # Use first row as headers and rest as data
+        new_headers = df.iloc[0].tolist()
+        df = df.iloc[1:].reset_index(drop=True)
+        df.columns = new_headers
+        logger.info("Detected numeric headers, using first row as headers instead")
 
-        # Check if headers are numeric
-        headers = list(df.columns)
-        are_headers_numeric = all(
-            isinstance(h, (int, float)) or (isinstance(h, str) and h.isdigit())
-            for h in headers
-        )
+    # Get headers and sample data
+    headers = list(df.columns)
+    sample_data = df.head(sample_rows).T.to_string()
 
-        if are_headers_numeric:
-            # Use first row as headers and rest as data
-            new_headers = df.iloc[0].tolist()
-            df.columns = new_headers
-            df = df.iloc[1:].reset_index(drop=True)
-            logger.info("Detected numeric headers, using first row as headers instead")
+    return f"Headers: {headers}\nSample Data (Transposed):\n{sample_data}"
 
-        # Get headers and sample data
-        headers = list(df.columns)
-        sample_data = df.head(sample_rows).T.to_string()
 
-        return f"Headers: {headers}\nSample Data (Transposed):\n{sample_data}"
+def prepare_table_context(df_json: str, sample_rows: int = 3) -> str:
+    """
+    Prepare table context from a DataFrame serialised as JSON in split orientation.
+    """
+    try:
+        df = pd.read_json(df_json, orient="split")
+        return build_table_context(df, sample_rows)
     except Exception as e:
         logger.error("Error preparing table context", error=str(e))
         raise
@@ -102,19 +102,19 @@ async def get_column_mapping_from_llm(
     return response.parsed_response
 
 
-def apply_column_mapping(
+def normalize_columns(
     source_df: pd.DataFrame,
     mapping_result: ColumnMappingOutput,
-) -> ColumnMappingOutput:
+) -> pd.DataFrame:
     """
-    Apply the LLM-suggested column mapping to the source DataFrame.
+    Keep only the mapped source columns and rename them to their target names.
 
     Args:
         source_df: Source DataFrame to be transformed
         mapping_result: ColumnMappingOutput from LLM
 
     Returns:
-        ColumnMappingOutput containing the mapping results
+        The normalized DataFrame
     """
     # Create column mapping dictionary
     column_mapping = {
@@ -136,18 +136,78 @@ def apply_column_mapping(
             unmapped_target_columns=mapping_result.missing_columns.target,
         )
 
-    # Add the normalized DataFrame to the result
-    mapping_result.normalized_df = normalized_df.to_json(orient="split")
-
     logger.info(
         "Successfully normalized source DataFrame with mapped columns",
         num_columns=len(normalized_df.columns),
     )
 
+    return normalized_df
+
+
+def apply_column_mapping(
+    source_df: pd.DataFrame,
+    mapping_result: ColumnMappingOutput,
+) -> ColumnMappingOutput:
+    """
+    Apply the LLM-suggested column mapping to the source DataFrame.
+
+    Args:
+        source_df: Source DataFrame to be transformed
+        mapping_result: ColumnMappingOutput from LLM
+
+    Returns:
+        ColumnMappingOutput containing the mapping results
+    """
+    normalized_df = normalize_columns(source_df, mapping_result)
+
+    # Add the normalized DataFrame to the result
+    mapping_result.normalized_df = normalized_df.to_json(orient="split")
+
     # Return the ColumnMappingOutput directly
     return mapping_result
 
 
+async def map_columns(
+    source_df: pd.DataFrame,
+    target_df: pd.DataFrame,
+    sample_rows: int = 3,
+) -> tuple[ColumnMappingOutput, pd.DataFrame]:
+    """
+    Map source columns onto a target format without serialising either table.
+
+    Args:
+        source_df: Detected source table
+        target_df: Target format table
+        sample_rows: Number of sample rows to include for context
+
+    Returns:
+        The mapping suggested by the LLM and the normalized source DataFrame
+    """
+    # Prepare context for both source and target tables
+    source_context = build_table_context(source_df, sample_rows)
+    target_context = build_table_context(target_df, sample_rows)
+
+    # Check and fix numeric headers in source DataFrame
+    if has_numeric_headers(source_df):
+        new_headers = source_df.iloc[0].tolist()
+        source_df = source_df.iloc[1:].reset_index(drop=True)
+        source_df.columns = new_headers
+
+    # Get mapping suggestions from LLM
+    mapping_result = await get_column_mapping_from_llm(source_context, target_context)
+
+    logger.info(
+        "Successfully generated column mappings",
+        document_type=mapping_result.document_type,
+        confidence=mapping_result.confidence,
+        num_mapped_columns=len(mapping_result.mapped_columns)
+        if mapping_result.mapped_columns
+        else 0,
+    )
+
+    return mapping_result, normalize_columns(source_df, mapping_result)
+
+
 async def execute_column_mapping(
     input_data: Union[dict, ColumnMappingInput],
 ) -> ColumnMappingOutput:
@@ -165,45 +225,16 @@ async def execute_column_mapping(
         if isinstance(input_data, dict):
             input_data = ColumnMappingInput(**input_data)
 
-        # Load source DataFrame
         source_df = pd.read_json(input_data.source_df, orient="split")
+        target_df = pd.read_json(input_data.target_df, orient="split")
 
-        # Check and fix numeric headers in source DataFrame
-        headers = list(source_df.columns)
-        are_headers_numeric = all(
-            isinstance(h, (int, float)) or (isinstance(h, str) and h.isdigit())
-            for h in headers
-        )
-        if are_headers_numeric:
-            new_headers = source_df.iloc[0].tolist()
-            source_df.columns = new_headers
-            source_df = source_df.iloc[1:].reset_index(drop=True)
-
-        # Prepare context for both source and target tables
-        source_context = prepare_table_context(
-            input_data.source_df, input_data.sample_rows
-        )
-        target_context = prepare_table_context(
-            input_data.target_df, input_data.sample_rows
-        )
-
-        # Get mapping suggestions from LLM
-        mapping_result = await get_column_mapping_from_llm(
-            source_context, target_context
-        )
-
-        logger.info(
-            "Successfully generated column mappings",
-            document_type=mapping_result.document_type,
-            confidence=mapping_result.confidence,
-            num_mapped_columns=len(mapping_result.mapped_columns)
-            if mapping_result.mapped_columns
-            else 0,
+        mapping_result, normalized_df = await map_columns(
+            source_df, target_df, input_data.sample_rows
         )
 
-        # Apply the mapping to the DataFrame and return the ColumnMappingOutput
-        result = apply_column_mapping(source_df, mapping_result)
-        return result
+        # Add the normalized DataFrame to the result
+        mapping_result.normalized_df = normalized_df.to_json(orient="split")
+        return mapping_result
 
     except Exception as e:
         logger.error("Error executing column mapping", error=str(e))
@@ -22,3 +22,14 @@ class MetadataMode(str, Enum):
 # Template names for metadata extraction
 METADATA_TEMPLATE_TARGETED = "extract_metadata_targeted.txt"
 METADATA_TEMPLATE_ALL = "extract_metadata.txt"
+
+
+# Intermediate stages of the in-process table pipeline that can be checkpointed
+class TablePipelineStage(str, Enum):
+    CONVERTED = "converted"  # Raw file converted to a DataFrame
+    TABLES_DETECTED = "tables_detected"  # Table body split from metadata
+    COLUMNS_MAPPED = "columns_mapped"  # Columns mapped to the output format
+    METADATA_ADDED = "metadata_added"  # Extracted metadata added as columns
+
+
+DEFAULT_PREVIEW_ROWS = 50
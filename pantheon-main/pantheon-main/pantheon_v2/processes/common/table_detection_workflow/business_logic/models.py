@@ -1,7 +1,13 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
+from pantheon_v2.core.custom_data_types.pydantic import SerializableBytesIO
+from pantheon_v2.tools.core.blob_reference.models import BlobReference
+from pantheon_v2.tools.common.pandas.models import DataPreviewOutput
 from pantheon_v2.processes.common.table_detection_workflow.business_logic.constants import (
     MetadataMode,
+    TablePipelineStage,
+    DEFAULT_PREVIEW_ROWS,
+    DEFAULT_SAMPLE_ROWS,
 )
 
 
@@ -103,3 +109,58 @@ class LLMCallOutput(BaseModel):
     """Output model for LLM call function"""
 
     extracted_data: MetadataOutput
+
+
+class TablePipelineInput(BaseModel):
+    """Input model for the in-process table pipeline"""
+
+    file_content: Union[BlobReference, SerializableBytesIO] = Field(
+        ..., description="Source file content, or a reference to it"
+    )
+    file_name: str = Field(..., description="Source file name, used to pick the reader")
+    target_file_content: Optional[Union[BlobReference, SerializableBytesIO]] = Field(
+        default=None,
+        description="Output format file content for column mapping, or a reference to it",
+    )
+    target_file_name: Optional[str] = Field(
+        default=None, description="Output format file name"
+    )
+    checkpoint_stages: List[TablePipelineStage] = Field(
+        default_factory=list,
+        description="Stages whose intermediate DataFrame is returned for debugging",
+    )
+    preview_rows: int = Field(
+        default=DEFAULT_PREVIEW_ROWS, description="Number of rows in the data preview"
+    )
+    sample_rows: int = Field(
+        default=DEFAULT_SAMPLE_ROWS,
+        description="Number of sample rows to include for column mapping context",
+    )
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+class TablePipelineOutput(BaseModel):
+    """Output model for the in-process table pipeline"""
+
+    success: bool = Field(..., description="Whether a table was detected")
+    parquet_content: Optional[SerializableBytesIO] = Field(
+        default=None, description="Detected table written as Parquet"
+    )
+    column_mapping: Optional[ColumnMappingOutput] = Field(
+        default=None, description="Column mapping results if a target was provided"
+    )
+    metadata_extraction: Optional[LLMCallOutput] = Field(
+        default=None, description="Metadata extracted by LLM from the document"
+    )
+    data_preview: Optional[DataPreviewOutput] = Field(
+        default=None, description="Preview of the first rows of the table"
+    )
+    checkpoints: Dict[TablePipelineStage, str] = Field(
+        default_factory=dict,
+        description="Requested intermediate DataFrames as JSON strings in split orientation",
+    )
+
+    class Config:
+        arbitrary_types_allowed = True
@@ -0,0 +1,165 @@
+import asyncio
+from io import BytesIO
+from typing import Optional, Union
+
+import pandas as pd
+import structlog
+
+from pantheon_v2.tools.common.pandas.helper import (
+    build_data_preview,
+    convert_file_to_dataframe,
+    dataframe_to_parquet,
+)
+from pantheon_v2.tools.core.blob_reference.models import BlobReference
+from pantheon_v2.tools.core.blob_reference.resolver import read_blob_reference
+from pantheon_v2.tools.common.pandas.helpers.add_metadata_columns import (
+    add_metadata_to_df,
+)
+from pantheon_v2.tools.common.pandas.helpers.island_detection import (
+    detect_tables_and_metadata,
+)
+from pantheon_v2.processes.common.table_detection_workflow.business_logic.column_mapping_llm_call import (
+    map_columns,
+)
+from pantheon_v2.processes.common.table_detection_workflow.business_logic.extract_metadata import (
+    extract_metadata,
+)
+from pantheon_v2.processes.common.table_detection_workflow.business_logic.constants import (
+    MetadataMode,
+    TablePipelineStage,
+)
+from pantheon_v2.processes.common.table_detection_workflow.business_logic.models import (
+    LLMCallInput,
+    TablePipelineInput,
+    TablePipelineOutput,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+def _detect_table(
+    file_content, file_name: str
+) -> tuple[Optional[pd.DataFrame], Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+    """Convert the source file and split the table body from its metadata."""
+    source_df = convert_file_to_dataframe(file_content, file_name)
+    if source_df is None:
+        return None, None, None
+
+    table_df, metadata_df = detect_tables_and_metadata(source_df)
+    table_df.reset_index(drop=True, inplace=True)
+    return source_df, table_df, metadata_df
+
+
+async def run_table_pipeline(
+    input_data: Union[dict, TablePipelineInput],
+) -> TablePipelineOutput:
+    """
+    Run conversion, table detection, column mapping, metadata extraction,
+    Parquet conversion and preview generation in a single process.
+
+    DataFrames are handed from stage to stage in memory instead of being
+    serialised to JSON between activities. Intermediate frames are only
+    serialised for the stages listed in checkpoint_stages.
+
+    Args:
+        input_data: TablePipelineInput, or a dict with the same fields
+
+    Returns:
+        TablePipelineOutput containing the Parquet content, mapping, metadata and preview
+    """
+    if isinstance(input_data, dict):
+        input_data = TablePipelineInput(**input_data)
+
+    loop = asyncio.get_running_loop()
+    checkpoints = {}
+
+    file_content = input_data.file_content
+    if isinstance(file_content, BlobReference):
+        file_content = BytesIO(await read_blob_reference(file_content))
+    target_file_content = input_data.target_file_content
+    if isinstance(target_file_content, BlobReference):
+        target_file_content = BytesIO(await read_blob_reference(target_file_content))
+
+    def checkpoint(stage: TablePipelineStage, df: pd.DataFrame) -> None:
+        if stage in input_data.checkpoint_stages:
+            checkpoints[stage] = df.to_json(orient="split")
+
+    # pandas work runs off the event loop so LLM calls of other
+    # workflows are not stalled behind it
+    source_df, table_df, metadata_df = await loop.run_in_executor(
+        None, _detect_table, file_content, input_data.file_name
+    )
+    if source_df is None:
+        logger.error("Unsupported file type", file_name=input_data.file_name)
+        return TablePipelineOutput(success=False)
+    checkpoint(TablePipelineStage.CONVERTED, source_df)
+    checkpoint(TablePipelineStage.TABLES_DETECTED, table_df)
+    # The raw frame is no longer needed once tables are detected
+    del source_df
+
+    column_mapping = None
+    unmapped_target_columns = None
+    if target_file_content is not None:
+        target_df = await loop.run_in_executor(
+            None,
+            convert_file_to_dataframe,
+            target_file_content,
+            input_data.target_file_name,
+        )
+        if target_df is None:
+            raise ValueError(
+                f"Unsupported output format file: {input_data.target_file_name}"
+            )
+
+        logger.info("Executing column mapping between source and target formats")
+        column_mapping, table_df = await map_columns(
+            table_df, target_df, input_data.sample_rows
+        )
+        unmapped_target_columns = column_mapping.missing_columns.target
+        checkpoint(TablePipelineStage.COLUMNS_MAPPED, table_df)
+
+    metadata_extraction = None
+    if metadata_df is not None:
+        llm_input = LLMCallInput(
+            metadata_df=metadata_df.to_json(orient="split"),
+            mode=MetadataMode.TARGETED if unmapped_target_columns else MetadataMode.ALL,
+            target_attributes=unmapped_target_columns,
+        )
+        metadata_extraction = await extract_metadata(llm_input)
+
+        logger.info(
+            "Extracted metadata",
+            metadata=metadata_extraction.extracted_data,
+            mode=llm_input.mode,
+            target_attributes=llm_input.target_attributes,
+        )
+
+        try:
+            table_df = add_metadata_to_df(
+                table_df, metadata_extraction.extracted_data.model_dump()["data"]
+            )
+            logger.info("Successfully added metadata columns to table")
+        except Exception as e:
+            logger.error("Error adding metadata columns to DataFrame", error=str(e))
+        checkpoint(TablePipelineStage.METADATA_ADDED, table_df)
+
+    parquet_content = await loop.run_in_executor(None, dataframe_to_parquet, table_df)
+    data_preview = await loop.run_in_executor(
+        None, build_data_preview, table_df, input_data.preview_rows
+    )
+
+    logger.info(
+        "Table pipeline completed",
+        num_rows=len(table_df),
+        num_columns=len(table_df.columns),
+        checkpoints=list(checkpoints),
+    )
+
+    return TablePipelineOutput(
+        success=True,
+        parquet_content=parquet_content,
+        column_mapping=column_mapping,
+        metadata_extraction=metadata_extraction,
+        data_preview=data_preview,
+        checkpoints=checkpoints,
+    )
@@ -4,3 +4,6 @@ from pantheon_v2.settings.settings import Settings
 DEFAULT_S3_BUCKET = Settings.PANTHEON_S3_BUCKET
 DEFAULT_OUTPUT_FILE_PATH = "fileimports"
 DEFAULT_OUTPUT_FILE_EXTENSION = ".parquet"
+
+# Config flag that runs the whole table pipeline in a single activity
+FUSED_PIPELINE_CONFIG_KEY = "fused_pipeline"
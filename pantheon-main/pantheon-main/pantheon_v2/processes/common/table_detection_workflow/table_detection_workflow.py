@@ -13,6 +13,10 @@ with workflow.unsafe.imports_passed_through():
         UploadToS3Input,
     )
     from pantheon_v2.tools.external.s3.activities import download_from_s3, upload_to_s3
+    from pantheon_v2.tools.core.blob_reference.models import (
+        BlobReference,
+        BlobStorageProvider,
+    )
     from pantheon_v2.utils.s3_utils import extract_s3_info
     from pantheon_v2.utils.path_utils import sanitize_filename
 
@@ -41,6 +45,9 @@ with workflow.unsafe.imports_passed_through():
     from pantheon_v2.processes.common.table_detection_workflow.business_logic.column_mapping_llm_call import (
         execute_column_mapping,
     )
+    from pantheon_v2.processes.common.table_detection_workflow.business_logic.table_pipeline import (
+        run_table_pipeline,
+    )
     from pantheon_v2.processes.common.table_detection_workflow.business_logic.constants import (
         MetadataMode,
     )
@@ -48,12 +55,15 @@ with workflow.unsafe.imports_passed_through():
         DEFAULT_S3_BUCKET,
         DEFAULT_OUTPUT_FILE_PATH,
         DEFAULT_OUTPUT_FILE_EXTENSION,
+        FUSED_PIPELINE_CONFIG_KEY,
     )
 
     from pantheon_v2.processes.common.table_detection_workflow.business_logic.models import (
         ColumnMappingInput,
         MissingColumns,
         LLMCallInput,
+        TablePipelineInput,
+        TablePipelineOutput,
     )
     from pantheon_v2.processes.common.table_detection_workflow.models import (
         TableDetectionInput,
@@ -101,6 +111,15 @@ class TableDetectionWorkflow:
             self._validate_and_extract_file_info(input_data)
         )
 
+        # Opt-in so workflows already running keep replaying their activity history
+        if input_data.config and input_data.config.get(FUSED_PIPELINE_CONFIG_KEY):
+            return await self._run_fused_pipeline(
+                source_bucket,
+                source_filename,
+                output_format_filename,
+                output_format_bucket,
+            )
+
         # Step 2: Download and process source file
         processed_df, metadata_df = await self._process_source_file(
             source_bucket, source_filename
@@ -179,23 +198,35 @@ class TableDetectionWorkflow:
             output_format_bucket,
         )
 
-    async def _process_source_file(self, source_bucket: str, source_filename: str):
-        """Download and process the source file."""
-        source_file_content = await workflow.execute_activity(
+    async def _file_content(self, bucket_name: str, file_name: str):
+        """
+        Reference to an S3 file, resolved by the activity that reads it.
+        Executions started before references replay the separate download.
+        """
+        if workflow.patched("table-files-by-reference"):
+            return BlobReference(
+                provider=BlobStorageProvider.S3,
+                bucket_name=bucket_name,
+                key=file_name,
+            )
+
+        download = await workflow.execute_activity(
             download_from_s3,
-            args=[
-                DownloadFromS3Input(
-                    bucket_name=source_bucket, file_name=source_filename
-                )
-            ],
+            args=[DownloadFromS3Input(bucket_name=bucket_name, file_name=file_name)],
             start_to_close_timeout=timedelta(minutes=10),
         )
+        return download.content
 
+    async def _process_source_file(self, source_bucket: str, source_filename: str):
+        """Download and process the source file."""
         source_df_conversion = await workflow.execute_activity(
             convert_file_to_df,
             args=[
                 FileToPandasInput(
-                    file_content=source_file_content.content, file_name=source_filename
+                    file_content=await self._file_content(
+                        source_bucket, source_filename
+                    ),
+                    file_name=source_filename,
                 )
             ],
             start_to_close_timeout=timedelta(minutes=10),
@@ -219,22 +250,13 @@ class TableDetectionWorkflow:
         self, output_format_filename: str, processed_df, output_format_bucket: str
     ):
         """Process output format template and perform column mapping."""
-        format_file_content = await workflow.execute_activity(
-            download_from_s3,
-            args=[
-                DownloadFromS3Input(
-                    bucket_name=output_format_bucket,
-                    file_name=output_format_filename,
-                ),
-            ],
-            start_to_close_timeout=timedelta(minutes=10),
-        )
-
         target_df_conversion = await workflow.execute_activity(
             convert_file_to_df,
             args=[
                 FileToPandasInput(
-                    file_content=format_file_content.content,
+                    file_content=await self._file_content(
+                        output_format_bucket, output_format_filename
+                    ),
                     file_name=output_format_filename,
                 )
             ],
@@ -318,6 +340,73 @@ class TableDetectionWorkflow:
 
         return processed_df, metadata_extraction_result
 
+    async def _run_fused_pipeline(
+        self,
+        source_bucket: str,
+        source_filename: str,
+        output_format_filename: str | None,
+        output_format_bucket: str | None,
+    ) -> TableDetectionOutput | None:
+        """
+        Run conversion, detection, mapping, metadata extraction, Parquet conversion
+        and preview in one activity so DataFrames never leave the worker process.
+        """
+        # The pipeline downloads both files itself, so their bytes never pass
+        # through workflow history
+        pipeline_input = TablePipelineInput(
+            file_content=await self._file_content(source_bucket, source_filename),
+            file_name=source_filename,
+            target_file_content=await self._file_content(
+                output_format_bucket, output_format_filename
+            )
+            if output_format_filename
+            else None,
+            target_file_name=output_format_filename,
+        )
+        pipeline_execution = await workflow.execute_activity(
+            execute_code,
+            args=[
+                CodeExecutorConfig(timeout_seconds=600, timeout_coroutines=True),
+                ExecuteCodeParams(
+                    function=get_fqn(run_table_pipeline),
+                    args=(pipeline_input.model_dump(mode="json"),),
+                ),
+            ],
+            start_to_close_timeout=timedelta(minutes=15),
+        )
+
+        if not pipeline_execution.success:
+            logger.error("Table pipeline failed", error=pipeline_execution.error)
+            return None
+
+        pipeline_result = TablePipelineOutput.model_validate(pipeline_execution.result)
+        if not pipeline_result.success:
+            logger.error("Table detection failed")
+            return None
+
+        transformed_bucket, transformed_path = await self._upload_parquet(
+            pipeline_result.parquet_content, source_filename
+        )
+
+        preview_result = pipeline_result.data_preview
+        final_column_mapping = None
+        if pipeline_result.column_mapping is not None:
+            final_column_mapping = self._build_final_column_mapping(
+                pipeline_result.column_mapping, preview_result
+            )
+
+        return TableDetectionOutput(
+            transformed_data_bucket=transformed_bucket,
+            transformed_data_path=transformed_path,
+            column_mapping=final_column_mapping,
+            extracted_metadata=pipeline_result.metadata_extraction.extracted_data.model_dump()
+            if pipeline_result.metadata_extraction is not None
+            else None,
+            data_preview=DataPreview(
+                columns=preview_result.columns, rows=preview_result.rows
+            ),
+        )
+
     async def _convert_and_upload_data(self, processed_df, source_filename: str):
         """Convert DataFrame to Parquet and upload to S3."""
         parquet_conversion = await workflow.execute_activity(
@@ -326,6 +415,12 @@ class TableDetectionWorkflow:
             start_to_close_timeout=timedelta(minutes=1),
         )
 
+        return await self._upload_parquet(
+            parquet_conversion.parquet_content, source_filename
+        )
+
+    async def _upload_parquet(self, parquet_content, source_filename: str):
+        """Upload Parquet content to S3 under a path derived from the source file."""
         # Generate path for the transformed data using sanitized source filename
         sanitized_name = sanitize_filename(
             source_filename, DEFAULT_OUTPUT_FILE_EXTENSION
@@ -338,7 +433,7 @@ class TableDetectionWorkflow:
                 UploadToS3Input(
                     bucket_name=DEFAULT_S3_BUCKET,
                     file_name=transformed_data_path,
-                    blob=parquet_conversion.parquet_content,
+                    blob=parquet_content,
                     content_type="application/parquet",
                 ),
             ],
@@ -364,7 +459,12 @@ class TableDetectionWorkflow:
         if not output_format_filename or not column_mapping_result:
             return None
 
-        original_mapping = column_mapping_result.result
+        return self._build_final_column_mapping(
+            column_mapping_result.result, preview_result
+        )
+
+    def _build_final_column_mapping(self, original_mapping, preview_result):
+        """Recompute missing target columns against the columns in the preview."""
         final_available_columns = set(preview_result.columns)
         mapped_target_columns = {
             m.target_column for m in original_mapping.mapped_columns
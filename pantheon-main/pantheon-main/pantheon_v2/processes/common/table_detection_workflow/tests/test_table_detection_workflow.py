@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import patch, MagicMock
 import pandas as pd
+from io import BytesIO
+from temporalio import workflow as temporal_workflow
 
 from pantheon_v2.processes.common.table_detection_workflow.table_detection_workflow import (
     TableDetectionWorkflow,
@@ -27,10 +29,19 @@ from pantheon_v2.processes.common.table_detection_workflow.business_logic.models
     MissingColumns,
     LLMCallOutput,
     MetadataOutput,
+    TablePipelineOutput,
 )
 
 
 class TestTableDetectionWorkflow:
+    @pytest.fixture(autouse=True)
+    def workflow_patched(self):
+        """Run the current code paths, tests of replayed paths override this"""
+        with patch.object(
+            temporal_workflow, "patched", return_value=True
+        ) as mock_patched:
+            yield mock_patched
+
     @pytest.fixture
     def workflow(self):
         return TableDetectionWorkflow()
@@ -294,6 +305,105 @@ class TestTableDetectionWorkflow:
         assert result.extracted_metadata == {"data": {"key": "value"}}
         assert result.data_preview.columns == ["col1", "col2"]
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "patched, expected_activities",
+        [
+            # Files are passed by reference, the pipeline downloads them itself
+            (True, ["execute_code", "upload_to_s3"]),
+            # Executions started before references replay both downloads
+            (
+                False,
+                [
+                    "download_from_s3",
+                    "download_from_s3",
+                    "execute_code",
+                    "upload_to_s3",
+                ],
+            ),
+        ],
+    )
+    async def test_table_detection_workflow_fused_pipeline(
+        self,
+        workflow,
+        mock_s3_content,
+        workflow_patched,
+        patched,
+        expected_activities,
+    ):
+        """Test the fused path runs the table pipeline in a single activity"""
+        workflow_patched.return_value = patched
+        pipeline_output = TablePipelineOutput(
+            success=True,
+            parquet_content=BytesIO(b"mock parquet content"),
+            column_mapping=ColumnMappingOutput(
+                mapped_columns=[
+                    {
+                        "source_column": "col1",
+                        "target_column": "target_col1",
+                        "confidence": 0.95,
+                        "mapping_reason": "Exact match",
+                    }
+                ],
+                missing_columns=MissingColumns(source=[], target=["target_col2"]),
+                document_type="test",
+                confidence=0.9,
+            ),
+            metadata_extraction=LLMCallOutput(
+                extracted_data=MetadataOutput(data={"key": "value"})
+            ),
+            data_preview=DataPreviewOutput(
+                columns=["target_col1"], rows=[{"target_col1": "1"}]
+            ),
+        )
+        called_activities = []
+
+        def mock_activity_response(*args, **kwargs):
+            called_activities.append(args[0].__name__)
+            if args[0].__name__ == "download_from_s3":
+                return DownloadFromS3Output(content=mock_s3_content)
+            elif args[0].__name__ == "execute_code":
+                params = kwargs["args"][1]
+                assert params.function.endswith("run_table_pipeline")
+                # Only the fused pipeline bounds its coroutine by the config
+                assert kwargs["args"][0].timeout_coroutines is True
+                pipeline_input = params.args[0]
+                if patched:
+                    assert (
+                        pipeline_input["file_content"]["bucket_name"] == "test-bucket"
+                    )
+                    assert pipeline_input["target_file_content"]["key"] == "format.csv"
+                return MagicMock(
+                    success=True, result=pipeline_output.model_dump(mode="json")
+                )
+            elif args[0].__name__ == "upload_to_s3":
+                return UploadToS3Output(
+                    s3_url="s3://bucket/path/file.parquet",
+                    https_url="https://bucket.s3.amazonaws.com/path/file.parquet",
+                    metadata={"content-type": "application/parquet"},
+                )
+            return None
+
+        with patch(
+            "pantheon_v2.processes.common.table_detection_workflow.table_detection_workflow.workflow.execute_activity",
+            side_effect=mock_activity_response,
+        ):
+            result = await workflow.run(
+                TableDetectionInput(
+                    source_bucket="test-bucket",
+                    source_file_path="test.csv",
+                    output_format_bucket="format-bucket",
+                    output_format_path="format.csv",
+                    config={"fused_pipeline": True},
+                )
+            )
+
+        assert called_activities == expected_activities
+        assert result.transformed_data_path == "path/file.parquet"
+        assert result.extracted_metadata == {"data": {"key": "value"}}
+        assert result.column_mapping.missing_columns.target == ["target_col2"]
+        assert result.data_preview.columns == ["target_col1"]
+
     @pytest.mark.asyncio
     async def test_table_detection_workflow_validation_error(self, workflow):
         """Test workflow input validation"""
@@ -0,0 +1,130 @@
+import pytest
+from io import BytesIO
+from unittest.mock import AsyncMock, patch
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from pantheon_v2.processes.common.table_detection_workflow.business_logic.constants import (
+    MetadataMode,
+    TablePipelineStage,
+)
+from pantheon_v2.processes.common.table_detection_workflow.business_logic.models import (
+    ColumnMappingOutput,
+    LLMCallOutput,
+    MetadataOutput,
+    MissingColumns,
+    TablePipelineInput,
+)
+from pantheon_v2.processes.common.table_detection_workflow.business_logic.table_pipeline import (
+    run_table_pipeline,
+)
+
+MODULE = "pantheon_v2.processes.common.table_detection_workflow.business_logic.table_pipeline"
+
+
+@pytest.fixture
+def source_csv():
+    return BytesIO(
+        b"Invoice Report,,\n"
+        b"Vendor: Acme,,\n"
+        b",,\n"
+        b"Date,Amount,Reference\n"
+        b"2023-01-01,10.5,A1\n"
+        b"2023-01-02,20,A2\n"
+    )
+
+
+@pytest.fixture
+def target_csv():
+    return BytesIO(b"invoice_date,amount,vendor\n")
+
+
+@pytest.fixture
+def mapping_output():
+    return ColumnMappingOutput(
+        mapped_columns=[
+            {
+                "source_column": "Date",
+                "target_column": "invoice_date",
+                "confidence": 0.9,
+                "mapping_reason": "Same meaning",
+            },
+            {
+                "source_column": "Amount",
+                "target_column": "amount",
+                "confidence": 0.9,
+                "mapping_reason": "Same name",
+            },
+        ],
+        missing_columns=MissingColumns(source=["Reference"], target=["vendor"]),
+        document_type="Invoice",
+        confidence=0.8,
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_table_pipeline_end_to_end(source_csv, target_csv, mapping_output):
+    """Every stage runs in process and only requested checkpoints are serialised"""
+    extract = AsyncMock(
+        return_value=LLMCallOutput(
+            extracted_data=MetadataOutput(data={"vendor": "Acme"})
+        )
+    )
+    with patch(
+        "pantheon_v2.processes.common.table_detection_workflow.business_logic.column_mapping_llm_call.get_column_mapping_from_llm",
+        AsyncMock(return_value=mapping_output),
+    ), patch(f"{MODULE}.extract_metadata", extract):
+        result = await run_table_pipeline(
+            TablePipelineInput(
+                file_content=source_csv,
+                file_name="source.csv",
+                target_file_content=target_csv,
+                target_file_name="format.csv",
+                checkpoint_stages=[TablePipelineStage.COLUMNS_MAPPED],
+            ).model_dump(mode="json")
+        )
+
+    assert result.success
+    assert list(result.checkpoints) == [TablePipelineStage.COLUMNS_MAPPED]
+    assert result.column_mapping.missing_columns.target == ["vendor"]
+    assert result.metadata_extraction.extracted_data.data == {"vendor": "Acme"}
+
+    llm_input = extract.call_args.args[0]
+    assert llm_input.mode == MetadataMode.TARGETED
+    assert llm_input.target_attributes == ["vendor"]
+
+    table = pq.read_table(result.parquet_content).to_pandas()
+    assert set(table.columns) == {"invoice_date", "amount", "vendor"}
+    assert table["amount"].tolist() == [10.5, 20.0]
+    assert table["vendor"].tolist() == ["Acme", "Acme"]
+    assert set(result.data_preview.columns) == {"invoice_date", "amount", "vendor"}
+    assert len(result.data_preview.rows) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_table_pipeline_without_target_or_metadata():
+    """A plain table skips mapping and metadata extraction"""
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    content = BytesIO(df.to_csv(index=False).encode())
+
+    with patch(f"{MODULE}.extract_metadata", AsyncMock()) as extract:
+        result = await run_table_pipeline(
+            TablePipelineInput(file_content=content, file_name="plain.csv")
+        )
+
+    extract.assert_not_called()
+    assert result.success
+    assert result.column_mapping is None
+    assert result.checkpoints == {}
+    assert pq.read_table(result.parquet_content).num_rows == 2
+
+
+@pytest.mark.asyncio
+async def test_run_table_pipeline_unsupported_file():
+    result = await run_table_pipeline(
+        TablePipelineInput(file_content=BytesIO(b"data"), file_name="file.txt")
+    )
+
+    assert not result.success
+    assert result.parquet_content is None
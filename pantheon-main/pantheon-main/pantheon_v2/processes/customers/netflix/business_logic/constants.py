@@ -0,0 +1,7 @@
+QUERY_SELECT_VENDOR_NAMES = "SELECT id, name FROM zampapagentvendors"
+
+# The vendor name index is rebuilt from the table once it is this old
+VENDOR_INDEX_REFRESH_SECONDS = 300
+
+# Trigram similarity a vendor name needs to be accepted without an exact match
+VENDOR_NAME_MIN_SIMILARITY = 0.8
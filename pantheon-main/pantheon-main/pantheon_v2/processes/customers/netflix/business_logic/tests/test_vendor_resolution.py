@@ -0,0 +1,43 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pantheon_v2.processes.customers.netflix.business_logic import vendor_resolution
+from pantheon_v2.processes.customers.netflix.models.contract_extraction_models import (
+    Vendor,
+)
+from pantheon_v2.tools.core.internal_data_repository.models import (
+    RelationalQueryResult,
+)
+
+
+@pytest.fixture
+def repository():
+    tool = AsyncMock()
+    tool.query_relational_data.return_value = RelationalQueryResult(
+        data=[
+            Vendor(id="1", name="Night School Studio"),
+            Vendor(id="2", name="Boss Fight Entertainment, Inc."),
+        ],
+        row_count=2,
+    )
+    with (
+        patch.object(vendor_resolution, "_vendor_index", None),
+        patch.object(
+            vendor_resolution.ToolRegistry,
+            "get_tool_instance",
+            AsyncMock(return_value=tool),
+        ),
+    ):
+        yield tool
+
+
+@pytest.mark.asyncio
+async def test_resolve_vendor_id_matches_normalised_names(repository):
+    assert (
+        await vendor_resolution.resolve_vendor_id("boss fight entertainment inc") == "2"
+    )
+    assert await vendor_resolution.resolve_vendor_id("Night School Studios") == "1"
+    assert await vendor_resolution.resolve_vendor_id("Unknown Vendor") == ""
+    # The vendor table is read once for all lookups
+    assert repository.query_relational_data.await_count == 1
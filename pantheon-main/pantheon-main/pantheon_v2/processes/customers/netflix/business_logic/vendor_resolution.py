@@ -0,0 +1,81 @@
+import asyncio
+import time
+from typing import Optional
+
+import structlog
+
+from pantheon_v2.processes.customers.netflix.business_logic.constants import (
+    QUERY_SELECT_VENDOR_NAMES,
+    VENDOR_INDEX_REFRESH_SECONDS,
+    VENDOR_NAME_MIN_SIMILARITY,
+)
+from pantheon_v2.processes.customers.netflix.models.contract_extraction_models import (
+    Vendor,
+)
+from pantheon_v2.tools.core.internal_data_repository.models import (
+    RelationalQueryParams,
+)
+from pantheon_v2.tools.core.internal_data_repository.tool import (
+    InternalDataRepositoryTool,
+)
+from pantheon_v2.tools.core.tool_registry import ToolRegistry
+from pantheon_v2.utils.name_index import NameIndex
+
+logger = structlog.get_logger(__name__)
+
+_vendor_index: Optional[NameIndex] = None
+_vendor_index_loaded_at = 0.0
+_vendor_index_lock = asyncio.Lock()
+
+
+async def _load_vendor_index() -> NameIndex:
+    tool = await ToolRegistry.get_tool_instance(InternalDataRepositoryTool)
+    result = await tool.query_relational_data(
+        RelationalQueryParams(
+            query=QUERY_SELECT_VENDOR_NAMES,
+            parameters={},
+            output_model=Vendor,
+            trusted_schema=True,
+        )
+    )
+    return NameIndex((vendor.id, vendor.name) for vendor in result.data)
+
+
+async def get_vendor_index() -> NameIndex:
+    """Process-wide vendor name index, rebuilt every VENDOR_INDEX_REFRESH_SECONDS"""
+    global _vendor_index, _vendor_index_loaded_at
+
+    async with _vendor_index_lock:
+        now = time.monotonic()
+        if (
+            _vendor_index is None
+            or now - _vendor_index_loaded_at >= VENDOR_INDEX_REFRESH_SECONDS
+        ):
+            _vendor_index = await _load_vendor_index()
+            _vendor_index_loaded_at = now
+            logger.info("Loaded vendor name index", vendors=len(_vendor_index))
+        return _vendor_index
+
+
+async def resolve_vendor_id(vendor_name: str) -> str:
+    """
+    Id of the vendor matching vendor_name, or an empty string.
+
+    Names are compared ignoring case, spaces and punctuation. Without such a
+    match the closest vendor by trigram similarity is taken if it reaches
+    VENDOR_NAME_MIN_SIMILARITY.
+    """
+    index = await get_vendor_index()
+    match = index.best_match(vendor_name, VENDOR_NAME_MIN_SIMILARITY)
+    if match is None:
+        logger.info("No vendor matched", vendor_name=vendor_name)
+        return ""
+
+    if match.similarity < 1.0:
+        logger.info(
+            "Matched vendor by similarity",
+            vendor_name=vendor_name,
+            matched_name=match.name,
+            similarity=round(match.similarity, 3),
+        )
+    return match.id
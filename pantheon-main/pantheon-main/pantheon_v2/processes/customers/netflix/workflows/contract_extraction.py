@@ -39,6 +39,15 @@ with workflow.unsafe.imports_passed_through():
         update_internal_relational_data,
         query_internal_blob_storage,
     )
+    from pantheon_v2.tools.core.blob_reference.models import BlobReference
+
+    from pantheon_v2.tools.common.code_executor.config import CodeExecutorConfig
+    from pantheon_v2.tools.common.code_executor.models import ExecuteCodeParams
+    from pantheon_v2.tools.common.code_executor.activities import execute_code
+    from pantheon_v2.utils.type_utils import get_fqn
+    from pantheon_v2.processes.customers.netflix.business_logic.vendor_resolution import (
+        resolve_vendor_id,
+    )
 
     from pantheon_v2.tools.common.pdf_parser.config import PDFParserConfig
     from pantheon_v2.tools.common.pdf_parser.models import ParsePDFParams
@@ -54,6 +63,10 @@ with workflow.unsafe.imports_passed_through():
 
 T = TypeVar("T", bound=BaseModel)
 
+VENDOR_TABLE = "zampapagentvendors"
+# Vendors change rarely, repeated names are answered from the query cache
+VENDOR_LOOKUP_CACHE_TTL_SECONDS = 300
+
 
 @WorkflowRegistry.register_workflow_defn(
     "Workflow that extracts contract data of games from a PDF",
@@ -200,6 +213,30 @@ class NetflixContractExtractionWorkflow:
         )
 
     async def _get_vendor_id(self, vendor_name: str):
+        # Executions started before the name index replay the database lookup
+        if not workflow.patched("vendor-name-index"):
+            return await self._query_vendor_id(vendor_name)
+
+        # Resolved against an in-memory normalised name index on the worker
+        # instead of normalising every vendor row in the database
+        vendor_resolution = await workflow.execute_activity(
+            execute_code,
+            args=[
+                CodeExecutorConfig(timeout_seconds=60),
+                ExecuteCodeParams(
+                    function=get_fqn(resolve_vendor_id), args=(vendor_name,)
+                ),
+            ],
+            start_to_close_timeout=timedelta(minutes=10),
+        )
+
+        if not vendor_resolution.success:
+            raise ValueError(
+                f"Failed to resolve vendor {vendor_name}: {vendor_resolution.error}"
+            )
+        return vendor_resolution.result
+
+    async def _query_vendor_id(self, vendor_name: str):
         cleaned_vendor_name = "".join(e.lower() for e in vendor_name if e.isalnum())
         vendor_search_result = await workflow.execute_activity(
             query_internal_relational_data,
@@ -208,6 +245,8 @@ class NetflixContractExtractionWorkflow:
                     query="SELECT id, name FROM zampapagentvendors WHERE REGEXP_REPLACE(LOWER(name), '[^a-z0-9]', '', 'g') = :cleaned_name",
                     parameters={"cleaned_name": cleaned_vendor_name},
                     output_model=Vendor,
+                    cache_ttl_seconds=VENDOR_LOOKUP_CACHE_TTL_SECONDS,
+                    cache_tables=[VENDOR_TABLE],
                 )
             ],
             start_to_close_timeout=timedelta(minutes=10),
@@ -215,15 +254,17 @@ class NetflixContractExtractionWorkflow:
 
         return vendor_search_result.data[0].id if vendor_search_result.data else ""
 
-    async def _extract_game_details(
-        self,
-        input_data: NetflixContractExtractionWorkflowInputParams,
-        output_model: Type[BaseModel],
-        additional_prompt="",
-    ) -> BaseModel:
+    async def _contract_pdf_content(
+        self, input_data: NetflixContractExtractionWorkflowInputParams
+    ):
+        # The parser downloads the PDF itself, so its bytes never pass
+        # through workflow history
+        if workflow.patched("contract-pdf-by-reference"):
+            return BlobReference.from_uri(input_data.gcs_path)
+
+        # Executions started before references replay the separate download
         gcs_path = input_data.gcs_path.replace("gs://", "")
         bucket_name, file_name = gcs_path.split("/", 1)
-
         gcs_response = await workflow.execute_activity(
             query_internal_blob_storage,
             BlobStorageQueryParams(
@@ -232,15 +273,20 @@ class NetflixContractExtractionWorkflow:
             ),
             start_to_close_timeout=timedelta(minutes=10),
         )
+        return gcs_response.content
 
-        pdf_content = gcs_response.content
-
+    async def _extract_game_details(
+        self,
+        input_data: NetflixContractExtractionWorkflowInputParams,
+        output_model: Type[BaseModel],
+        additional_prompt="",
+    ) -> BaseModel:
         parsed_pdf_response = await workflow.execute_activity(
             parse_pdf,
             args=[
                 PDFParserConfig(),
                 ParsePDFParams(
-                    pdf_content=pdf_content,
+                    pdf_content=await self._contract_pdf_content(input_data),
                     extract_tables=False,
                 ),
             ],
@@ -22,8 +22,12 @@ from pantheon_v2.tools.core.internal_data_repository.models import (
 from pantheon_v2.tools.common.contract_data_extracter.models import (
     ContractDataExtracterOutput,
 )
+from pantheon_v2.tools.common.code_executor.activities import execute_code
+from pantheon_v2.tools.common.code_executor.models import ExecutionResult
 
 from unittest.mock import patch
+from temporalio import workflow as temporal_workflow
+from pantheon_v2.tools.core.blob_reference.models import BlobReference
 
 
 class TestContractExtractionWorkflow:
@@ -38,6 +42,9 @@ class TestContractExtractionWorkflow:
             if args and args[0] == query_internal_blob_storage:
                 return BlobStorageQueryResult(content=b"mock pdf content", metadata={})
 
+            if args and args[0] == execute_code:
+                return ExecutionResult(success=True, result="1", execution_time=0)
+
             if args and args[0] == query_internal_relational_data:
                 return RelationalQueryResult(
                     data=[Vendor(id="1", name="test")], row_count=1
@@ -64,7 +71,7 @@ class TestContractExtractionWorkflow:
             )
 
         # Mock both execute_activity and wait_for_all
-        with patch(
+        with patch.object(temporal_workflow, "patched", return_value=True), patch(
             "pantheon_v2.processes.customers.netflix.workflows.contract_extraction.workflow.execute_activity",
             side_effect=mock_activity_response,
         ):
@@ -80,3 +87,51 @@ class TestContractExtractionWorkflow:
                 )
 
             assert result is not None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("patched", [True, False])
+    async def test_contract_pdf_content(self, patched):
+        """New runs pass a reference, replayed runs keep the download activity"""
+        workflow = NetflixContractExtractionWorkflow()
+        input_data = NetflixContractExtractionWorkflowInputParams(
+            file_id="123",
+            gcs_path="gs://pantheon-contracts/netflix/contract.pdf",
+        )
+
+        with patch.object(temporal_workflow, "patched", return_value=patched), patch(
+            "pantheon_v2.processes.customers.netflix.workflows.contract_extraction.workflow.execute_activity",
+            return_value=BlobStorageQueryResult(content=b"pdf", metadata={}),
+        ) as mock_activity:
+            content = await workflow._contract_pdf_content(input_data)
+
+        if patched:
+            assert isinstance(content, BlobReference)
+            assert content.key == "netflix/contract.pdf"
+            mock_activity.assert_not_called()
+        else:
+            assert content == b"pdf"
+            assert mock_activity.call_args.args[0] == query_internal_blob_storage
+            assert mock_activity.call_args.args[1].file_name == "netflix/contract.pdf"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("patched", [True, False])
+    async def test_get_vendor_id(self, patched):
+        """New runs resolve through the name index, replayed runs query the table"""
+        workflow = NetflixContractExtractionWorkflow()
+
+        with patch.object(temporal_workflow, "patched", return_value=patched), patch(
+            "pantheon_v2.processes.customers.netflix.workflows.contract_extraction.workflow.execute_activity",
+            return_value=ExecutionResult(success=True, result="1", execution_time=0)
+            if patched
+            else RelationalQueryResult(data=[Vendor(id="1", name="test")], row_count=1),
+        ) as mock_activity:
+            vendor_id = await workflow._get_vendor_id("Test, Inc.")
+
+        assert vendor_id == "1"
+        if patched:
+            assert mock_activity.call_args.args[0] == execute_code
+        else:
+            assert mock_activity.call_args.args[0] == query_internal_relational_data
+            query_params = mock_activity.call_args.kwargs["args"][0]
+            assert query_params.parameters == {"cleaned_name": "testinc"}
+            assert query_params.cache_tables == ["zampapagentvendors"]
@@ -7,6 +7,9 @@ EMAIL_SEARCH_CONFIG = {
 VENDOR_BY_EMAIL_QUERY = """
     SELECT id FROM zampapagentvendors WHERE email = :email;
 """
+VENDOR_TABLE = "zampapagentvendors"
+# Vendors change rarely, repeated senders are answered from the query cache
+VENDOR_LOOKUP_CACHE_TTL_SECONDS = 300
 
 ZAMPAPAGENTEMAILS = "zampapagentemails"
 
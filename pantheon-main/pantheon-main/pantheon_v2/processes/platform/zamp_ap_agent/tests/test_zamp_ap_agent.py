@@ -20,6 +20,14 @@ from pantheon_v2.tools.external.gmail.models import (
 from pantheon_v2.tools.core.internal_data_repository.models import (
     RelationalQueryResult,
     BlobStorageUploadResult,
+    BlobStorageBulkUploadItem,
+    BlobStorageBulkUploadResult,
+    RelationalRowUpdate,
+)
+from pantheon_v2.tools.core.internal_data_repository.activities import (
+    batch_update_internal_relational_data,
+    update_internal_relational_data,
+    upload_internal_blob_storage,
 )
 from pantheon_v2.processes.platform.zamp_ap_agent.models.models import (
     ProcessedEmailQueryResult,
@@ -34,6 +42,13 @@ from pantheon_v2.tools.common.email_parser.models import (
 )
 
 
+@pytest.fixture(autouse=True)
+def workflow_patched():
+    """Run the current code paths, tests of replayed paths override this"""
+    with patch.object(workflow, "patched", return_value=True) as mock_patched:
+        yield mock_patched
+
+
 @pytest.fixture
 def workflow_instance():
     with patch.object(
@@ -214,15 +229,91 @@ class TestZampAPAgentWorkflow:
             workflow_instance, "_process_single_email"
         ) as mock_process_single:
             mock_activity.return_value = mock_unprocessed_emails
+            email_update = RelationalRowUpdate(
+                data={"status": STATUS_PROCESSED}, where={"message_id": "email1"}
+            )
+            mock_process_single.return_value = email_update
 
             await workflow_instance._process_and_store_email_content(["email1"])
 
-            # Verify activity was called to fetch unprocessed emails
-            mock_activity.assert_called_once()
+            # Verify one activity fetched the emails and one updated them all
+            assert mock_activity.call_count == 2
+            assert mock_activity.call_args_list[1].args[0] == (
+                batch_update_internal_relational_data
+            )
+            batch_params = mock_activity.call_args_list[1].kwargs["args"][0]
+            assert batch_params.updates == [email_update]
 
             # Verify _process_single_email was called for each unprocessed email
             mock_process_single.assert_called_once_with(mock_unprocessed_emails.data[0])
 
+    @pytest.mark.asyncio
+    async def test_process_and_store_email_content_marks_emails_before_failure(
+        self, workflow_instance, mock_unprocessed_emails
+    ):
+        """Emails processed before a failure are still updated"""
+        email_update = RelationalRowUpdate(
+            data={"status": STATUS_PROCESSED}, where={"message_id": "email1"}
+        )
+        mock_unprocessed_emails.data = mock_unprocessed_emails.data * 2
+        with patch(
+            "pantheon_v2.processes.platform.zamp_ap_agent.zamp_ap_agent.workflow.execute_activity"
+        ) as mock_activity, patch.object(
+            workflow_instance,
+            "_process_single_email",
+            side_effect=[email_update, ValueError("boom")],
+        ):
+            mock_activity.return_value = mock_unprocessed_emails
+
+            with pytest.raises(ValueError, match="boom"):
+                await workflow_instance._process_and_store_email_content(["email1"])
+
+            batch_params = mock_activity.call_args_list[1].kwargs["args"][0]
+            assert batch_params.updates == [email_update]
+
+    @pytest.mark.asyncio
+    async def test_process_and_store_email_content_replays_single_updates(
+        self, workflow_instance, mock_unprocessed_emails, workflow_patched
+    ):
+        """Executions started before batched updates update each email in turn"""
+        workflow_patched.return_value = False
+        email_updates = [
+            RelationalRowUpdate(
+                data={"status": STATUS_PROCESSED}, where={"message_id": message_id}
+            )
+            for message_id in ["email1", "email2"]
+        ]
+        mock_unprocessed_emails.data = mock_unprocessed_emails.data * 2
+        calls = []
+
+        async def process_single_email(unprocessed_email):
+            calls.append("process")
+            return email_updates[calls.count("process") - 1]
+
+        async def execute_activity(activity, *args, **kwargs):
+            calls.append(activity)
+            return mock_unprocessed_emails
+
+        with patch(
+            "pantheon_v2.processes.platform.zamp_ap_agent.zamp_ap_agent.workflow.execute_activity",
+            side_effect=execute_activity,
+        ) as mock_activity, patch.object(
+            workflow_instance, "_process_single_email", side_effect=process_single_email
+        ):
+            await workflow_instance._process_and_store_email_content(["email1"])
+
+        # Each email is updated right after it is processed
+        assert calls[1:] == [
+            "process",
+            update_internal_relational_data,
+            "process",
+            update_internal_relational_data,
+        ]
+        assert [
+            call.kwargs["args"][0].where for call in mock_activity.call_args_list[1:]
+        ] == [{"message_id": "email1"}, {"message_id": "email2"}]
+        workflow_patched.assert_called_once_with("batch-email-status-updates")
+
     @pytest.mark.asyncio
     async def test_fetch_and_store_eml(self, workflow_instance):
         """Test fetching and storing EML content"""
@@ -252,6 +343,92 @@ class TestZampAPAgentWorkflow:
             assert result_data == eml_data
             assert result_folder == "emails/msg1"
 
+    @pytest.mark.asyncio
+    async def test_store_attachments_in_one_activity(self, workflow_instance):
+        """All attachments of an email are uploaded by a single activity"""
+        attachments = [
+            Attachment(
+                filename=name,
+                content=b"content" if name != "empty.pdf" else None,
+                content_type="application/pdf",
+                size=7,
+            )
+            for name in ["a.pdf", "b.pdf", "empty.pdf"]
+        ]
+
+        with patch(
+            "pantheon_v2.processes.platform.zamp_ap_agent.zamp_ap_agent.workflow.execute_activity"
+        ) as mock_activity:
+            mock_activity.return_value = BlobStorageBulkUploadResult(
+                results=[
+                    BlobStorageBulkUploadItem(file_name=name, success=True)
+                    for name in ["a.pdf", "b.pdf"]
+                ]
+            )
+
+            await workflow_instance._store_attachments(attachments, "emails/msg1")
+
+            mock_activity.assert_called_once()
+            upload_params = mock_activity.call_args.kwargs["args"][0]
+            assert [file.file_name for file in upload_params.files] == [
+                "emails/msg1/attachments/a.pdf",
+                "emails/msg1/attachments/b.pdf",
+            ]
+
+    @pytest.mark.asyncio
+    async def test_store_attachments_replays_single_uploads(
+        self, workflow_instance, workflow_patched
+    ):
+        """Executions started before bulk uploads keep one activity per file"""
+        workflow_patched.return_value = False
+        attachments = [
+            Attachment(
+                filename=name,
+                content=b"content",
+                content_type="application/pdf",
+                size=7,
+            )
+            for name in ["a.pdf", "b.pdf"]
+        ]
+
+        with patch(
+            "pantheon_v2.processes.platform.zamp_ap_agent.zamp_ap_agent.workflow.execute_activity"
+        ) as mock_activity:
+            await workflow_instance._store_attachments(attachments, "emails/msg1")
+
+            assert [call.args[0] for call in mock_activity.call_args_list] == [
+                upload_internal_blob_storage,
+                upload_internal_blob_storage,
+            ]
+            workflow_patched.assert_called_once_with("bulk-attachment-upload")
+
+    @pytest.mark.asyncio
+    async def test_store_attachments_raises_on_failed_upload(self, workflow_instance):
+        attachments = [
+            Attachment(
+                filename="a.pdf",
+                content=b"content",
+                content_type="application/pdf",
+                size=7,
+            )
+        ]
+
+        with patch(
+            "pantheon_v2.processes.platform.zamp_ap_agent.zamp_ap_agent.workflow.execute_activity"
+        ) as mock_activity:
+            mock_activity.return_value = BlobStorageBulkUploadResult(
+                results=[
+                    BlobStorageBulkUploadItem(
+                        file_name="emails/msg1/attachments/a.pdf",
+                        success=False,
+                        error="Forbidden",
+                    )
+                ]
+            )
+
+            with pytest.raises(ValueError, match="a.pdf"):
+                await workflow_instance._store_attachments(attachments, "emails/msg1")
+
     @pytest.mark.asyncio
     async def test_handle_vendor_and_invoice(
         self, workflow_instance, mock_parsed_email, mock_vendor_result
@@ -278,7 +455,7 @@ class TestZampAPAgentWorkflow:
                 name="Test Vendor", email="vendor@example.com"
             )
 
-            await workflow_instance._handle_vendor_and_invoice(
+            result = await workflow_instance._handle_vendor_and_invoice(
                 "msg1", mock_parsed_email, "emails/msg1"
             )
 
@@ -290,13 +467,12 @@ class TestZampAPAgentWorkflow:
                 "vendor1", "emails/msg1/attachments"
             )
 
-            # Verify email status was updated to PROCESSED
+            # Verify email status update to PROCESSED is returned for the batch
             mock_build_params.assert_called_once_with(
                 "msg1", "gs://ap-agent-emails-bucket/emails/msg1", STATUS_PROCESSED
             )
-
-            # Verify update activity was called
-            mock_activity.assert_called_once()
+            assert result is mock_build_params.return_value
+            mock_activity.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_handle_vendor_not_found(self, workflow_instance, mock_parsed_email):
@@ -322,20 +498,19 @@ class TestZampAPAgentWorkflow:
                 name="Unknown Vendor", email="unknown@example.com"
             )
 
-            await workflow_instance._handle_vendor_and_invoice(
+            result = await workflow_instance._handle_vendor_and_invoice(
                 "msg1", mock_parsed_email, "emails/msg1"
             )
 
             # Verify vendor was checked
             mock_get_vendor.assert_called_once_with("unknown@example.com")
 
-            # Verify email status was updated to UNPROCESSED for non-whitelisted vendor
+            # Verify email status update to UNPROCESSED is returned for the batch
             mock_build_params.assert_called_once_with(
                 "msg1", "gs://ap-agent-emails-bucket/emails/msg1", STATUS_UNPROCESSED
             )
-
-            # Verify update activity was called
-            mock_activity.assert_called_once()
+            assert result is mock_build_params.return_value
+            mock_activity.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_workflow(self, workflow_instance, mock_gmail_response):
@@ -18,13 +18,18 @@ with workflow.unsafe.imports_passed_through():
         RelationalQueryParams,
         RelationalInsertParams,
         RelationalUpdateParams,
+        RelationalBatchUpdateParams,
+        RelationalRowUpdate,
         BlobStorageUploadParams,
+        BlobStorageBulkUploadParams,
     )
     from pantheon_v2.tools.core.internal_data_repository.activities import (
         query_internal_relational_data,
         insert_internal_relational_data,
         update_internal_relational_data,
+        batch_update_internal_relational_data,
         upload_internal_blob_storage,
+        bulk_upload_internal_blob_storage,
     )
     from pantheon_v2.tools.common.code_executor.activities import execute_code
     from pantheon_v2.processes.platform.zamp_ap_agent.constants.constants import (
@@ -32,6 +37,8 @@ with workflow.unsafe.imports_passed_through():
         STATUS_UNPROCESSED,
         STATUS_PROCESSED,
         VENDOR_BY_EMAIL_QUERY,
+        VENDOR_TABLE,
+        VENDOR_LOOKUP_CACHE_TTL_SECONDS,
         QUERY_SELECT_MESSAGE_IDS,
         QUERY_SELECT_EMAILS_BY_IDS_AND_STATUS,
         EMAIL_SEARCH_CONFIG,
@@ -125,6 +132,7 @@ class ZampAPAgentWorkflow:
                     query=QUERY_SELECT_MESSAGE_IDS,
                     parameters={"message_ids": message_ids},
                     output_model=ProcessedEmailQueryResult,
+                    trusted_schema=True,
                 )
             ],
             start_to_close_timeout=datetime.timedelta(seconds=30),
@@ -175,10 +183,53 @@ class ZampAPAgentWorkflow:
         return unprocessed_emails_ids
 
     async def _process_and_store_email_content(self, email_uuids: List[str]):
-        """Fetch and process unprocessed emails"""
+        """Fetch and process unprocessed emails, then record their status in one batch"""
         unprocessed_emails = await self._fetch_unprocessed_emails(email_uuids)
-        for unprocessed_email in unprocessed_emails.data:
-            await self._process_single_email(unprocessed_email)
+
+        # Executions started before batched updates replay one update per email
+        if not workflow.patched("batch-email-status-updates"):
+            for unprocessed_email in unprocessed_emails.data:
+                email_update = await self._process_single_email(unprocessed_email)
+                await self._update_email_status(email_update)
+            return
+
+        email_updates: List[RelationalRowUpdate] = []
+        try:
+            for unprocessed_email in unprocessed_emails.data:
+                email_updates.append(
+                    await self._process_single_email(unprocessed_email)
+                )
+        finally:
+            # Emails handled before a failure are still marked, so they are
+            # not picked up again on the next run
+            await self._update_email_statuses(email_updates)
+
+    async def _update_email_status(self, email_update: RelationalRowUpdate):
+        await workflow.execute_activity(
+            update_internal_relational_data,
+            args=[
+                RelationalUpdateParams(
+                    table=ZAMPAPAGENTEMAILS,
+                    data=email_update.data,
+                    where=email_update.where,
+                )
+            ],
+            start_to_close_timeout=datetime.timedelta(seconds=30),
+        )
+
+    async def _update_email_statuses(self, email_updates: List[RelationalRowUpdate]):
+        if not email_updates:
+            return
+
+        await workflow.execute_activity(
+            batch_update_internal_relational_data,
+            args=[
+                RelationalBatchUpdateParams(
+                    table=ZAMPAPAGENTEMAILS, updates=email_updates
+                )
+            ],
+            start_to_close_timeout=datetime.timedelta(seconds=60),
+        )
 
     async def _fetch_unprocessed_emails(self, email_uuids: List[str]):
         """Fetch emails that need processing"""
@@ -196,11 +247,13 @@ class ZampAPAgentWorkflow:
 
     async def _process_single_email(
         self, unprocessed_email: EmailByIdAndStatusQueryResult
-    ):
+    ) -> RelationalRowUpdate:
         """Process a single email through the following steps:
         1. Fetch and store EML content
         2. Parse email and upload attachments
         3. Check vendor and process invoice if whitelisted
+
+        Returns the status update for the email record.
         """
         message_id = unprocessed_email.message_id
 
@@ -211,7 +264,9 @@ class ZampAPAgentWorkflow:
         parsed_email = await self._parse_and_store_attachments(eml_data, base_folder)
 
         # Step 3: Process vendor and invoice
-        await self._handle_vendor_and_invoice(message_id, parsed_email, base_folder)
+        return await self._handle_vendor_and_invoice(
+            message_id, parsed_email, base_folder
+        )
 
     async def _fetch_and_store_eml(self, message_id: str) -> Tuple[bytes, str]:
         """Fetch EML content and store it in GCS"""
@@ -261,27 +316,48 @@ class ZampAPAgentWorkflow:
         return parsed_email
 
     async def _store_attachments(self, attachments: List[Attachment], base_folder: str):
-        """Store email attachments in GCS"""
+        """Store email attachments in GCS with a single activity"""
         attachments_folder = f"{base_folder}/attachments"
-        for attachment in attachments:
-            if attachment.content and attachment.filename:
-                attachment_buffer = BytesIO(attachment.content)
+        files = [
+            BlobStorageUploadParams(
+                bucket_name=Settings.AP_AGENT_EMAILS_BUCKET,
+                file_name=f"{attachments_folder}/{attachment.filename}",
+                blob=BytesIO(attachment.content),
+            )
+            for attachment in attachments
+            if attachment.content and attachment.filename
+        ]
+        if not files:
+            return
+
+        # Executions started before bulk uploads replay one upload per attachment
+        if not workflow.patched("bulk-attachment-upload"):
+            for file in files:
                 await workflow.execute_activity(
                     upload_internal_blob_storage,
-                    args=[
-                        BlobStorageUploadParams(
-                            bucket_name=Settings.AP_AGENT_EMAILS_BUCKET,
-                            file_name=f"{attachments_folder}/{attachment.filename}",
-                            blob=attachment_buffer,
-                        )
-                    ],
+                    args=[file],
                     start_to_close_timeout=datetime.timedelta(minutes=5),
                 )
+            return
+
+        result = await workflow.execute_activity(
+            bulk_upload_internal_blob_storage,
+            args=[BlobStorageBulkUploadParams(files=files)],
+            start_to_close_timeout=datetime.timedelta(minutes=5),
+        )
+
+        if result.failed:
+            raise ValueError(
+                f"Failed to upload attachments: {[item.file_name for item in result.failed]}"
+            )
 
     async def _handle_vendor_and_invoice(
         self, message_id: str, parsed_email: ParsedEmail, base_folder: str
-    ):
-        """Check vendor status and handle invoice creation if whitelisted"""
+    ) -> RelationalRowUpdate:
+        """Check vendor status and handle invoice creation if whitelisted
+
+        Returns the status update for the email record, applied by the caller.
+        """
         gcs_path = f"gs://{Settings.AP_AGENT_EMAILS_BUCKET}/{base_folder}"
         vendor_result = await self._get_vendor_by_email(parsed_email.from_.email)
 
@@ -289,24 +365,16 @@ class ZampAPAgentWorkflow:
             await self._create_invoice_and_workflow(
                 vendor_result.data[0].id, f"{base_folder}/attachments"
             )
-            update_params = self._build_email_update_params(
+            return self._build_email_update_params(
                 message_id, gcs_path, STATUS_PROCESSED
             )
-        else:
-            logger.info(
-                "Skipping invoice creation for non-whitelisted vendor email",
-                sender=parsed_email.from_,
-                message_id=message_id,
-            )
-            update_params = self._build_email_update_params(
-                message_id, gcs_path, STATUS_UNPROCESSED
-            )
 
-        await workflow.execute_activity(
-            update_internal_relational_data,
-            args=[update_params],
-            start_to_close_timeout=datetime.timedelta(seconds=30),
+        logger.info(
+            "Skipping invoice creation for non-whitelisted vendor email",
+            sender=parsed_email.from_,
+            message_id=message_id,
         )
+        return self._build_email_update_params(message_id, gcs_path, STATUS_UNPROCESSED)
 
     async def _get_vendor_by_email(self, email: str):
         """Check if sender is a whitelisted vendor"""
@@ -317,6 +385,8 @@ class ZampAPAgentWorkflow:
                     query=VENDOR_BY_EMAIL_QUERY,
                     parameters={"email": email},
                     output_model=VendorByEmailQueryResult,
+                    cache_ttl_seconds=VENDOR_LOOKUP_CACHE_TTL_SECONDS,
+                    cache_tables=[VENDOR_TABLE],
                 )
             ],
             start_to_close_timeout=datetime.timedelta(seconds=30),
@@ -357,10 +427,9 @@ class ZampAPAgentWorkflow:
 
     def _build_email_update_params(
         self, message_id: str, gcs_path: str, status: str
-    ) -> RelationalUpdateParams:
+    ) -> RelationalRowUpdate:
         """Build update parameters for email record"""
-        return RelationalUpdateParams(
-            table=ZAMPAPAGENTEMAILS,
+        return RelationalRowUpdate(
             data={"storage_path": gcs_path, "status": status},
             where={"message_id": message_id},
         )
@@ -50,6 +50,25 @@ class Settings:
     AWS_REGION: str = os.environ.get("AWS_REGION", "")
     PANTHEON_S3_BUCKET: str = os.environ.get("PANTHEON_S3_BUCKET", "")
 
+    # Local cache for GCS and S3 downloads, disabled when no directory is set
+    BLOB_CACHE_DIR: str = os.environ.get("BLOB_CACHE_DIR", "")
+    BLOB_CACHE_MAX_BYTES: int = int(
+        os.environ.get("BLOB_CACHE_MAX_BYTES", 2 * 1024 * 1024 * 1024)
+    )
+
+    # Database instrumentation, statements slower than the threshold are logged
+    DB_SLOW_QUERY_THRESHOLD_MS: int = int(
+        os.environ.get("DB_SLOW_QUERY_THRESHOLD_MS", 1000)
+    )
+    DB_METRICS_LOG_INTERVAL_SECONDS: int = int(
+        os.environ.get("DB_METRICS_LOG_INTERVAL_SECONDS", 300)
+    )
+
+    # Entries kept by the read-through cache of internal relational lookups
+    RELATIONAL_CACHE_MAX_ENTRIES: int = int(
+        os.environ.get("RELATIONAL_CACHE_MAX_ENTRIES", 1024)
+    )
+
     @staticmethod
     def is_cloud() -> bool:
         """
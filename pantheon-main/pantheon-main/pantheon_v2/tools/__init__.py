@@ -7,9 +7,13 @@ from pantheon_v2.tools.core.internal_data_repository.activities import (
     query_internal_relational_data,
     insert_internal_relational_data,
     update_internal_relational_data,
+    batch_update_internal_relational_data,
     query_internal_blob_storage,
     query_internal_blob_storage_folder,
+    list_internal_blob_storage_folder,
+    query_internal_blob_storage_files,
     upload_internal_blob_storage,
+    bulk_upload_internal_blob_storage,
 )
 from pantheon_v2.tools.external.snowflake.activities import (
     query_snowflake_data,
@@ -26,10 +30,14 @@ from pantheon_v2.tools.common.pandas.activities import (
     df_to_parquet,
     generate_data_preview,
 )
-from pantheon_v2.tools.external.gcs.activities import download_from_gcs
+from pantheon_v2.tools.external.gcs.activities import (
+    download_from_gcs,
+    bulk_upload_to_gcs,
+)
 from pantheon_v2.tools.external.s3.activities import (
     download_from_s3,
     upload_to_s3,
+    bulk_upload_to_s3,
     download_folder_from_s3,
 )
 
@@ -58,9 +66,13 @@ exposed_activities = [
     query_internal_relational_data,
     insert_internal_relational_data,
     update_internal_relational_data,
+    batch_update_internal_relational_data,
     query_internal_blob_storage,
     query_internal_blob_storage_folder,
+    list_internal_blob_storage_folder,
+    query_internal_blob_storage_files,
     upload_internal_blob_storage,
+    bulk_upload_internal_blob_storage,
     # Snowflake Tool
     query_snowflake_data,
     insert_snowflake_data,
@@ -70,6 +82,7 @@ exposed_activities = [
     send_slack_message,
     # GCS Tool
     download_from_gcs,
+    bulk_upload_to_gcs,
     # Pandas Tool
     convert_file_to_df,
     detect_tables_and_metadata,
@@ -80,6 +93,7 @@ exposed_activities = [
     # S3 Tool
     download_from_s3,
     upload_to_s3,
+    bulk_upload_to_s3,
     download_folder_from_s3,
     # OCR Tool
     extract_ocr_data,
@@ -6,3 +6,8 @@ class CodeExecutorConfig(BaseModel):
         default=30,
         description="Maximum execution time allowed for functions in seconds",
     )
+    timeout_coroutines: bool = Field(
+        default=False,
+        description="Also cancel coroutine functions after timeout_seconds, "
+        "otherwise only the activity timeout bounds them",
+    )
@@ -23,6 +23,7 @@ def tool():
     tool = CodeExecutorTool(config={})
     tool.config = MagicMock()
     tool.config.timeout_seconds = 2
+    tool.config.timeout_coroutines = False
     return tool
 
 
@@ -130,6 +131,47 @@ class TestCodeExecutorActions:
         finally:
             await tool.cleanup()
 
+    async def test_execute_async_function_timeout(self, tool):
+        """Coroutine functions are cancelled after the timeout when opted in"""
+        tool.config.timeout_seconds = 0.1
+        tool.config.timeout_coroutines = True
+        cancelled = asyncio.Event()
+
+        async def slow_async_function():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        params = ExecuteCodeParams(function=slow_async_function)
+
+        try:
+            result = await tool.execute_code(params)
+            assert result.success is False
+            assert "timed out" in result.error
+            assert result.execution_time < 5
+            assert cancelled.is_set()
+        finally:
+            await tool.cleanup()
+
+    async def test_execute_async_function_outlasting_timeout(self, tool):
+        """Coroutine functions are not cut off unless the caller opts in"""
+        tool.config.timeout_seconds = 0.1
+
+        async def slow_async_function():
+            await asyncio.sleep(0.3)
+            return BasicResult(value="done")
+
+        params = ExecuteCodeParams(function=slow_async_function)
+
+        try:
+            result = await tool.execute_code(params)
+            assert result.success is True
+            assert result.result.value == "done"
+        finally:
+            await tool.cleanup()
+
     async def test_cleanup_called(self, tool):
         """Test that cleanup is called and thread pool is shut down"""
 
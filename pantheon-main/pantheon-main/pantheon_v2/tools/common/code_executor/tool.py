@@ -50,7 +50,13 @@ class CodeExecutorTool(BaseTool):
                 raise ValueError("Provided function is not callable")
 
             if asyncio.iscoroutinefunction(params.function):
-                result = await params.function(*params.args, **params.kwargs)
+                coroutine = params.function(*params.args, **params.kwargs)
+                # Opt-in, existing async callers rely on the activity timeout
+                if self.config.timeout_coroutines:
+                    coroutine = asyncio.wait_for(
+                        coroutine, timeout=self.config.timeout_seconds
+                    )
+                result = await coroutine
             else:
                 # Execute the function in a thread pool with timeout
                 loop = asyncio.get_event_loop()
@@ -1,7 +1,8 @@
 from pydantic import BaseModel, Field
-from typing import List, Type
+from typing import List, Type, Union
 from enum import Enum
 from pantheon_v2.core.common.generic_base_model import GenericBaseModel
+from pantheon_v2.tools.core.blob_reference.models import BlobReference
 
 
 class FileContent(BaseModel):
@@ -17,7 +18,8 @@ class ExtractionType(str, Enum):
 
 
 class OCRExtractInput(BaseModel):
-    file_content: List[str]  # Array of Base64 encoded file contents
+    # Base64 encoded file contents, or references the tool downloads itself
+    file_content: List[Union[BlobReference, str]]
     extract_dto: Type[BaseModel] = None  # Change to accept the class type
     extraction_type: ExtractionType = None
 
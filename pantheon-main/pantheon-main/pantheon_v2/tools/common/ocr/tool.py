@@ -1,8 +1,11 @@
+import base64
 import structlog
 
 from pantheon_v2.core.modelrouter.constants.constants import SupportedLLMModels
 from pantheon_v2.core.modelrouter.models.models import GenerationRequest
 from pantheon_v2.tools.core.base import BaseTool
+from pantheon_v2.tools.core.blob_reference.models import BlobReference
+from pantheon_v2.tools.core.blob_reference.resolver import read_blob_reference
 from pantheon_v2.tools.core.tool_registry import ToolRegistry
 from pantheon_v2.tools.common.ocr.models import (
     OCRExtractInput,
@@ -102,6 +105,8 @@ class OCRTool(BaseTool):
             # Process files
             page_limit = 100  # Default page limit
             for file in params.file_content:
+                if isinstance(file, BlobReference):
+                    file = base64.b64encode(await read_blob_reference(file)).decode()
                 file_type = infer_file_type(file)
                 file_content = self._process_file_content(file, file_type, page_limit)
                 if file_content.content_type == "text":
@@ -2,8 +2,21 @@ import pandas as pd
 from bs4 import BeautifulSoup
 from io import BytesIO, StringIO
 import csv
-from .models import FileBytes, DataFrameModel
-import polars as pl
+import importlib.util
+from concurrent.futures import Executor
+from typing import Any, List, Optional, Tuple
+from .models import FileBytes, DataFrameModel, DataPreviewOutput
+from .helpers.type_inference import infer_column_types
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+# calamine (Rust) parses workbooks several times faster than openpyxl and skips
+# styles/formulas entirely. python-calamine is a declared dependency, the
+# openpyxl/xlrd fallback only covers environments built without it.
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
+
+DEFAULT_PARQUET_BATCH_SIZE = 64 * 1024
 
 
 def html_table_to_dataframe(file_bytes: FileBytes) -> DataFrameModel:
@@ -101,31 +114,84 @@ def attempt_fix_malformed_csv(file_bytes: BytesIO) -> pd.DataFrame:
         raise ValueError(f"Failed to process malformed CSV: {str(e)}")
 
 
-def process_excel_file(file_bytes: BytesIO, file_extension: str) -> pd.DataFrame:
+def get_excel_engine(file_extension: str) -> str:
+    """
+    Pick the fastest available pandas engine for the given Excel extension.
+
+    Args:
+        file_extension (str): The file extension ('.xls' or '.xlsx').
+
+    Returns:
+        str: The pandas engine name.
+
+    Raises:
+        ValueError: If the extension is not an Excel extension.
+    """
+    if file_extension.endswith("xlsx"):
+        return "calamine" if CALAMINE_AVAILABLE else "openpyxl"
+    elif file_extension.endswith("xls"):
+        return "calamine" if CALAMINE_AVAILABLE else "xlrd"
+    raise ValueError(f"Unsupported Excel file extension: {file_extension}")
+
+
+def _read_excel_sheet(content: bytes, sheet_name: str, engine: str) -> pd.DataFrame:
+    # Each worker gets its own buffer so sheets can be parsed concurrently
+    return pd.read_excel(
+        BytesIO(content), sheet_name=sheet_name, header=None, engine=engine
+    )
+
+
+def process_excel_file(
+    file_bytes: BytesIO,
+    file_extension: str,
+    sheet_names: Optional[List[str]] = None,
+    executor: Optional[Executor] = None,
+) -> pd.DataFrame:
     """
     Process Excel files (XLS or XLSX) and return a DataFrame.
     If multiple sheets are present, they are vertically stacked.
 
+    Workbooks are opened with the calamine engine when available (openpyxl is
+    already used in read-only, values-only mode by pandas). When an executor is
+    given and the calamine engine is in use, sheets are parsed in parallel.
+
     Args:
         file_bytes (io.BytesIO): The file content as bytes.
         file_extension (str): The file extension ('.xls' or '.xlsx').
+        sheet_names (Optional[List[str]]): Sheets to load. All sheets are loaded if None.
+        executor (Optional[Executor]): Executor used to parse sheets in parallel.
 
     Returns:
         pd.DataFrame: The processed DataFrame.
     """
     try:
-        if file_extension.endswith("xlsx"):
-            excel_file = pd.ExcelFile(file_bytes, engine="openpyxl")
-        elif file_extension.endswith("xls"):
-            excel_file = pd.ExcelFile(file_bytes, engine="xlrd")
+        engine = get_excel_engine(file_extension)
+        excel_file = pd.ExcelFile(file_bytes, engine=engine)
+
+        selected_sheets = excel_file.sheet_names
+        if sheet_names is not None:
+            selected_sheets = [
+                sheet for sheet in excel_file.sheet_names if sheet in sheet_names
+            ]
+            if not selected_sheets:
+                raise ValueError(
+                    f"None of the requested sheets {sheet_names} found in workbook"
+                )
+
+        # Read the selected sheets and concatenate them vertically
+        if executor is not None and engine == "calamine" and len(selected_sheets) > 1:
+            content = file_bytes.getvalue()
+            dfs = list(
+                executor.map(
+                    lambda sheet_name: _read_excel_sheet(content, sheet_name, engine),
+                    selected_sheets,
+                )
+            )
         else:
-            raise ValueError(f"Unsupported Excel file extension: {file_extension}")
-
-        # Read all sheets and concatenate them vertically
-        dfs = []
-        for sheet_name in excel_file.sheet_names:
-            sheet_df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
-            dfs.append(sheet_df)
+            dfs = []
+            for sheet_name in selected_sheets:
+                sheet_df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
+                dfs.append(sheet_df)
 
         df = pd.concat(dfs, axis=0, ignore_index=True)
         return df
@@ -162,31 +228,185 @@ def process_excel_file(file_bytes: BytesIO, file_extension: str) -> pd.DataFrame
             raise ValueError(f"Unable to process file. Excel error: {excel_error}")
 
 
-def process_parquet_file(file_bytes: BytesIO) -> pd.DataFrame:
+def _build_parquet_scanner(
+    file_bytes: BytesIO,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    batch_size: int = DEFAULT_PARQUET_BATCH_SIZE,
+) -> ds.Scanner:
+    fragment = ds.ParquetFileFormat().make_fragment(
+        pa.BufferReader(file_bytes.getvalue())
+    )
+    # Row groups whose statistics cannot satisfy the filter are never decoded
+    return ds.Scanner.from_fragment(
+        fragment,
+        columns=columns,
+        filter=pq.filters_to_expression(filters) if filters else None,
+        batch_size=batch_size,
+    )
+
+
+def process_parquet_file(
+    file_bytes: BytesIO,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    batch_size: int = DEFAULT_PARQUET_BATCH_SIZE,
+) -> pd.DataFrame:
     """
     Process a Parquet file and return a DataFrame.
-    First scans the parquet file using Polars LazyFrame to avoid memory consumption,
-    fetches the first 10 rows, then converts to a Pandas DataFrame.
+    Streams every row group through a pyarrow scanner, applying column projection
+    and predicate pushdown, and converts to Pandas once all batches are read.
+    Table detection needs the whole frame, so there is no batch-wise variant;
+    Arrow buffers are instead released column by column during the conversion
+    so the data is not held twice.
 
     Args:
         file_bytes (io.BytesIO): The file content as bytes.
+        columns (Optional[List[str]]): Columns to read. All columns are read if None.
+        filters (Optional[List[Tuple[str, str, Any]]]): Row filters in pyarrow DNF
+            form, e.g. [("amount", ">", 0)], pushed down to row-group statistics.
+        batch_size (int): Maximum number of rows decoded per batch.
 
     Returns:
-        pd.DataFrame: The processed DataFrame (first 10 rows).
+        pd.DataFrame: The processed DataFrame.
 
     Raises:
         ValueError: If unable to process the parquet file.
     """
     try:
-        # Use scan_parquet which returns a LazyFrame for better memory efficiency
-        lazy_df = pl.scan_parquet(file_bytes)
+        scanner = _build_parquet_scanner(file_bytes, columns, filters, batch_size)
+        table = pa.Table.from_batches(
+            list(scanner.to_batches()), schema=scanner.projected_schema
+        )
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+    except Exception as e:
+        raise ValueError(f"Unable to process parquet file: {str(e)}")
 
-        # Limit to first 10 rows and collect results
-        pl_df = lazy_df.limit(10).collect()
 
-        # Convert Polars DataFrame to Pandas DataFrame
-        df = pl_df.to_pandas()
+def convert_file_to_dataframe(
+    file_content: BytesIO,
+    file_name: str,
+    sheet_names: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    executor: Optional[Executor] = None,
+) -> Optional[pd.DataFrame]:
+    """
+    Convert an Excel, CSV or Parquet file to a DataFrame based on its extension.
 
-        return df
-    except Exception as e:
-        raise ValueError(f"Unable to process parquet file: {str(e)}")
+    Args:
+        file_content (io.BytesIO): The file content as bytes.
+        file_name (str): The file name, used to pick the reader.
+        sheet_names (Optional[List[str]]): Excel sheets to load.
+        columns (Optional[List[str]]): Parquet columns to read.
+        filters (Optional[List[Tuple[str, str, Any]]]): Parquet row filters.
+        executor (Optional[Executor]): Executor used to parse Excel sheets in parallel.
+
+    Returns:
+        Optional[pd.DataFrame]: The DataFrame, or None if the file type is unsupported.
+    """
+    if file_name.endswith((".xlsx", ".xls")):
+        return process_excel_file(
+            file_content,
+            file_name[-4:],
+            sheet_names=sheet_names,
+            executor=executor,
+        )
+    elif file_name.endswith(".csv"):
+        # Use the flexible_csv_parser for CSV files
+        return flexible_csv_parser(FileBytes(file_bytes=file_content)).df
+    elif file_name.endswith(".parquet"):
+        return process_parquet_file(file_content, columns=columns, filters=filters)
+    return None
+
+
+def has_numeric_headers(df: pd.DataFrame) -> bool:
+    """Numeric headers mean the first row of the table holds the real headers."""
+    return all(
+        isinstance(h, (int, float)) or (isinstance(h, str) and h.isdigit())
+        for h in df.columns
+    )
+
+
+def dataframe_to_parquet(
+    df: pd.DataFrame,
+    infer_types: bool = True,
+    categorical_threshold: float = 0.5,
+    compression: Optional[str] = "zstd",
+    row_group_size: Optional[int] = None,
+    write_statistics: bool = True,
+) -> BytesIO:
+    """
+    Write a detected table to Parquet, optionally inferring column types first.
+
+    Args:
+        df (pd.DataFrame): The table to write.
+        infer_types (bool): Infer numeric, date and categorical column types.
+        categorical_threshold (float): Maximum unique/non-null ratio for categoricals.
+        compression (Optional[str]): Parquet compression codec.
+        row_group_size (Optional[int]): Maximum rows per row group.
+        write_statistics (bool): Whether to write column statistics.
+
+    Returns:
+        io.BytesIO: The Parquet content, positioned at the start.
+    """
+    if infer_types:
+        # If headers are numeric, use first row as headers so the
+        # remaining rows can be typed
+        if has_numeric_headers(df) and len(df) > 0:
+            new_headers = [str(h) for h in df.iloc[0].tolist()]
+            # Parquet rejects duplicate column names, keep positional ones then
+            if len(set(new_headers)) == len(new_headers):
+                df = df.iloc[1:].reset_index(drop=True)
+                df.columns = new_headers
+
+        df = infer_column_types(df, categorical_threshold)
+
+    parquet_buffer = BytesIO()
+    df.to_parquet(
+        parquet_buffer,
+        index=False,
+        compression=compression,
+        row_group_size=row_group_size,
+        write_statistics=write_statistics,
+    )
+    parquet_buffer.seek(0)
+    return parquet_buffer
+
+
+def build_data_preview(df: pd.DataFrame, num_rows: int) -> DataPreviewOutput:
+    """
+    Build a string preview of the first num_rows rows of a table.
+    Only the preview rows (plus a header row if needed) are converted.
+
+    Args:
+        df (pd.DataFrame): The table to preview.
+        num_rows (int): Number of rows to preview.
+
+    Returns:
+        DataPreviewOutput: The preview columns and rows.
+    """
+    are_headers_numeric = has_numeric_headers(df)
+    header_offset = 1 if are_headers_numeric else 0
+    df = df.iloc[: num_rows + header_offset]
+
+    # If headers are numeric, use first row as headers
+    if are_headers_numeric:
+        # Get the first row values
+        new_headers = df.iloc[0].values.tolist()
+        # Remove the first row since it's now headers
+        df = df.iloc[1:].reset_index(drop=True)
+        # Update column names
+        df.columns = new_headers
+
+    # Convert the preview columns to string type
+    df = df.astype(str)
+
+    # Convert DataFrame to records and ensure all keys are strings
+    preview_rows = []
+    for row in df.to_dict(orient="records"):
+        # Create a new dict with string keys
+        string_row = {str(k): v for k, v in row.items()}
+        preview_rows.append(string_row)
+
+    return DataPreviewOutput(columns=list(df.columns), rows=preview_rows)
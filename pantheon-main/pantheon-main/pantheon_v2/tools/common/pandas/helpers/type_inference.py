@@ -0,0 +1,118 @@
+import re
+
+import pandas as pd
+
+# float64 holds 15 significant decimal digits exactly, longer numbers such as
+# account numbers would silently lose digits
+MAX_SIGNIFICANT_DIGITS = 15
+
+_LEADING_ZERO_RE = re.compile(r"^[+-]?0\d")
+_NON_DIGIT_RE = re.compile(r"\D")
+# ISO 8601 dates with separators, bare digit strings like 20230102 or 2023 are
+# more often identifiers or years than dates
+_ISO_DATE_RE = re.compile(
+    r"^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?"
+)
+
+
+def _is_blank(series: pd.Series) -> pd.Series:
+    """Mask of null or whitespace-only cells."""
+    return series.isna() | (series.astype(str).str.strip() == "")
+
+
+def _is_identifier_like(value) -> bool:
+    """
+    True for numbers that must keep their exact text, such as codes with
+    leading zeros (0012345) or more digits than float64 can hold.
+    """
+    if isinstance(value, int):
+        return abs(value) >= 10**MAX_SIGNIFICANT_DIGITS
+    if not isinstance(value, str):
+        return False
+
+    text = value.strip()
+    if _LEADING_ZERO_RE.match(text):
+        return True
+    mantissa = text.lower().split("e", 1)[0]
+    significant = _NON_DIGIT_RE.sub("", mantissa).lstrip("0")
+    return len(significant) > MAX_SIGNIFICANT_DIGITS
+
+
+def _try_numeric(series: pd.Series, blank: pd.Series) -> pd.Series | None:
+    """
+    Convert to a numeric dtype if every non-blank cell parses as a number and
+    none of them is identifier-like.
+    """
+    values = series[~blank]
+    if values.empty or values.map(_is_identifier_like).any():
+        return None
+    converted = pd.to_numeric(values, errors="coerce")
+    if converted.isna().any():
+        return None
+    return pd.to_numeric(series.where(~blank), errors="coerce")
+
+
+def _try_datetime(series: pd.Series, blank: pd.Series) -> pd.Series | None:
+    """
+    Convert to datetime if every non-blank cell is an ISO 8601 date written
+    with separators (2023-01-02). Locale-dependent formats such as 01/02/2023
+    and bare digits such as 20230102 are left as strings on purpose.
+    """
+    values = series[~blank]
+    if (
+        values.empty
+        or not values.map(
+            lambda v: isinstance(v, str) and _ISO_DATE_RE.match(v.strip()) is not None
+        ).all()
+    ):
+        return None
+    converted = pd.to_datetime(values, errors="coerce", format="ISO8601")
+    if converted.isna().any():
+        return None
+    return pd.to_datetime(series.where(~blank), errors="coerce", format="ISO8601")
+
+
+def _to_nullable_string(series: pd.Series) -> pd.Series:
+    """Cast mixed object cells to strings while keeping nulls as nulls."""
+    return series.where(series.isna(), series.astype(str))
+
+
+def infer_column_types(
+    df: pd.DataFrame, categorical_threshold: float = 0.5
+) -> pd.DataFrame:
+    """
+    Infer column types for a detected table before it is written out.
+
+    Object columns are converted, in order of preference, to numeric, ISO 8601
+    datetime, or string. Numbers with leading zeros or more than 15 significant
+    digits are kept as strings so identifiers are not altered. String columns whose distinct-value ratio is at or below
+    categorical_threshold become categoricals, which Parquet stores dictionary
+    encoded. Columns that already have a concrete dtype are left untouched.
+
+    :param df: DataFrame produced by table detection.
+    :param categorical_threshold: Maximum unique/non-null ratio for categoricals.
+    :return: A new DataFrame with inferred column types.
+    """
+    result = df.copy()
+
+    for column in result.columns:
+        series = result[column]
+        if series.dtype != object:
+            continue
+
+        blank = _is_blank(series)
+
+        converted = _try_numeric(series, blank)
+        if converted is None:
+            converted = _try_datetime(series, blank)
+        if converted is not None:
+            result[column] = converted
+            continue
+
+        series = _to_nullable_string(series)
+        non_null = series.count()
+        if non_null and series.nunique() / non_null <= categorical_threshold:
+            series = series.astype("category")
+        result[column] = series
+
+    return result
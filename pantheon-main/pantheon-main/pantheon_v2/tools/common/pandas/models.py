@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple, Union
 from pantheon_v2.core.custom_data_types.pydantic import SerializableBytesIO
+from pantheon_v2.tools.core.blob_reference.models import BlobReference
 import pandas as pd
 from io import BytesIO
 
@@ -34,10 +35,21 @@ class DataFrameInfo(BaseModel):
 
 
 class FileToPandasInput(BaseModel):
-    file_content: SerializableBytesIO = Field(
-        ..., description="File content as BytesIO object"
+    file_content: Union[BlobReference, SerializableBytesIO] = Field(
+        ..., description="File content as BytesIO object, or a reference to it"
     )
     file_name: str = Field(..., description="File name")
+    sheet_names: Optional[List[str]] = Field(
+        None,
+        description="Excel sheets to load before concatenation. All sheets are loaded if None",
+    )
+    columns: Optional[List[str]] = Field(
+        None, description="Parquet columns to read. All columns are read if None"
+    )
+    filters: Optional[List[Tuple[str, str, Any]]] = Field(
+        None,
+        description="Parquet row filters in (column, op, value) form, pushed down to row groups",
+    )
 
     class Config:
         arbitrary_types_allowed = True
@@ -128,6 +140,9 @@ class DFToCSVInput(BaseModel):
     file_content: str = Field(
         ..., description="DataFrame content as JSON string in split orientation"
     )
+    chunk_size: int = Field(
+        default=10000, gt=0, description="Number of rows written to the CSV per chunk"
+    )
 
 
 class DFToCSVOutput(BaseModel):
@@ -144,6 +159,25 @@ class DFToParquetInput(BaseModel):
     file_content: str = Field(
         ..., description="DataFrame content as JSON string in split orientation"
     )
+    infer_types: bool = Field(
+        default=True,
+        description="Infer numeric, date and categorical column types before writing",
+    )
+    categorical_threshold: float = Field(
+        default=0.5,
+        description="Maximum unique/non-null ratio for a string column to be stored as categorical",
+    )
+    compression: Optional[str] = Field(
+        default="zstd",
+        description="Parquet compression codec (e.g. zstd, snappy, gzip) or None",
+    )
+    row_group_size: Optional[int] = Field(
+        default=None,
+        description="Maximum rows per Parquet row group. Uses the pyarrow default if None",
+    )
+    write_statistics: bool = Field(
+        default=True, description="Whether to write column statistics"
+    )
 
 
 class DFToParquetOutput(BaseModel):
@@ -1,5 +1,6 @@
 import pytest
 import pandas as pd
+import pyarrow.parquet as pq
 from io import BytesIO
 
 from pantheon_v2.tools.common.pandas.activities import (
@@ -253,6 +254,32 @@ async def test_df_to_csv_numeric_headers():
     assert "Value1,Value2" in csv_content
 
 
+@pytest.mark.asyncio
+async def test_df_to_csv_chunked_matches_single_pass():
+    df = pd.DataFrame({"Col1": range(25), "Col2": [1.5, None, "x", "y", "z"] * 5})
+    input_json = df.to_json(orient="split")
+
+    chunked = await df_to_csv(DFToCSVInput(file_content=input_json, chunk_size=7))
+    single = await df_to_csv(DFToCSVInput(file_content=input_json))
+
+    assert chunked.success is True
+    chunked_content = chunked.csv_content.getvalue().decode("utf-8")
+    assert chunked_content == single.csv_content.getvalue().decode("utf-8")
+    assert chunked_content.count("Col1,Col2") == 1
+    assert len(chunked_content.splitlines()) == 26
+
+
+@pytest.mark.asyncio
+async def test_df_to_csv_empty_frame_writes_header():
+    df = pd.DataFrame({"Col1": [], "Col2": []})
+    input_params = DFToCSVInput(file_content=df.to_json(orient="split"))
+
+    result = await df_to_csv(input_params)
+
+    assert result.success is True
+    assert result.csv_content.getvalue().decode("utf-8").strip() == "Col1,Col2"
+
+
 @pytest.mark.asyncio
 async def test_df_to_csv_error():
     # Test with invalid JSON
@@ -288,6 +315,35 @@ async def test_df_to_parquet():
     pd.testing.assert_frame_equal(df_result, df)
 
 
+@pytest.mark.asyncio
+async def test_df_to_parquet_typed_output():
+    # Detected tables carry numeric headers with the header row as data
+    df = pd.DataFrame(
+        {
+            0: ["Date", "2023-01-01", "2023-01-02", "2023-01-03"],
+            1: ["Amount", "10.5", "20", "30"],
+            2: ["Currency", "USD", "USD", "USD"],
+        }
+    )
+    input_params = DFToParquetInput(
+        file_content=df.to_json(orient="split"), compression="gzip"
+    )
+
+    result = await df_to_parquet(input_params)
+    assert result.success is True
+
+    parquet_file = pq.ParquetFile(result.parquet_content)
+    schema = parquet_file.schema_arrow
+    assert schema.names == ["Date", "Amount", "Currency"]
+    assert str(schema.field("Date").type).startswith("timestamp")
+    assert str(schema.field("Amount").type) == "double"
+    assert str(schema.field("Currency").type).startswith("dictionary")
+
+    column_metadata = parquet_file.metadata.row_group(0).column(1)
+    assert column_metadata.compression == "GZIP"
+    assert column_metadata.statistics.has_min_max
+
+
 @pytest.mark.asyncio
 async def test_df_to_parquet_error():
     # Test with invalid JSON
@@ -346,6 +402,27 @@ async def test_generate_data_preview_string_headers():
     assert result.rows[0]["Col2"] == "Value3"
 
 
+@pytest.mark.asyncio
+async def test_generate_data_preview_only_converts_preview_rows(monkeypatch):
+    df = pd.DataFrame({0: ["Header1"] + list(range(1000))})
+    input_params = DataPreviewInput(df_json=df.to_json(orient="split"), num_rows=5)
+
+    converted_lengths = []
+    original_astype = pd.DataFrame.astype
+
+    def tracking_astype(self, *args, **kwargs):
+        converted_lengths.append(len(self))
+        return original_astype(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "astype", tracking_astype)
+
+    result = await generate_data_preview(input_params)
+
+    assert result.columns == ["Header1"]
+    assert [row["Header1"] for row in result.rows] == ["0", "1", "2", "3", "4"]
+    assert max(converted_lengths) == 5
+
+
 @pytest.mark.asyncio
 async def test_generate_data_preview_error():
     # Test with invalid JSON
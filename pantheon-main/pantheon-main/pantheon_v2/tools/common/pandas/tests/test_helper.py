@@ -1,12 +1,15 @@
 import pytest
 import pandas as pd
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from .. import helper
 from ..helper import (
     html_table_to_dataframe,
     flexible_csv_parser,
     attempt_fix_malformed_csv,
     process_excel_file,
     process_parquet_file,
+    get_excel_engine,
     FileBytes,
 )
 
@@ -145,6 +148,43 @@ class TestProcessExcelFile:
         assert result.shape == (3, 5)  # Should have 3 rows and 5 columns
         assert list(result.iloc[0]) == ["a", "b", "c", "d", "e"]
 
+    def test_sheet_selection(self):
+        excel_data = BytesIO()
+        with pd.ExcelWriter(excel_data, engine="openpyxl") as writer:
+            pd.DataFrame({"A": [1, 2]}).to_excel(writer, sheet_name="One", index=False)
+            pd.DataFrame({"B": [3]}).to_excel(writer, sheet_name="Two", index=False)
+        excel_data.seek(0)
+
+        result = process_excel_file(excel_data, "test.xlsx", sheet_names=["Two"])
+        assert result.shape == (2, 1)
+        assert list(result.iloc[:, 0]) == ["B", 3]
+
+    def test_parallel_sheet_loading(self):
+        pytest.importorskip("python_calamine")
+        excel_data = BytesIO()
+        with pd.ExcelWriter(excel_data, engine="openpyxl") as writer:
+            pd.DataFrame({"A": [1, 2]}).to_excel(writer, sheet_name="One", index=False)
+            pd.DataFrame({"B": [3]}).to_excel(writer, sheet_name="Two", index=False)
+        excel_data.seek(0)
+
+        with ThreadPoolExecutor() as executor:
+            result = process_excel_file(excel_data, "test.xlsx", executor=executor)
+
+        # Sheets are stacked in workbook order
+        assert result.shape == (5, 1)
+        assert list(result.iloc[:, 0]) == ["A", 1, 2, "B", 3]
+
+    def test_get_excel_engine(self, monkeypatch):
+        monkeypatch.setattr(helper, "CALAMINE_AVAILABLE", False)
+        assert get_excel_engine(".xlsx") == "openpyxl"
+        assert get_excel_engine(".xls") == "xlrd"
+
+        monkeypatch.setattr(helper, "CALAMINE_AVAILABLE", True)
+        assert get_excel_engine(".xlsx") == "calamine"
+
+        with pytest.raises(ValueError, match="Unsupported Excel file extension"):
+            get_excel_engine(".doc")
+
     def test_unsupported_extension(self):
         with pytest.raises(ValueError, match="Unsupported Excel file extension"):
             process_excel_file(BytesIO(), "test.doc")
@@ -163,6 +203,46 @@ class TestProcessParquetFile:
         assert result.shape == (2, 2)
         assert list(result.columns) == ["A", "B"]
 
+    def test_reads_all_row_groups(self):
+        df = pd.DataFrame({"A": range(100), "B": ["x"] * 100})
+        parquet_data = BytesIO()
+        df.to_parquet(parquet_data, index=False, row_group_size=10)
+        parquet_data.seek(0)
+
+        result = process_parquet_file(parquet_data)
+        assert result.shape == (100, 2)
+
+    def test_projection_and_filters(self):
+        df = pd.DataFrame({"A": range(100), "B": ["x"] * 100})
+        parquet_data = BytesIO()
+        df.to_parquet(parquet_data, index=False, row_group_size=10)
+        parquet_data.seek(0)
+
+        result = process_parquet_file(
+            parquet_data, columns=["A"], filters=[("A", ">=", 90)]
+        )
+        assert list(result.columns) == ["A"]
+        assert list(result["A"]) == list(range(90, 100))
+
+    def test_filters_matching_nothing(self):
+        df = pd.DataFrame({"A": [1, 2], "B": [3, 4]})
+        parquet_data = BytesIO()
+        df.to_parquet(parquet_data, index=False)
+        parquet_data.seek(0)
+
+        result = process_parquet_file(parquet_data, filters=[("A", ">", 10)])
+        assert result.empty
+        assert list(result.columns) == ["A", "B"]
+
+    def test_parquet_read_across_batches(self):
+        df = pd.DataFrame({"A": range(25), "B": [str(i) for i in range(25)]})
+        parquet_data = BytesIO()
+        df.to_parquet(parquet_data, index=False, row_group_size=7)
+        parquet_data.seek(0)
+
+        result = process_parquet_file(parquet_data, batch_size=10)
+        pd.testing.assert_frame_equal(result, df)
+
     def test_invalid_parquet(self):
         invalid_data = BytesIO(b"not a parquet file")
         with pytest.raises(ValueError):
@@ -0,0 +1,116 @@
+import pandas as pd
+from pantheon_v2.tools.common.pandas.helpers.type_inference import (
+    infer_column_types,
+)
+
+
+def test_infer_numeric_columns():
+    """Numeric strings become numbers and blanks become nulls"""
+    df = pd.DataFrame({"amount": ["1.5", "2", "", None], "count": [1, "2", "3", "4"]})
+
+    result = infer_column_types(df)
+
+    assert pd.api.types.is_float_dtype(result["amount"])
+    assert result["amount"].iloc[0] == 1.5
+    assert pd.isna(result["amount"].iloc[2])
+    assert pd.api.types.is_integer_dtype(result["count"])
+
+
+def test_infer_iso_dates_only():
+    """ISO dates become datetimes, locale-dependent dates stay strings"""
+    df = pd.DataFrame(
+        {
+            "iso": ["2023-01-01", "2023-01-31", ""],
+            "local": ["01/02/2023", "03/04/2023", "05/06/2023"],
+        }
+    )
+
+    result = infer_column_types(df)
+
+    assert pd.api.types.is_datetime64_any_dtype(result["iso"])
+    assert result["iso"].iloc[1] == pd.Timestamp("2023-01-31")
+    assert result["local"].dtype == object
+
+
+def test_low_cardinality_strings_become_categorical():
+    df = pd.DataFrame(
+        {
+            "currency": ["USD", "USD", "EUR", "USD"],
+            "reference": ["a", "b", "c", "d"],
+        }
+    )
+
+    result = infer_column_types(df, categorical_threshold=0.5)
+
+    assert isinstance(result["currency"].dtype, pd.CategoricalDtype)
+    assert result["reference"].dtype == object
+
+
+def test_mixed_values_become_strings():
+    """Mixed object columns are normalised to strings so Parquet can store them"""
+    df = pd.DataFrame({"mixed": ["Amount", 10, None, 2.5]})
+
+    result = infer_column_types(df, categorical_threshold=0)
+
+    assert result["mixed"].tolist()[:2] == ["Amount", "10"]
+    assert pd.isna(result["mixed"].iloc[2])
+
+
+def test_typed_columns_untouched():
+    df = pd.DataFrame({"a": [1, 2], "b": [0.5, 1.5]})
+
+    result = infer_column_types(df)
+
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_leading_zeros_stay_strings():
+    """Codes such as postcodes and IDs keep their leading zeros"""
+    df = pd.DataFrame({"postcode": ["0012345", "12345", ""]})
+
+    result = infer_column_types(df, categorical_threshold=0)
+
+    assert result["postcode"].tolist()[:2] == ["0012345", "12345"]
+
+
+def test_long_numbers_stay_strings():
+    """Numbers float64 cannot hold exactly are not converted"""
+    df = pd.DataFrame(
+        {
+            "account": ["12345678901234567890", "98765432109876543210"],
+            "amount": ["123456789012345", "0.5"],
+        }
+    )
+
+    result = infer_column_types(df, categorical_threshold=0)
+
+    assert result["account"].tolist() == [
+        "12345678901234567890",
+        "98765432109876543210",
+    ]
+    assert pd.api.types.is_float_dtype(result["amount"])
+
+
+def test_bare_digits_are_not_dates():
+    """Digit strings like 20230102 and 2023 stay numbers, not datetimes"""
+    df = pd.DataFrame(
+        {
+            "compact": ["20230102", "20230103"],
+            "year": ["2023", "2024"],
+            "mixed": ["2023-01-02", "20230103"],
+        }
+    )
+
+    result = infer_column_types(df, categorical_threshold=0)
+
+    assert pd.api.types.is_integer_dtype(result["compact"])
+    assert pd.api.types.is_integer_dtype(result["year"])
+    assert result["mixed"].tolist() == ["2023-01-02", "20230103"]
+
+
+def test_iso_datetimes_with_time_become_datetimes():
+    df = pd.DataFrame({"created": ["2023-01-02T10:30:00", "2023-01-03 11:00"]})
+
+    result = infer_column_types(df)
+
+    assert pd.api.types.is_datetime64_any_dtype(result["created"])
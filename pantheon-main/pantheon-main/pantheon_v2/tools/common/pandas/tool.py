@@ -5,12 +5,13 @@ from io import BytesIO
 
 from pantheon_v2.tools.core.base import BaseTool
 from pantheon_v2.tools.core.tool_registry import ToolRegistry
+from pantheon_v2.tools.core.blob_reference.models import BlobReference
+from pantheon_v2.tools.core.blob_reference.resolver import read_blob_reference
 
 # from pantheon_v2.tools.common.pandas.config import PandasConfig
 from pantheon_v2.tools.common.pandas.models import (
     FileToPandasInput,
     ConvertFileToDFOutput,
-    FileBytes,
     DetectTablesAndMetadataInput,
     DetectTablesAndMetadataOutput,
     AddMetadataColumnsInput,
@@ -23,9 +24,10 @@ from pantheon_v2.tools.common.pandas.models import (
     DataPreviewOutput,
 )
 from pantheon_v2.tools.common.pandas.helper import (
-    process_excel_file,
-    flexible_csv_parser,
-    process_parquet_file,
+    convert_file_to_dataframe,
+    dataframe_to_parquet,
+    build_data_preview,
+    has_numeric_headers,
 )
 from pantheon_v2.tools.common.pandas.helpers.add_metadata_columns import (
     add_metadata_to_df,
@@ -52,20 +54,20 @@ class PandasTool(BaseTool):
     async def convert_file_to_df(
         self, params: FileToPandasInput
     ) -> ConvertFileToDFOutput:
-        file_name = params.file_name
-        file_bytes_model = FileBytes(file_bytes=params.file_content)
-
         try:
-            if file_name.endswith((".xlsx", ".xls")):
-                df = process_excel_file(params.file_content, file_name[-4:])
-            elif file_name.endswith(".csv"):
-                # Use the flexible_csv_parser for CSV files
-                df_model = flexible_csv_parser(file_bytes_model)
-                df = df_model.df
-            elif file_name.endswith(".parquet"):
-                # Process parquet files
-                df = process_parquet_file(params.file_content)
-            else:
+            file_content = params.file_content
+            if isinstance(file_content, BlobReference):
+                file_content = BytesIO(await read_blob_reference(file_content))
+
+            df = convert_file_to_dataframe(
+                file_content,
+                params.file_name,
+                sheet_names=params.sheet_names,
+                columns=params.columns,
+                filters=params.filters,
+                executor=self.thread_pool,
+            )
+            if df is None:
                 return ConvertFileToDFOutput.from_dataframe(None, success=False)
 
             return ConvertFileToDFOutput.from_dataframe(df, success=True)
@@ -128,21 +130,22 @@ class PandasTool(BaseTool):
             df = pd.read_json(params.file_content, orient="split")
 
             # Check if headers are numeric to determine header inclusion
-            headers = list(df.columns)
-            are_headers_numeric = all(
-                isinstance(h, (int, float)) or (isinstance(h, str) and h.isdigit())
-                for h in headers
-            )
+            are_headers_numeric = has_numeric_headers(df)
             include_headers = (
                 not are_headers_numeric
             )  # Include headers only if they're not numeric
 
-            # Convert all columns to string type
-            df = df.astype(str)
-
-            # Convert to CSV bytes
+            # Convert to CSV bytes chunk by chunk so only one slice is ever
+            # copied into strings at a time
             csv_buffer = BytesIO()
-            df.to_csv(csv_buffer, index=False, header=include_headers, encoding="utf-8")
+            for start in range(0, max(len(df), 1), params.chunk_size):
+                chunk = df.iloc[start : start + params.chunk_size].astype(str)
+                chunk.to_csv(
+                    csv_buffer,
+                    index=False,
+                    header=include_headers and start == 0,
+                    encoding="utf-8",
+                )
             csv_buffer.seek(0)
 
             logger.info(
@@ -166,15 +169,20 @@ class PandasTool(BaseTool):
             # Convert input JSON string to DataFrame
             df = pd.read_json(params.file_content, orient="split")
 
-            # Convert to Parquet bytes
-            parquet_buffer = BytesIO()
-            df.to_parquet(parquet_buffer, index=False)
-            parquet_buffer.seek(0)
+            parquet_buffer = dataframe_to_parquet(
+                df,
+                infer_types=params.infer_types,
+                categorical_threshold=params.categorical_threshold,
+                compression=params.compression,
+                row_group_size=params.row_group_size,
+                write_statistics=params.write_statistics,
+            )
 
             logger.info(
                 "Successfully converted DataFrame to Parquet",
                 num_rows=len(df),
                 num_columns=len(df.columns),
+                compression=params.compression,
             )
 
             return DFToParquetOutput(parquet_content=parquet_buffer, success=True)
@@ -192,41 +200,15 @@ class PandasTool(BaseTool):
         try:
             df = pd.read_json(params.df_json, orient="split")
 
-            # Check if headers are numeric to determine header inclusion
-            headers = list(df.columns)
-            are_headers_numeric = all(
-                isinstance(h, (int, float)) or (isinstance(h, str) and h.isdigit())
-                for h in headers
-            )
-
-            # If headers are numeric, use first row as headers
-            if are_headers_numeric:
-                # Get the first row values
-                new_headers = df.iloc[0].values.tolist()
-                # Update column names
-                df.columns = new_headers
-                # Remove the first row since it's now headers
-                df = df.iloc[1:]
-                # Reset index after removing first row
-                df = df.reset_index(drop=True)
-
-            # Convert all columns to string type
-            df = df.astype(str)
-
-            # Convert DataFrame to records and ensure all keys are strings
-            preview_rows = []
-            for row in df.head(params.num_rows).to_dict(orient="records"):
-                # Create a new dict with string keys
-                string_row = {str(k): v for k, v in row.items()}
-                preview_rows.append(string_row)
+            preview = build_data_preview(df, params.num_rows)
 
             logger.info(
                 "Successfully generated data preview",
-                num_preview_rows=len(preview_rows),
-                num_columns=len(df.columns),
+                num_preview_rows=len(preview.rows),
+                num_columns=len(preview.columns),
             )
 
-            return DataPreviewOutput(columns=list(df.columns), rows=preview_rows)
+            return preview
         except Exception as e:
             logger.error("Error generating data preview", error=str(e))
             raise
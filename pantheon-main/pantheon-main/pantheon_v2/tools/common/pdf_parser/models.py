@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Union
+
+from pantheon_v2.tools.core.blob_reference.models import BlobReference
 
 
 class PDFPage(BaseModel):
@@ -81,7 +83,9 @@ class ParsedPDF(BaseModel):
 
 
 class ParsePDFParams(BaseModel):
-    pdf_content: bytes = Field(..., description="Raw PDF content as bytes")
+    pdf_content: Union[BlobReference, bytes] = Field(
+        ..., description="Raw PDF content as bytes, or a reference to it"
+    )
     extract_tables: bool = Field(
         default=True,
         description="Whether to extract tables from the PDF",
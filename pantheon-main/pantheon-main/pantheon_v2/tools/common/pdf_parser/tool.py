@@ -10,6 +10,8 @@ from pantheon_v2.tools.common.pdf_parser.models import (
     PDFPage,
 )
 from pantheon_v2.tools.core.base import BaseTool
+from pantheon_v2.tools.core.blob_reference.models import BlobReference
+from pantheon_v2.tools.core.blob_reference.resolver import read_blob_reference
 from pantheon_v2.tools.common.pdf_parser.helper import (
     extract_tables,
     extract_formatted_text,
@@ -30,18 +32,27 @@ class PDFParserTool(BaseTool):
             logger.error("Failed to initialize PDF parser tool", error=str(e))
             raise
 
+    def _check_size(self, size: int) -> None:
+        if size > self.config.max_size:
+            raise ValueError(
+                f"PDF content exceeds maximum size of {self.config.max_size} bytes"
+            )
+
     async def parse_pdf(self, params: ParsePDFParams) -> ParsedPDF:
         """Parse PDF content and extract its contents"""
         try:
-            if len(params.pdf_content) > self.config.max_size:
-                raise ValueError(
-                    f"PDF content exceeds maximum size of {self.config.max_size} bytes"
-                )
+            pdf_content = params.pdf_content
+            if isinstance(pdf_content, BlobReference):
+                # Known sizes are checked before anything is downloaded
+                if pdf_content.size is not None:
+                    self._check_size(pdf_content.size)
+                pdf_content = await read_blob_reference(pdf_content)
+            self._check_size(len(pdf_content))
 
             pdf_pages: List[PDFPage] = []
 
             # Open PDF with pdfplumber
-            with pdfplumber.open(io.BytesIO(params.pdf_content)) as pdf:
+            with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
                 metadata = pdf.metadata
 
                 # Process each page
@@ -6,3 +6,7 @@ class BaseTool(ABC):
     async def initialize(self) -> None:
         """Initialize the tool"""
         pass
+
+    async def cleanup(self) -> None:
+        """Release clients and connections held by the tool"""
+        pass
@@ -0,0 +1,71 @@
+from enum import Enum
+from typing import Optional
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class BlobStorageProvider(str, Enum):
+    GCS = "gcs"
+    S3 = "s3"
+
+
+URI_SCHEMES = {
+    "gs": BlobStorageProvider.GCS,
+    "s3": BlobStorageProvider.S3,
+}
+
+
+class BlobReference(BaseModel):
+    """
+    Pointer to file content that readers fetch themselves.
+
+    Passing a reference between activities keeps the bytes out of workflow
+    payloads, the activity that needs the content downloads it directly.
+    """
+
+    provider: Optional[BlobStorageProvider] = Field(
+        default=None, description="Storage the object lives in"
+    )
+    bucket_name: Optional[str] = Field(default=None, description="Bucket name")
+    key: Optional[str] = Field(default=None, description="Object name in the bucket")
+    url: Optional[str] = Field(
+        default=None, description="Presigned URL, used instead of bucket and key"
+    )
+    generation: Optional[int] = Field(
+        default=None, description="GCS generation to read, the latest if unset"
+    )
+    size: Optional[int] = Field(default=None, description="Size in bytes, if known")
+    sha256: Optional[str] = Field(
+        default=None, description="Hex SHA-256 of the content, checked when resolved"
+    )
+    content_type: Optional[str] = Field(default=None, description="Content type")
+
+    @model_validator(mode="after")
+    def check_location(self) -> "BlobReference":
+        if self.url is None and not (self.provider and self.bucket_name and self.key):
+            raise ValueError("Either url or provider, bucket_name and key is required")
+        return self
+
+    @property
+    def uri(self) -> str:
+        """Location for logs and errors, without the signature of presigned URLs"""
+        if self.url is not None:
+            parsed = urlparse(self.url)
+            return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        scheme = "gs" if self.provider == BlobStorageProvider.GCS else "s3"
+        return f"{scheme}://{self.bucket_name}/{self.key}"
+
+    @classmethod
+    def from_uri(cls, uri: str, **kwargs) -> "BlobReference":
+        """Build a reference from a gs:// or s3:// URI"""
+        parsed = urlparse(uri)
+        provider = URI_SCHEMES.get(parsed.scheme)
+        if provider is None:
+            raise ValueError(f"Unsupported blob URI: {uri}")
+        return cls(
+            provider=provider,
+            bucket_name=parsed.netloc,
+            key=parsed.path.lstrip("/"),
+            **kwargs,
+        )
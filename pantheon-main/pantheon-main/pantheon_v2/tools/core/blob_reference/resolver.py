@@ -0,0 +1,64 @@
+import hashlib
+
+import aiohttp
+import structlog
+
+from pantheon_v2.tools.core.blob_reference.models import (
+    BlobReference,
+    BlobStorageProvider,
+)
+from pantheon_v2.tools.core.internal_data_repository.constants import (
+    INTERNAL_GCS_CONFIG,
+)
+from pantheon_v2.tools.core.tool_registry import ToolRegistry
+from pantheon_v2.tools.external.gcs.models import DownloadFromGCSInput
+from pantheon_v2.tools.external.gcs.tool import GCSTool
+from pantheon_v2.tools.external.s3.activities import get_internal_s3_config
+from pantheon_v2.tools.external.s3.models import DownloadFromS3Input
+from pantheon_v2.tools.external.s3.tool import S3Tool
+
+logger = structlog.get_logger(__name__)
+
+
+async def _download(ref: BlobReference) -> bytes:
+    if ref.url is not None:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(ref.url) as response:
+                response.raise_for_status()
+                return await response.read()
+
+    if ref.provider == BlobStorageProvider.GCS:
+        tool = await ToolRegistry.get_tool_instance(
+            GCSTool, INTERNAL_GCS_CONFIG.model_dump()
+        )
+        result = await tool.download_from_gcs(
+            DownloadFromGCSInput(
+                bucket_name=ref.bucket_name,
+                file_name=ref.key,
+                generation=ref.generation,
+            )
+        )
+        return result.content.getvalue()
+
+    tool = await ToolRegistry.get_tool_instance(
+        S3Tool, get_internal_s3_config().model_dump()
+    )
+    result = await tool.download_from_s3(
+        DownloadFromS3Input(bucket_name=ref.bucket_name, file_name=ref.key)
+    )
+    return result.content.getvalue()
+
+
+async def read_blob_reference(ref: BlobReference) -> bytes:
+    """Download the content a reference points to and check its size and hash"""
+    content = await _download(ref)
+
+    if ref.size is not None and len(content) != ref.size:
+        raise ValueError(
+            f"Size mismatch for {ref.uri}: expected {ref.size}, got {len(content)}"
+        )
+    if ref.sha256 is not None and hashlib.sha256(content).hexdigest() != ref.sha256:
+        raise ValueError(f"SHA-256 mismatch for {ref.uri}")
+
+    logger.info("Resolved blob reference", uri=ref.uri, size=len(content))
+    return content
@@ -0,0 +1,103 @@
+import hashlib
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pantheon_v2.tools.core.blob_reference.models import (
+    BlobReference,
+    BlobStorageProvider,
+)
+from pantheon_v2.tools.core.blob_reference.resolver import read_blob_reference
+from pantheon_v2.tools.common.pandas.models import FileToPandasInput
+from pantheon_v2.tools.external.gcs.tool import GCSTool
+from pantheon_v2.tools.external.s3.tool import S3Tool
+
+
+def test_from_uri():
+    ref = BlobReference.from_uri("gs://bucket/folder/file.pdf", size=3)
+
+    assert ref.provider == BlobStorageProvider.GCS
+    assert ref.bucket_name == "bucket"
+    assert ref.key == "folder/file.pdf"
+    assert ref.uri == "gs://bucket/folder/file.pdf"
+
+    with pytest.raises(ValueError):
+        BlobReference.from_uri("ftp://bucket/file.pdf")
+
+
+def test_location_is_required():
+    with pytest.raises(ValueError):
+        BlobReference(bucket_name="bucket")
+
+
+def test_presigned_url_signature_is_not_exposed():
+    ref = BlobReference(url="https://host/bucket/file.pdf?X-Amz-Signature=secret")
+
+    assert ref.uri == "https://host/bucket/file.pdf"
+
+
+def test_reference_round_trips_through_reader_inputs():
+    """References survive JSON serialisation where bytes would be base64 encoded"""
+    params = FileToPandasInput(
+        file_content=BlobReference.from_uri("s3://bucket/data.csv"),
+        file_name="data.csv",
+    )
+
+    restored = FileToPandasInput.model_validate_json(params.model_dump_json())
+
+    assert isinstance(restored.file_content, BlobReference)
+    assert restored.file_content.key == "data.csv"
+    assert isinstance(
+        FileToPandasInput(file_content=b"a,b", file_name="x.csv").file_content, BytesIO
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_gcs_reference_pins_generation():
+    content = b"pdf content"
+    gcs_tool = MagicMock()
+    gcs_tool.download_from_gcs = AsyncMock(
+        return_value=MagicMock(content=BytesIO(content))
+    )
+
+    with patch(
+        "pantheon_v2.tools.core.blob_reference.resolver.ToolRegistry.get_tool_instance",
+        AsyncMock(return_value=gcs_tool),
+    ) as get_tool_instance:
+        result = await read_blob_reference(
+            BlobReference.from_uri(
+                "gs://bucket/file.pdf",
+                generation=4,
+                size=len(content),
+                sha256=hashlib.sha256(content).hexdigest(),
+            )
+        )
+
+    assert result == content
+    assert get_tool_instance.call_args.args[0] is GCSTool
+    download_input = gcs_tool.download_from_gcs.call_args.args[0]
+    assert download_input.file_name == "file.pdf"
+    assert download_input.generation == 4
+
+
+@pytest.mark.asyncio
+async def test_read_reference_rejects_changed_content():
+    s3_tool = MagicMock()
+    s3_tool.download_from_s3 = AsyncMock(
+        return_value=MagicMock(content=BytesIO(b"other"))
+    )
+
+    with patch(
+        "pantheon_v2.tools.core.blob_reference.resolver.ToolRegistry.get_tool_instance",
+        AsyncMock(return_value=s3_tool),
+    ) as get_tool_instance:
+        with pytest.raises(ValueError, match="SHA-256 mismatch"):
+            await read_blob_reference(
+                BlobReference.from_uri(
+                    "s3://bucket/data.csv",
+                    sha256=hashlib.sha256(b"expected").hexdigest(),
+                )
+            )
+
+    assert get_tool_instance.call_args.args[0] is S3Tool
@@ -1,4 +1,5 @@
 from pantheon_v2.tools.core.activity_registry import ActivityRegistry
+from pantheon_v2.tools.core.tool_registry import ToolRegistry
 
 from pantheon_v2.tools.core.internal_data_repository.models import (
     RelationalQueryParams,
@@ -6,12 +7,18 @@ from pantheon_v2.tools.core.internal_data_repository.models import (
     RelationalInsertParams,
     RelationalUpdateParams,
     RelationalExecuteResult,
+    RelationalBatchUpdateParams,
+    RelationalBatchUpdateResult,
     BlobStorageQueryParams,
     BlobStorageResult,
     BlobStorageFolderQueryParams,
     BlobStorageFolderResult,
+    BlobStorageFolderListResult,
+    BlobStorageFilesQueryParams,
     BlobStorageUploadParams,
     BlobStorageUploadResult,
+    BlobStorageBulkUploadParams,
+    BlobStorageBulkUploadResult,
 )
 
 from pantheon_v2.tools.core.internal_data_repository.tool import (
@@ -23,8 +30,7 @@ from pantheon_v2.tools.core.internal_data_repository.tool import (
 async def query_internal_relational_data(
     query_params: RelationalQueryParams,
 ) -> RelationalQueryResult:
-    tool = InternalDataRepositoryTool()
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(InternalDataRepositoryTool)
     return await tool.query_relational_data(query_params)
 
 
@@ -32,8 +38,7 @@ async def query_internal_relational_data(
 async def insert_internal_relational_data(
     insert_params: RelationalInsertParams,
 ) -> RelationalExecuteResult:
-    tool = InternalDataRepositoryTool()
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(InternalDataRepositoryTool)
     return await tool.insert_relational_data(insert_params)
 
 
@@ -41,19 +46,27 @@ async def insert_internal_relational_data(
 async def update_internal_relational_data(
     update_params: RelationalUpdateParams,
 ) -> RelationalExecuteResult:
-    tool = InternalDataRepositoryTool()
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(InternalDataRepositoryTool)
     return await tool.update_relational_data(update_params)
 
 
+@ActivityRegistry.register_activity(
+    "Apply many updates to internal zamp systems in one transaction"
+)
+async def batch_update_internal_relational_data(
+    update_params: RelationalBatchUpdateParams,
+) -> RelationalBatchUpdateResult:
+    tool = await ToolRegistry.get_tool_instance(InternalDataRepositoryTool)
+    return await tool.batch_update_relational_data(update_params)
+
+
 @ActivityRegistry.register_activity(
     "Query blob storage from internal zamp storage blob bucket"
 )
 async def query_internal_blob_storage(
     query_params: BlobStorageQueryParams,
 ) -> BlobStorageResult:
-    tool = InternalDataRepositoryTool()
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(InternalDataRepositoryTool)
     return await tool.query_blob_storage(query_params)
 
 
@@ -63,15 +76,43 @@ async def query_internal_blob_storage(
 async def query_internal_blob_storage_folder(
     query_params: BlobStorageFolderQueryParams,
 ) -> BlobStorageFolderResult:
-    tool = InternalDataRepositoryTool()
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(InternalDataRepositoryTool)
     return await tool.query_blob_storage_folder(query_params)
 
 
+@ActivityRegistry.register_activity(
+    "List files in a folder of internal zamp storage blob bucket without their content"
+)
+async def list_internal_blob_storage_folder(
+    query_params: BlobStorageFolderQueryParams,
+) -> BlobStorageFolderListResult:
+    tool = await ToolRegistry.get_tool_instance(InternalDataRepositoryTool)
+    return await tool.list_blob_storage_folder(query_params)
+
+
+@ActivityRegistry.register_activity(
+    "Query selected files from internal zamp storage blob bucket"
+)
+async def query_internal_blob_storage_files(
+    query_params: BlobStorageFilesQueryParams,
+) -> BlobStorageFolderResult:
+    tool = await ToolRegistry.get_tool_instance(InternalDataRepositoryTool)
+    return await tool.query_blob_storage_files(query_params)
+
+
 @ActivityRegistry.register_activity("Upload file to internal zamp storage blob bucket")
 async def upload_internal_blob_storage(
     upload_params: BlobStorageUploadParams,
 ) -> BlobStorageUploadResult:
-    tool = InternalDataRepositoryTool()
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(InternalDataRepositoryTool)
     return await tool.upload_to_blob_storage(upload_params)
+
+
+@ActivityRegistry.register_activity(
+    "Upload many files to internal zamp storage blob bucket concurrently"
+)
+async def bulk_upload_internal_blob_storage(
+    upload_params: BlobStorageBulkUploadParams,
+) -> BlobStorageBulkUploadResult:
+    tool = await ToolRegistry.get_tool_instance(InternalDataRepositoryTool)
+    return await tool.bulk_upload_to_blob_storage(upload_params)
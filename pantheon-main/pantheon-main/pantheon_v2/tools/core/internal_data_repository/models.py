@@ -1,11 +1,17 @@
-from pantheon_v2.utils.type_utils import get_fqn, get_reference_from_fqn
+from pantheon_v2.utils.type_utils import (
+    get_fqn,
+    get_list_adapter,
+    get_reference_from_fqn,
+)
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from io import BytesIO
-from typing import Any, Type, TypeVar, Dict
+from typing import Any, Type, TypeVar, Dict, Optional
 from datetime import datetime
 
-from pantheon_v2.tools.external.gcs.models import GCSFileMetadata
+from pantheon_v2.tools.external.gcs.models import GCSFileMetadata, GCSObjectInfo
+from pantheon_v2.tools.external.postgres.models import QueryOutputFormat
+from pantheon_v2.tools.core.blob_reference.models import BlobReference
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -18,23 +24,60 @@ class RelationalQueryParams(BaseModel):
     query: str
     parameters: dict
     output_model: Type[BaseModel]
+    # Build output models without validation. Only for queries whose columns
+    # and types are known to match output_model exactly
+    trusted_schema: bool = False
+    # Fetch through a server-side cursor in batches of this many rows
+    stream_batch_size: Optional[int] = None
+    # Parquet output is written to export_bucket_name/export_file_name and
+    # returned as a reference instead of rows
+    output_format: QueryOutputFormat = QueryOutputFormat.ROWS
+    export_bucket_name: Optional[str] = None
+    export_file_name: Optional[str] = None
+    # Serve repeated identical queries from an in-process cache for this many
+    # seconds. Writes through this repository to any of cache_tables drop the
+    # cached results early, writes from elsewhere are only seen on expiry
+    cache_ttl_seconds: Optional[int] = None
+    cache_tables: list[str] = []
+
+    @model_validator(mode="after")
+    def check_export_location(self) -> "RelationalQueryParams":
+        if self.output_format == QueryOutputFormat.PARQUET and not (
+            self.export_bucket_name and self.export_file_name
+        ):
+            raise ValueError(
+                "export_bucket_name and export_file_name are required for Parquet output"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def check_cache_settings(self) -> "RelationalQueryParams":
+        if self.cache_ttl_seconds is None:
+            return self
+        if not self.cache_tables:
+            raise ValueError("cache_tables are required to cache a query")
+        if self.output_format != QueryOutputFormat.ROWS:
+            raise ValueError("Only row output can be cached")
+        return self
 
 
 class RelationalQueryResult[T: BaseModel](BaseModel):
     data: list[T]
     row_count: int
+    parquet_reference: Optional[BlobReference] = None
     __data_type: str
 
     @classmethod
     def model_validate(cls, obj: dict) -> "RelationalQueryResult":
         if "__data_type" in obj:
             data_type = get_reference_from_fqn(obj.pop("__data_type"))
-            obj["data"] = [data_type.model_validate(item) for item in obj["data"]]
+            obj["data"] = get_list_adapter(data_type).validate_python(obj["data"])
         return super().model_validate(obj)
 
     def model_dump(self, *args, **kwargs):
         d = super().model_dump(*args, **kwargs)
-        d["__data_type"] = get_fqn(self.data[0].__class__)
+        if self.data:
+            d["__data_type"] = get_fqn(self.data[0].__class__)
         return d
 
 
@@ -59,6 +102,16 @@ class RelationalUpdateParams[T: BaseModel](BaseModel):
     where: dict[str, Any]
 
 
+class RelationalRowUpdate(BaseModel):
+    data: dict[str, Any]
+    where: dict[str, Any]
+
+
+class RelationalBatchUpdateParams(BaseModel):
+    table: str
+    updates: list[RelationalRowUpdate]
+
+
 """
 Result Models
 """
@@ -69,6 +122,13 @@ class RelationalExecuteResult(BaseModel):
     affected_rows: int
 
 
+class RelationalBatchUpdateResult(BaseModel):
+    success: bool
+    affected_rows: int
+    # Rows affected by each update, in the order of the updates
+    row_counts: list[int]
+
+
 """
 Blob Storage Models
 """
@@ -125,6 +185,34 @@ class BlobStorageFolderResult(BaseModel):
         arbitrary_types_allowed = True
 
 
+class BlobStorageFileInfo(BaseModel):
+    name: str
+    blob_name: str
+    full_path: str
+    relative_path: str
+    size: int
+    content_type: str
+    generation: int
+    created: datetime
+    updated: datetime
+
+    @classmethod
+    def from_gcs_object_info(cls, info: GCSObjectInfo) -> "BlobStorageFileInfo":
+        return cls(**info.model_dump())
+
+    def to_gcs_object_info(self) -> GCSObjectInfo:
+        return GCSObjectInfo(**self.model_dump())
+
+
+class BlobStorageFolderListResult(BaseModel):
+    files: list[BlobStorageFileInfo]
+
+
+class BlobStorageFilesQueryParams(BaseModel):
+    bucket_name: str
+    files: list[BlobStorageFileInfo]
+
+
 class BlobStorageUploadParams(BaseModel):
     bucket_name: str
     file_name: str
@@ -140,6 +228,25 @@ class BlobStorageUploadResult(BaseModel):
     https_url: str
 
 
+class BlobStorageBulkUploadParams(BaseModel):
+    files: list[BlobStorageUploadParams]
+
+
+class BlobStorageBulkUploadItem(BaseModel):
+    file_name: str
+    success: bool
+    result: Optional[BlobStorageUploadResult] = None
+    error: Optional[str] = None
+
+
+class BlobStorageBulkUploadResult(BaseModel):
+    results: list[BlobStorageBulkUploadItem]
+
+    @property
+    def failed(self) -> list[BlobStorageBulkUploadItem]:
+        return [item for item in self.results if not item.success]
+
+
 class BlobStorageQueryResult(BaseModel):
     content: bytes
     metadata: Dict[str, Any] = {}
@@ -1,8 +1,16 @@
-from pantheon_v2.tools.core.internal_data_repository.models import RelationalQueryResult
+from datetime import datetime
+
+from pantheon_v2.tools.core.blob_reference.models import BlobReference
+from pantheon_v2.tools.core.internal_data_repository.models import (
+    RelationalQueryParams,
+    RelationalQueryResult,
+    BlobStorageFileInfo,
+)
+from pantheon_v2.tools.external.gcs.models import GCSObjectInfo
 
 import pytest
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 
 class TestModel(BaseModel):
@@ -40,3 +48,57 @@ async def test_relational_query_result_validate():
     result = RelationalQueryResult.model_validate(result_dict)
     assert result.data[0].name == "John Doe"
     assert result.data[0].age == 30
+
+
+def test_relational_query_params_require_export_location_for_parquet():
+    with pytest.raises(ValidationError):
+        RelationalQueryParams(
+            query="SELECT 1",
+            parameters={},
+            output_model=TestModel,
+            output_format="parquet",
+        )
+
+    params = RelationalQueryParams(
+        query="SELECT 1",
+        parameters={},
+        output_model=TestModel,
+        output_format="parquet",
+        export_bucket_name="exports",
+        export_file_name="result.parquet",
+    )
+    assert params.export_file_name == "result.parquet"
+
+
+def test_relational_query_result_with_parquet_reference_dumps_without_data():
+    result = RelationalQueryResult(
+        data=[],
+        row_count=3,
+        parquet_reference=BlobReference.from_uri("gs://exports/result.parquet"),
+    )
+
+    result_dict = result.model_dump()
+
+    assert "__data_type" not in result_dict
+    assert RelationalQueryResult.model_validate(result_dict).parquet_reference.key == (
+        "result.parquet"
+    )
+
+
+def test_blob_storage_file_info_round_trips_gcs_object_info():
+    info = GCSObjectInfo(
+        name="invoice.pdf",
+        blob_name="invoices/1/invoice.pdf",
+        full_path="gs://bucket/invoices/1/invoice.pdf",
+        relative_path="invoice.pdf",
+        size=10,
+        content_type="application/pdf",
+        generation=3,
+        created=datetime(2024, 1, 1),
+        updated=datetime(2024, 1, 2),
+    )
+
+    file_info = BlobStorageFileInfo.from_gcs_object_info(info)
+
+    assert file_info.generation == 3
+    assert file_info.to_gcs_object_info() == info
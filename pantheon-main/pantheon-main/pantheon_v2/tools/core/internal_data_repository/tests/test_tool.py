@@ -0,0 +1,147 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from pantheon_v2.tools.core.internal_data_repository.models import (
+    RelationalQueryParams,
+    RelationalUpdateParams,
+)
+from pantheon_v2.tools.core.internal_data_repository.tool import (
+    InternalDataRepositoryTool,
+)
+from pantheon_v2.tools.external.postgres.models import QueryResult
+
+
+class Row(BaseModel):
+    id: int
+    name: str
+
+
+@pytest.fixture
+def tool():
+    tool = InternalDataRepositoryTool()
+    tool.postgres_tool = AsyncMock()
+    return tool
+
+
+def _query_result(rows):
+    return QueryResult(columns=["id", "name"], rows=rows, row_count=len(rows))
+
+
+@pytest.mark.asyncio
+async def test_query_relational_data_validates_rows(tool):
+    tool.postgres_tool.query.return_value = _query_result(
+        [{"id": "1", "name": "a"}, {"id": 2, "name": "b"}]
+    )
+
+    result = await tool.query_relational_data(
+        RelationalQueryParams(query="SELECT 1", parameters={}, output_model=Row)
+    )
+
+    assert result.data == [Row(id=1, name="a"), Row(id=2, name="b")]
+    assert result.row_count == 2
+
+
+@pytest.mark.asyncio
+async def test_query_relational_data_rejects_invalid_rows(tool):
+    tool.postgres_tool.query.return_value = _query_result([{"id": "x", "name": "a"}])
+
+    with pytest.raises(ValidationError):
+        await tool.query_relational_data(
+            RelationalQueryParams(query="SELECT 1", parameters={}, output_model=Row)
+        )
+
+
+@pytest.mark.asyncio
+async def test_query_relational_data_trusted_schema_skips_validation(tool):
+    tool.postgres_tool.query.return_value = _query_result([{"id": "1", "name": "a"}])
+
+    result = await tool.query_relational_data(
+        RelationalQueryParams(
+            query="SELECT 1", parameters={}, output_model=Row, trusted_schema=True
+        )
+    )
+
+    # Values are taken as returned by the database
+    assert isinstance(result.data[0], Row)
+    assert result.data[0].id == "1"
+
+
+def _cached_params(**kwargs):
+    return RelationalQueryParams(
+        query="SELECT id, name FROM vendors WHERE name = :name",
+        parameters={"name": "a"},
+        output_model=Row,
+        cache_ttl_seconds=60,
+        cache_tables=["Vendors"],
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_query_is_served_from_cache(tool):
+    tool.postgres_tool.query.return_value = _query_result([{"id": 1, "name": "a"}])
+
+    first = await tool.query_relational_data(_cached_params())
+    second = await tool.query_relational_data(_cached_params())
+
+    assert tool.postgres_tool.query.await_count == 1
+    assert first.data == second.data == [Row(id=1, name="a")]
+    # Each caller gets its own models
+    assert first.data[0] is not second.data[0]
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_queries_of_the_table(tool):
+    tool.postgres_tool.query.return_value = _query_result([{"id": 1, "name": "a"}])
+    tool.postgres_tool.update.return_value = AsyncMock(success=True, affected_rows=1)
+
+    await tool.query_relational_data(_cached_params())
+    await tool.update_relational_data(
+        RelationalUpdateParams(table="vendors", data={"name": "b"}, where={"id": 1})
+    )
+    await tool.query_relational_data(_cached_params())
+
+    assert tool.postgres_tool.query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_write_during_a_cache_miss_is_not_cached_over(tool):
+    query_started = asyncio.Event()
+    write_done = asyncio.Event()
+
+    async def slow_query(params):
+        # The rows are read before the write lands
+        query_started.set()
+        await write_done.wait()
+        return _query_result([{"id": 1, "name": "a"}])
+
+    tool.postgres_tool.query.side_effect = slow_query
+    tool.postgres_tool.update.return_value = AsyncMock(success=True, affected_rows=1)
+
+    async def write():
+        await query_started.wait()
+        await tool.update_relational_data(
+            RelationalUpdateParams(table="vendors", data={"name": "b"}, where={"id": 1})
+        )
+        write_done.set()
+
+    await asyncio.gather(tool.query_relational_data(_cached_params()), write())
+
+    # The rows read before the write were not cached, the next query goes
+    # to the database
+    tool.postgres_tool.query.side_effect = None
+    tool.postgres_tool.query.return_value = _query_result([{"id": 1, "name": "b"}])
+    result = await tool.query_relational_data(_cached_params())
+
+    assert tool.postgres_tool.query.await_count == 2
+    assert result.data == [Row(id=1, name="b")]
+
+
+def test_cached_query_requires_tables():
+    with pytest.raises(ValidationError):
+        RelationalQueryParams(
+            query="SELECT 1", parameters={}, output_model=Row, cache_ttl_seconds=60
+        )
@@ -1,33 +1,55 @@
-from typing import TypeVar
+import json
+from io import BytesIO
+from typing import Optional, TypeVar
 from pydantic import BaseModel
 from pantheon_v2.tools.core.internal_data_repository.models import (
     RelationalQueryParams,
     RelationalInsertParams,
     RelationalUpdateParams,
+    RelationalBatchUpdateParams,
+    RelationalBatchUpdateResult,
     BlobStorageQueryParams,
     RelationalQueryResult,
     RelationalExecuteResult,
     BlobStorageResult,
     BlobStorageUploadParams,
     BlobStorageUploadResult,
+    BlobStorageBulkUploadParams,
+    BlobStorageBulkUploadItem,
+    BlobStorageBulkUploadResult,
     BlobStorageFolderQueryParams,
     BlobStorageFolderResult,
     BlobStorageFile,
+    BlobStorageFileInfo,
+    BlobStorageFolderListResult,
+    BlobStorageFilesQueryParams,
 )
 
+from pantheon_v2.utils.type_utils import get_list_adapter
+from pantheon_v2.utils.ttl_cache import TTLCache
+from pantheon_v2.settings.settings import Settings
 from pantheon_v2.tools.core.base import BaseTool
+from pantheon_v2.tools.core.tool_registry import ToolRegistry
 
 from pantheon_v2.tools.external.postgres.tool import PostgresTool
+from pantheon_v2.tools.core.blob_reference.models import (
+    BlobReference,
+    BlobStorageProvider,
+)
 from pantheon_v2.tools.external.postgres.models import (
     QueryParams,
+    QueryOutputFormat,
     BatchInsertParams,
     UpdateParams,
+    BatchUpdateParams,
+    RowUpdate,
     TableInsert,
 )
 
 from pantheon_v2.tools.external.gcs.models import (
     UploadToGCSInput,
     DownloadFromGCSInput,
+    BulkUploadToGCSInput,
 )
 
 from pantheon_v2.tools.external.gcs.tool import GCSTool
@@ -41,23 +63,118 @@ T = TypeVar("T", bound=BaseModel)
 
 
 class InternalDataRepositoryTool(BaseTool):
+    def __init__(self):
+        # Rows of queries run with cache_ttl_seconds, tagged with their tables
+        self.query_cache = TTLCache(Settings.RELATIONAL_CACHE_MAX_ENTRIES)
+
     async def initialize(self) -> None:
-        self.postgres_tool = PostgresTool(INTERNAL_POSTGRES_CONFIG.model_dump())
-        await self.postgres_tool.initialize()
-        self.gcs_tool = GCSTool(INTERNAL_GCS_CONFIG.model_dump())
-        await self.gcs_tool.initialize()
+        self.postgres_tool = await ToolRegistry.get_tool_instance(
+            PostgresTool, INTERNAL_POSTGRES_CONFIG.model_dump()
+        )
+        self.gcs_tool = await ToolRegistry.get_tool_instance(
+            GCSTool, INTERNAL_GCS_CONFIG.model_dump()
+        )
 
     async def query_relational_data(
         self, query_params: RelationalQueryParams
     ) -> RelationalQueryResult:
+        if query_params.cache_ttl_seconds is not None:
+            return await self._query_cached(query_params)
+
         postgres_result = await self.postgres_tool.query(
-            QueryParams(**query_params.model_dump())
+            QueryParams(
+                query=query_params.query,
+                parameters=query_params.parameters,
+                stream_batch_size=query_params.stream_batch_size,
+                output_format=query_params.output_format,
+            )
         )
+
+        if query_params.output_format == QueryOutputFormat.PARQUET:
+            return RelationalQueryResult(
+                data=[],
+                row_count=postgres_result.row_count,
+                parquet_reference=await self._export_parquet(
+                    query_params, postgres_result.parquet_content
+                ),
+            )
+
         return RelationalQueryResult(
-            data=[query_params.output_model(**row) for row in postgres_result.rows],
+            data=self._to_output_models(query_params, postgres_result.rows),
             row_count=postgres_result.row_count,
         )
 
+    async def _query_cached(
+        self, query_params: RelationalQueryParams
+    ) -> RelationalQueryResult:
+        """Read-through lookup, only the raw rows are cached so callers never share models"""
+        key = (
+            query_params.query,
+            json.dumps(query_params.parameters, sort_keys=True, default=str),
+        )
+        tags = [table.lower() for table in query_params.cache_tables]
+        cached = self.query_cache.get(key)
+        if cached is None:
+            # A write landing while the query runs makes these rows stale,
+            # put then skips them instead of serving them for the whole TTL
+            generations = self.query_cache.generations(tags)
+            postgres_result = await self.postgres_tool.query(
+                QueryParams(
+                    query=query_params.query,
+                    parameters=query_params.parameters,
+                )
+            )
+            cached = (postgres_result.rows, postgres_result.row_count)
+            self.query_cache.put(
+                key,
+                cached,
+                query_params.cache_ttl_seconds,
+                tags=tags,
+                generations=generations,
+            )
+
+        rows, row_count = cached
+        return RelationalQueryResult(
+            data=self._to_output_models(query_params, rows),
+            row_count=row_count,
+        )
+
+    def _invalidate_table(self, table: str) -> None:
+        self.query_cache.invalidate_tag(table.lower())
+
+    @staticmethod
+    def _to_output_models(
+        query_params: RelationalQueryParams, rows: list[dict]
+    ) -> list[BaseModel]:
+        """Turn rows into output models, validating the whole result in one call"""
+        output_model = query_params.output_model
+        if query_params.trusted_schema:
+            return [output_model.model_construct(**row) for row in rows]
+        return get_list_adapter(output_model).validate_python(rows)
+
+    async def _export_parquet(
+        self, query_params: RelationalQueryParams, content: Optional[BytesIO]
+    ) -> Optional[BlobReference]:
+        """Upload a Parquet result and return a reference pinned to its generation"""
+        if content is None:
+            return None
+
+        result = await self.gcs_tool.upload_to_gcs(
+            UploadToGCSInput(
+                bucket_name=query_params.export_bucket_name,
+                file_name=query_params.export_file_name,
+                blob=content,
+            )
+        )
+        return BlobReference(
+            provider=BlobStorageProvider.GCS,
+            bucket_name=query_params.export_bucket_name,
+            key=query_params.export_file_name,
+            generation=result.metadata.get("generation"),
+            size=result.metadata.get("size"),
+            content_type="application/vnd.apache.parquet",
+        )
+
     async def insert_relational_data(
         self, insert_params: RelationalInsertParams
     ) -> RelationalExecuteResult:
@@ -71,6 +188,7 @@ class InternalDataRepositoryTool(BaseTool):
             )
 
         postgres_result = await self.postgres_tool.insert(insertParams)
+        self._invalidate_table(insert_params.table)
         return RelationalExecuteResult(
             success=postgres_result.success,
             affected_rows=postgres_result.affected_rows,
@@ -79,18 +197,38 @@ class InternalDataRepositoryTool(BaseTool):
     async def update_relational_data(
         self, update_params: RelationalUpdateParams
     ) -> RelationalExecuteResult:
-        update_params = UpdateParams(
-            table=update_params.table,
-            values=update_params.data,
-            where=update_params.where,
+        postgres_result = await self.postgres_tool.update(
+            UpdateParams(
+                table=update_params.table,
+                values=update_params.data,
+                where=update_params.where,
+            )
         )
-
-        postgres_result = await self.postgres_tool.update(update_params)
+        self._invalidate_table(update_params.table)
         return RelationalExecuteResult(
             success=postgres_result.success,
             affected_rows=postgres_result.affected_rows,
         )
 
+    async def batch_update_relational_data(
+        self, update_params: RelationalBatchUpdateParams
+    ) -> RelationalBatchUpdateResult:
+        postgres_result = await self.postgres_tool.batch_update(
+            BatchUpdateParams(
+                table=update_params.table,
+                updates=[
+                    RowUpdate(values=update.data, where=update.where)
+                    for update in update_params.updates
+                ],
+            )
+        )
+        self._invalidate_table(update_params.table)
+        return RelationalBatchUpdateResult(
+            success=postgres_result.success,
+            affected_rows=postgres_result.affected_rows,
+            row_counts=postgres_result.row_counts,
+        )
+
     async def query_blob_storage(
         self, query_params: BlobStorageQueryParams
     ) -> BlobStorageResult:
@@ -122,6 +260,36 @@ class InternalDataRepositoryTool(BaseTool):
             https_url=result.https_url,
         )
 
+    async def bulk_upload_to_blob_storage(
+        self, upload_params: BlobStorageBulkUploadParams
+    ) -> BlobStorageBulkUploadResult:
+        result = await self.gcs_tool.bulk_upload_to_gcs(
+            BulkUploadToGCSInput(
+                files=[
+                    UploadToGCSInput(
+                        bucket_name=file.bucket_name,
+                        file_name=file.file_name,
+                        blob=file.blob,
+                    )
+                    for file in upload_params.files
+                ]
+            )
+        )
+
+        return BlobStorageBulkUploadResult(
+            results=[
+                BlobStorageBulkUploadItem(
+                    file_name=item.file_name,
+                    success=item.success,
+                    result=BlobStorageUploadResult(**item.result.model_dump())
+                    if item.result
+                    else None,
+                    error=item.error,
+                )
+                for item in result.results
+            ]
+        )
+
     async def query_blob_storage_folder(
         self, query_params: BlobStorageFolderQueryParams
     ) -> BlobStorageFolderResult:
@@ -134,3 +302,28 @@ class InternalDataRepositoryTool(BaseTool):
                 BlobStorageFile.from_gcs_file_metadata(file) for file in result.files
             ]
         )
+
+    async def list_blob_storage_folder(
+        self, query_params: BlobStorageFolderQueryParams
+    ) -> BlobStorageFolderListResult:
+        result = await self.gcs_tool.list_folder_from_gcs(
+            query_params.bucket_name, query_params.folder_path
+        )
+
+        return BlobStorageFolderListResult(
+            files=[BlobStorageFileInfo.from_gcs_object_info(f) for f in result.files]
+        )
+
+    async def query_blob_storage_files(
+        self, query_params: BlobStorageFilesQueryParams
+    ) -> BlobStorageFolderResult:
+        result = await self.gcs_tool.download_objects_from_gcs(
+            query_params.bucket_name,
+            [file.to_gcs_object_info() for file in query_params.files],
+        )
+
+        return BlobStorageFolderResult(
+            files=[
+                BlobStorageFile.from_gcs_file_metadata(file) for file in result.files
+            ]
+        )
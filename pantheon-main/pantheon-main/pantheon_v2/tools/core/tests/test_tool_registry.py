@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from pantheon_v2.tools.core.tool_registry import ToolRegistry
 from pantheon_v2.tools.core.base import BaseTool
@@ -44,3 +45,60 @@ async def test_tool_registry_execute_tool_action_not_found():
 async def test_tool_registry_execute_tool_not_found():
     with pytest.raises(ValueError):
         await ToolRegistry.execute_tool_action("TestTool", "test_action_not_founds")
+
+
+class PooledTool(BaseTool):
+    def __init__(self, config=None):
+        self.config = config
+        self.initialize_calls = 0
+        self.cleaned_up = False
+
+    async def initialize(self):
+        self.initialize_calls += 1
+        # Yield so concurrent callers overlap with initialisation
+        await asyncio.sleep(0)
+
+    async def cleanup(self):
+        self.cleaned_up = True
+
+
+@pytest.fixture
+def clean_tool_pool():
+    yield
+    ToolRegistry._instances.clear()
+    ToolRegistry._instance_locks.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_tool_instance_reuses_instance_per_config(clean_tool_pool):
+    first = await ToolRegistry.get_tool_instance(PooledTool, {"host": "a"})
+    second = await ToolRegistry.get_tool_instance(PooledTool, {"host": "a"})
+    other = await ToolRegistry.get_tool_instance(PooledTool, {"host": "b"})
+    no_config = await ToolRegistry.get_tool_instance(PooledTool)
+
+    assert first is second
+    assert first.initialize_calls == 1
+    assert other is not first
+    assert other.config == {"host": "b"}
+    assert no_config.config is None
+
+
+@pytest.mark.asyncio
+async def test_get_tool_instance_initialises_once_under_concurrency(clean_tool_pool):
+    tools = await asyncio.gather(
+        *(ToolRegistry.get_tool_instance(PooledTool, {"host": "a"}) for _ in range(5))
+    )
+
+    assert all(tool is tools[0] for tool in tools)
+    assert tools[0].initialize_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_close_tool_instances_cleans_up_and_clears_pool(clean_tool_pool):
+    tool = await ToolRegistry.get_tool_instance(PooledTool, {"host": "a"})
+
+    await ToolRegistry.close_tool_instances()
+
+    assert tool.cleaned_up
+    new_tool = await ToolRegistry.get_tool_instance(PooledTool, {"host": "a"})
+    assert new_tool is not tool
@@ -1,10 +1,35 @@
+import asyncio
+import hashlib
+import json
 from functools import wraps
-from typing import Dict, Callable, Any
+from typing import Dict, Callable, Any, Optional, Tuple, Type, TypeVar
+
+import structlog
+from pydantic import BaseModel
+
+from pantheon_v2.tools.core.base import BaseTool
 from pantheon_v2.tools.core.models import Tool
 
+logger = structlog.get_logger(__name__)
+
+ToolT = TypeVar("ToolT", bound=BaseTool)
+
+_NO_CONFIG = object()
+
+
+def _config_key(config: Any) -> str:
+    """Stable digest of a tool config so credentials are never kept as dict keys."""
+    if isinstance(config, BaseModel):
+        serialized = config.model_dump_json()
+    else:
+        serialized = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
 
 class ToolRegistry:
     _tools: Dict[str, Tool] = {}
+    _instances: Dict[Tuple[Type[BaseTool], str], BaseTool] = {}
+    _instance_locks: Dict[Tuple[Type[BaseTool], str], asyncio.Lock] = {}
 
     @classmethod
     def register_tool(cls, description: str):
@@ -80,4 +105,56 @@ class ToolRegistry:
 
         return await tool_action(**action_params)
 
+    @classmethod
+    async def get_tool_instance(
+        cls, tool_class: Type[ToolT], config: Optional[Any] = _NO_CONFIG
+    ) -> ToolT:
+        """Return an initialised tool shared by every activity in this worker process.
+
+        Tools are created and initialised once per tool class and config, so
+        engines, storage clients and connections are reused across activity
+        invocations instead of being rebuilt on every call.
+
+        Args:
+            tool_class: Tool class to instantiate
+            config: Config passed to the tool constructor, omitted for tools without one
+
+        Returns:
+            The initialised tool instance
+        """
+        key = (tool_class, "" if config is _NO_CONFIG else _config_key(config))
+        instance = cls._instances.get(key)
+        if instance is not None:
+            return instance
+
+        lock = cls._instance_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another activity may have initialised the tool while we waited
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = tool_class() if config is _NO_CONFIG else tool_class(config)
+                await instance.initialize()
+                cls._instances[key] = instance
+                logger.info(
+                    "Initialised pooled tool instance", tool=type(instance).__name__
+                )
+        return instance
+
+    @classmethod
+    async def close_tool_instances(cls) -> None:
+        """Clean up every pooled tool instance, called on worker shutdown."""
+        instances = list(cls._instances.values())
+        cls._instances.clear()
+        cls._instance_locks.clear()
+
+        for instance in instances:
+            try:
+                await instance.cleanup()
+            except Exception as e:
+                logger.error(
+                    "Failed to clean up tool instance",
+                    tool=type(instance).__name__,
+                    error=str(e),
+                )
+
     # TODO (Giri): Add methods to get the tool actions that helps the LLM understand the tool
@@ -5,19 +5,21 @@ from pantheon_v2.tools.external.gcs.models import (
     DownloadFromGCSOutput,
     UploadToGCSInput,
     UploadToGCSOutput,
+    BulkUploadToGCSInput,
+    BulkUploadToGCSOutput,
     DownloadFolderFromGCSInput,
     DownloadFolderFromGCSOutput,
 )
 
 from pantheon_v2.tools.core.activity_registry import ActivityRegistry
+from pantheon_v2.tools.core.tool_registry import ToolRegistry
 
 
 @ActivityRegistry.register_activity("Download a file from Google Cloud Storage")
 async def download_from_gcs(
     config: GCSConfig, input: DownloadFromGCSInput
 ) -> DownloadFromGCSOutput:
-    tool = GCSTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(GCSTool, config)
     return await tool.download_from_gcs(input)
 
 
@@ -25,15 +27,23 @@ async def download_from_gcs(
 async def upload_to_gcs(
     config: GCSConfig, input: UploadToGCSInput
 ) -> UploadToGCSOutput:
-    tool = GCSTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(GCSTool, config)
     return await tool.upload_to_gcs(input)
 
 
+@ActivityRegistry.register_activity(
+    "Upload many files to Google Cloud Storage concurrently"
+)
+async def bulk_upload_to_gcs(
+    config: GCSConfig, input: BulkUploadToGCSInput
+) -> BulkUploadToGCSOutput:
+    tool = await ToolRegistry.get_tool_instance(GCSTool, config)
+    return await tool.bulk_upload_to_gcs(input)
+
+
 @ActivityRegistry.register_activity("Download a folder from Google Cloud Storage")
 async def download_folder_from_gcs(
     config: GCSConfig, input: DownloadFolderFromGCSInput
 ) -> DownloadFolderFromGCSOutput:
-    tool = GCSTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(GCSTool, config)
     return await tool.download_folder_from_gcs(input.bucket_name, input.folder_path)
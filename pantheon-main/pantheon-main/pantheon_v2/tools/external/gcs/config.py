@@ -1,5 +1,18 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
+from pantheon_v2.settings.settings import Settings
+
 
 class GCSConfig(BaseModel):
     project_id: str = Field(..., description="The GCP project ID")
+    cache_dir: Optional[str] = Field(
+        default=Settings.BLOB_CACHE_DIR or None,
+        description="Directory of the local download cache, caching is off when unset",
+    )
+    cache_max_bytes: int = Field(
+        default=Settings.BLOB_CACHE_MAX_BYTES,
+        gt=0,
+        description="Size cap of the local download cache in bytes",
+    )
@@ -1 +1,9 @@
 GCS_HTTPS_BASE_URL = "https://storage.googleapis.com"
+
+# Threads used for blocking storage calls, matching the client's HTTP connection pool
+DEFAULT_GCS_IO_WORKERS = 10
+
+# Only the object metadata needed for folder listings is requested
+GCS_LIST_FIELDS = (
+    "items(name,size,contentType,generation,timeCreated,updated),nextPageToken"
+)
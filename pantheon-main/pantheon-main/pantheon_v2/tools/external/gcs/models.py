@@ -1,5 +1,5 @@
 from io import BytesIO
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 from pantheon_v2.core.custom_data_types.pydantic import SerializableBytesIO
@@ -8,6 +8,9 @@ from pantheon_v2.core.custom_data_types.pydantic import SerializableBytesIO
 class DownloadFromGCSInput(BaseModel):
     bucket_name: str = Field(..., description="Name of the GCS bucket to download from")
     file_name: str = Field(..., description="Name of the file to download")
+    generation: Optional[int] = Field(
+        default=None, description="Generation to download, the latest if unset"
+    )
 
 
 class DownloadFromGCSOutput(BaseModel):
@@ -41,6 +44,25 @@ class UploadToGCSOutput(BaseModel):
     )
 
 
+class BulkUploadToGCSInput(BaseModel):
+    files: list[UploadToGCSInput] = Field(..., description="Files to upload")
+
+
+class BulkUploadToGCSItemResult(BaseModel):
+    file_name: str = Field(..., description="Name of the file")
+    success: bool = Field(..., description="Whether the upload succeeded")
+    result: Optional[UploadToGCSOutput] = Field(
+        default=None, description="Upload result if it succeeded"
+    )
+    error: Optional[str] = Field(default=None, description="Error if it failed")
+
+
+class BulkUploadToGCSOutput(BaseModel):
+    results: list[BulkUploadToGCSItemResult] = Field(
+        ..., description="Per-file results in the order of the input files"
+    )
+
+
 class GCSFileMetadata(BaseModel):
     name: str = Field(..., description="Name of the file")
     full_path: str = Field(..., description="Full path of the file in GCS")
@@ -57,6 +79,26 @@ class GCSFileMetadata(BaseModel):
         arbitrary_types_allowed = True
 
 
+class GCSObjectInfo(BaseModel):
+    name: str = Field(..., description="Name of the file")
+    blob_name: str = Field(..., description="Name of the object in its bucket")
+    full_path: str = Field(..., description="Full path of the file in GCS")
+    relative_path: str = Field(
+        ..., description="Path relative to the folder being listed"
+    )
+    size: int = Field(..., description="Size of the file in bytes")
+    content_type: str = Field(..., description="Content type of the file")
+    generation: int = Field(..., description="Generation of the object version")
+    created: datetime = Field(..., description="Creation timestamp")
+    updated: datetime = Field(..., description="Last update timestamp")
+
+
+class ListFolderFromGCSOutput(BaseModel):
+    files: list[GCSObjectInfo] = Field(
+        ..., description="Metadata of the files in the folder, without content"
+    )
+
+
 class DownloadFolderFromGCSOutput(BaseModel):
     message: str = Field(..., description="Status message")
     files: list[GCSFileMetadata] = Field(
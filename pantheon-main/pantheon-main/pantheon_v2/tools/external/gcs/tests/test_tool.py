@@ -2,12 +2,17 @@ import pytest
 from unittest.mock import MagicMock, patch
 from io import BytesIO
 from datetime import datetime
+import pandas as pd
 
 from pantheon_v2.tools.external.gcs.tool import GCSTool
 from pantheon_v2.tools.external.gcs.models import (
     UploadToGCSInput,
     DownloadFromGCSInput,
+    GCSObjectInfo,
+    BulkUploadToGCSInput,
 )
+from pantheon_v2.tools.external.gcs.constants import GCS_LIST_FIELDS
+from pantheon_v2.utils.blob_cache import BlobCache
 
 
 @pytest.fixture
@@ -63,7 +68,7 @@ class TestGCSTool:
         # Arrange
         mock_bucket = MagicMock()
         mock_bucket.blob.return_value = mock_gcs_blob
-        gcs_tool.storage_client.get_bucket.return_value = mock_bucket
+        gcs_tool.storage_client.bucket.return_value = mock_bucket
 
         # Set content_disposition to None to match expected metadata
         mock_gcs_blob.content_disposition = None
@@ -77,7 +82,8 @@ class TestGCSTool:
         result = await gcs_tool.upload_to_gcs(input_data)
 
         # Assert
-        gcs_tool.storage_client.get_bucket.assert_called_once_with("test-bucket")
+        gcs_tool.storage_client.bucket.assert_called_once_with("test-bucket")
+        gcs_tool.storage_client.get_bucket.assert_not_called()
         mock_bucket.blob.assert_called_once_with("test.pdf")
         mock_gcs_blob.upload_from_file.assert_called_once_with(
             test_content, content_type="application/pdf"
@@ -101,7 +107,7 @@ class TestGCSTool:
         # Arrange
         mock_bucket = MagicMock()
         mock_bucket.blob.return_value = mock_gcs_blob
-        gcs_tool.storage_client.get_bucket.return_value = mock_bucket
+        gcs_tool.storage_client.bucket.return_value = mock_bucket
 
         def mock_download(buffer):
             buffer.write(b"test content")
@@ -116,8 +122,9 @@ class TestGCSTool:
         result = await gcs_tool.download_from_gcs(input_data)
 
         # Assert
-        gcs_tool.storage_client.get_bucket.assert_called_once_with("test-bucket")
-        mock_bucket.blob.assert_called_once_with("test.pdf")
+        gcs_tool.storage_client.bucket.assert_called_once_with("test-bucket")
+        gcs_tool.storage_client.get_bucket.assert_not_called()
+        mock_bucket.blob.assert_called_once_with("test.pdf", generation=None)
         mock_gcs_blob.download_to_file.assert_called_once()
         assert result.content.getvalue() == b"test content"
 
@@ -125,7 +132,7 @@ class TestGCSTool:
     async def test_download_folder_from_gcs(self, gcs_tool, mock_gcs_blob):
         # Arrange
         mock_bucket = MagicMock()
-        gcs_tool.storage_client.get_bucket.return_value = mock_bucket
+        gcs_tool.storage_client.bucket.return_value = mock_bucket
 
         # Create two mock blobs - one file and one folder
         mock_file_blob = mock_gcs_blob
@@ -145,7 +152,8 @@ class TestGCSTool:
         result = await gcs_tool.download_folder_from_gcs("test-bucket", "test_folder")
 
         # Assert
-        gcs_tool.storage_client.get_bucket.assert_called_once_with("test-bucket")
+        gcs_tool.storage_client.bucket.assert_called_once_with("test-bucket")
+        gcs_tool.storage_client.get_bucket.assert_not_called()
         mock_bucket.list_blobs.assert_called_once_with(prefix="test_folder")
 
         assert len(result.files) == 1  # Should only include the file, not the folder
@@ -160,5 +168,144 @@ class TestGCSTool:
         assert file_metadata.content.getvalue() == b"test content"
         assert result.message == "Downloaded 1 files"
 
+    # pytest --cov=pantheon_v2/tools/ocr --cov-report=term-missing pantheon_v2/tools/ocr/tests/ -v
+
+    @pytest.mark.asyncio
+    async def test_download_from_gcs_to_file(self, gcs_tool, mock_gcs_blob):
+        """Blobs are spooled to a file handle that pandas can read directly"""
+        mock_gcs_blob.download_to_file.side_effect = lambda f: f.write(b"a,b\n1,2\n")
+        gcs_tool.storage_client.bucket.return_value.blob.return_value = mock_gcs_blob
+
+        spooled_file = await gcs_tool.download_from_gcs_to_file(
+            DownloadFromGCSInput(bucket_name="test-bucket", file_name="test.csv")
+        )
+
+        gcs_tool.storage_client.bucket.assert_called_once_with("test-bucket")
+        assert pd.read_csv(spooled_file).to_dict("list") == {"a": [1], "b": [2]}
+
+    @pytest.mark.asyncio
+    async def test_stream_from_gcs(self, gcs_tool, mock_gcs_blob):
+        reader = BytesIO(b"abcdefg")
+        mock_gcs_blob.open.return_value = reader
+        gcs_tool.storage_client.bucket.return_value.blob.return_value = mock_gcs_blob
+
+        chunks = [
+            chunk
+            async for chunk in gcs_tool.stream_from_gcs(
+                DownloadFromGCSInput(bucket_name="test-bucket", file_name="test.txt"),
+                chunk_size=3,
+            )
+        ]
+
+        assert chunks == [b"abc", b"def", b"g"]
+        mock_gcs_blob.open.assert_called_once_with("rb", chunk_size=3)
+        assert reader.closed
+
+    @pytest.mark.asyncio
+    async def test_list_folder_from_gcs(self, gcs_tool, mock_gcs_blob):
+        """Listing returns metadata only and never downloads content"""
+        mock_gcs_blob.name = "test_folder/test.pdf"
+        mock_gcs_blob.generation = 7
+        mock_folder_blob = MagicMock()
+        mock_folder_blob.name = "test_folder/"
+        mock_bucket = gcs_tool.storage_client.bucket.return_value
+        mock_bucket.list_blobs.return_value = [mock_gcs_blob, mock_folder_blob]
+
+        result = await gcs_tool.list_folder_from_gcs("test-bucket", "test_folder")
+
+        mock_bucket.list_blobs.assert_called_once_with(
+            prefix="test_folder", fields=GCS_LIST_FIELDS
+        )
+        gcs_tool.storage_client.get_bucket.assert_not_called()
+        mock_gcs_blob.download_to_file.assert_not_called()
+        assert len(result.files) == 1
+        info = result.files[0]
+        assert info.blob_name == "test_folder/test.pdf"
+        assert info.full_path == "gs://test-bucket/test_folder/test.pdf"
+        assert info.relative_path == "test.pdf"
+        assert info.generation == 7
+        assert info.size == 1234
+
+    @pytest.mark.asyncio
+    async def test_download_objects_from_gcs(self, gcs_tool):
+        """Selected objects are downloaded at their listed generation, in order"""
+        infos = [
+            GCSObjectInfo(
+                name=f"{name}.pdf",
+                blob_name=f"folder/{name}.pdf",
+                full_path=f"gs://test-bucket/folder/{name}.pdf",
+                relative_path=f"{name}.pdf",
+                size=3,
+                content_type="application/pdf",
+                generation=generation,
+                created=datetime(2024, 1, 1),
+                updated=datetime(2024, 1, 2),
+            )
+            for name, generation in [("b", 2), ("a", 1)]
+        ]
+
+        def make_blob(blob_name, generation):
+            blob = MagicMock()
+            blob.download_to_file.side_effect = lambda f: f.write(blob_name.encode())
+            return blob
+
+        mock_bucket = gcs_tool.storage_client.bucket.return_value
+        mock_bucket.blob.side_effect = make_blob
+
+        result = await gcs_tool.download_objects_from_gcs("test-bucket", infos)
+
+        mock_bucket.blob.assert_any_call("folder/b.pdf", generation=2)
+        mock_bucket.blob.assert_any_call("folder/a.pdf", generation=1)
+        assert [f.name for f in result.files] == ["b.pdf", "a.pdf"]
+        assert result.files[1].content.getvalue() == b"folder/a.pdf"
 
-# pytest --cov=pantheon_v2/tools/ocr --cov-report=term-missing pantheon_v2/tools/ocr/tests/ -v
+    @pytest.mark.asyncio
+    async def test_download_from_gcs_uses_local_cache(self, gcs_tool, tmp_path):
+        """Unchanged blobs are served from the cache after one metadata request"""
+        gcs_tool.blob_cache = BlobCache(str(tmp_path), max_size_bytes=1024)
+        mock_blob = MagicMock()
+        mock_blob.name = "test.pdf"
+        mock_blob.generation = 5
+        mock_blob.download_to_file.side_effect = lambda f: f.write(b"pdf content")
+        mock_bucket = gcs_tool.storage_client.bucket.return_value
+        mock_bucket.get_blob.return_value = mock_blob
+        params = DownloadFromGCSInput(bucket_name="test-bucket", file_name="test.pdf")
+
+        first = await gcs_tool.download_from_gcs(params)
+        second = await gcs_tool.download_from_gcs(params)
+
+        assert first.content.getvalue() == b"pdf content"
+        assert second.content.getvalue() == b"pdf content"
+        mock_blob.download_to_file.assert_called_once()
+        assert mock_bucket.get_blob.call_count == 2
+        assert gcs_tool.blob_cache.stats.hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_bulk_upload_to_gcs(self, gcs_tool):
+        """Every file is uploaded and failures are reported per file"""
+
+        def make_blob(name):
+            blob = MagicMock()
+            blob.size = 7
+            if name == "bad.pdf":
+                blob.upload_from_file.side_effect = Exception("Forbidden")
+            return blob
+
+        gcs_tool.storage_client.bucket.return_value.blob.side_effect = make_blob
+        files = [
+            UploadToGCSInput(
+                bucket_name="test-bucket", file_name=name, blob=BytesIO(b"content")
+            )
+            for name in ["a.pdf", "bad.pdf", "c.pdf"]
+        ]
+
+        result = await gcs_tool.bulk_upload_to_gcs(BulkUploadToGCSInput(files=files))
+
+        assert [item.file_name for item in result.results] == [
+            "a.pdf",
+            "bad.pdf",
+            "c.pdf",
+        ]
+        assert [item.success for item in result.results] == [True, False, True]
+        assert result.results[2].result.gcs_url == "gs://test-bucket/c.pdf"
+        assert result.results[1].error == "Forbidden"
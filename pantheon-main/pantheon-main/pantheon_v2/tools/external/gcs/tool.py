@@ -1,21 +1,39 @@
 import structlog
 import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from google.api_core.exceptions import NotFound
 from google.cloud import storage
 from io import BytesIO
 import mimetypes
+from tempfile import SpooledTemporaryFile
+from typing import Any, AsyncIterator, Callable
 
 from pantheon_v2.tools.external.gcs.models import (
     DownloadFromGCSInput,
     DownloadFromGCSOutput,
     UploadToGCSInput,
     UploadToGCSOutput,
+    BulkUploadToGCSInput,
+    BulkUploadToGCSItemResult,
+    BulkUploadToGCSOutput,
     DownloadFolderFromGCSOutput,
     GCSFileMetadata,
+    GCSObjectInfo,
+    ListFolderFromGCSOutput,
 )
 from pantheon_v2.tools.core.base import BaseTool
 from pantheon_v2.tools.core.tool_registry import ToolRegistry
 from pantheon_v2.tools.external.gcs.config import GCSConfig
-from pantheon_v2.tools.external.gcs.constants import GCS_HTTPS_BASE_URL
+from pantheon_v2.tools.external.gcs.constants import (
+    GCS_HTTPS_BASE_URL,
+    GCS_LIST_FIELDS,
+    DEFAULT_GCS_IO_WORKERS,
+)
+from pantheon_v2.utils.async_utils import bounded_as_completed
+from pantheon_v2.utils.blob_cache import get_blob_cache
+from pantheon_v2.utils.file_utils import STREAM_CHUNK_SIZE, new_spooled_file
 
 logger = structlog.get_logger(__name__)
 
@@ -24,7 +42,12 @@ logger = structlog.get_logger(__name__)
 class GCSTool(BaseTool):
     def __init__(self, config: dict):
         self.storage_client = None
+        self.blob_cache = None
         self.config = config
+        # The storage client is synchronous, streamed reads run on these threads
+        self.thread_pool = ThreadPoolExecutor(
+            max_workers=DEFAULT_GCS_IO_WORKERS, thread_name_prefix="gcs-io"
+        )
 
     async def initialize(self) -> None:
         """Initialize the GCS client asynchronously"""
@@ -32,32 +55,100 @@ class GCSTool(BaseTool):
             config = GCSConfig(**self.config)
 
             self.storage_client = storage.Client(config.project_id)
+            if config.cache_dir:
+                self.blob_cache = get_blob_cache(
+                    config.cache_dir, config.cache_max_bytes
+                )
             logger.info("GCS tool initialized successfully")
         except Exception as e:
             logger.error("Failed to initialize GCS tool", error=str(e))
             raise
 
+    async def cleanup(self) -> None:
+        """Close the GCS client's HTTP session"""
+        if self.storage_client is not None:
+            self.storage_client.close()
+            self.storage_client = None
+        self.thread_pool.shutdown(wait=True)
+
+    async def _run_io(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking storage call on the tool's I/O thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.thread_pool, partial(func, *args, **kwargs)
+        )
+
+    def _spool_blob(self, bucket_name: str, file_name: str) -> SpooledTemporaryFile:
+        """Download a blob into a spooled file, the client writes it in chunks"""
+        blob = self.storage_client.bucket(bucket_name).blob(file_name)
+        spooled_file = new_spooled_file()
+        blob.download_to_file(spooled_file)
+        spooled_file.seek(0)
+        return spooled_file
+
     @ToolRegistry.register_tool_action(
         description="Download a file from Google Cloud Storage"
     )
     async def download_from_gcs(
         self, params: DownloadFromGCSInput
     ) -> DownloadFromGCSOutput:
-        bucket = self.storage_client.get_bucket(params.bucket_name)
-        blob = bucket.blob(params.file_name)
+        if self.blob_cache is not None and params.generation is None:
+            # One metadata request tells whether the cached copy is current
+            blob = await self._run_io(
+                self.storage_client.bucket(params.bucket_name).get_blob,
+                params.file_name,
+            )
+            if blob is None:
+                raise NotFound(
+                    f"gs://{params.bucket_name}/{params.file_name} does not exist"
+                )
+            bytes_buffer = await self._run_io(
+                self._read_blob_cached, params.bucket_name, blob
+            )
+            return DownloadFromGCSOutput(content=bytes_buffer)
 
-        # Create an in-memory file-like object
-        bytes_buffer = BytesIO()
-        blob.download_to_file(bytes_buffer)
-        bytes_buffer.seek(0)  # Move to the beginning of the file-like object
+        # bucket() only builds a reference, the download is the single request
+        bucket = self.storage_client.bucket(params.bucket_name)
+        blob = bucket.blob(params.file_name, generation=params.generation)
+        # A known generation needs no metadata request to use the cache
+        bytes_buffer = await self._run_io(
+            self._read_blob_cached, params.bucket_name, blob
+        )
 
         return DownloadFromGCSOutput(content=bytes_buffer)
 
+    async def stream_from_gcs(
+        self, params: DownloadFromGCSInput, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Yield a blob's content in chunks without holding it in memory"""
+        blob = self.storage_client.bucket(params.bucket_name).blob(params.file_name)
+        reader = await self._run_io(blob.open, "rb", chunk_size=chunk_size)
+        try:
+            while chunk := await self._run_io(reader.read, chunk_size):
+                yield chunk
+        finally:
+            reader.close()
+
+    @ToolRegistry.register_tool_action(
+        description="Download a file from Google Cloud Storage into a spooled temporary file"
+    )
+    async def download_from_gcs_to_file(
+        self, params: DownloadFromGCSInput
+    ) -> SpooledTemporaryFile:
+        """
+        Download a blob into a file that stays in memory while small and
+        spills to disk when large. The handle can be passed to pandas or PDF
+        readers directly, or to any SerializableBytesIO field.
+        """
+        return await self._run_io(
+            self._spool_blob, params.bucket_name, params.file_name
+        )
+
     @ToolRegistry.register_tool_action(
         description="Upload a file to Google Cloud Storage"
     )
     async def upload_to_gcs(self, params: UploadToGCSInput) -> UploadToGCSOutput:
-        bucket = self.storage_client.get_bucket(params.bucket_name)
+        bucket = self.storage_client.bucket(params.bucket_name)
         gcs_blob = bucket.blob(params.file_name)
 
         if params.preview_enabled:
@@ -72,8 +163,12 @@ class GCSTool(BaseTool):
 
         # Use the existing BytesIO object directly
         params.blob.seek(0)  # Ensure we're at the start of the BytesIO object
-        gcs_blob.upload_from_file(params.blob, content_type=content_type)
+        await self._run_io(
+            gcs_blob.upload_from_file, params.blob, content_type=content_type
+        )
 
+        # The upload response already carries the object resource, so the
+        # blob's properties are current without a reload
         metadata = {
             "bucket": params.bucket_name,
             "name": params.file_name,
@@ -92,6 +187,115 @@ class GCSTool(BaseTool):
             metadata=metadata, gcs_url=gcs_url, https_url=https_url
         )
 
+    async def _upload_item(
+        self, item: tuple[int, UploadToGCSInput]
+    ) -> tuple[int, BulkUploadToGCSItemResult]:
+        """Upload one file of a bulk upload, reporting failure instead of raising"""
+        index, params = item
+        try:
+            result = await self.upload_to_gcs(params)
+        except Exception as e:
+            logger.error(
+                "Failed to upload file", file_name=params.file_name, error=str(e)
+            )
+            return index, BulkUploadToGCSItemResult(
+                file_name=params.file_name, success=False, error=str(e)
+            )
+        return index, BulkUploadToGCSItemResult(
+            file_name=params.file_name, success=True, result=result
+        )
+
+    @ToolRegistry.register_tool_action(
+        description="Upload many files to Google Cloud Storage concurrently"
+    )
+    async def bulk_upload_to_gcs(
+        self,
+        params: BulkUploadToGCSInput,
+        max_concurrency: int = DEFAULT_GCS_IO_WORKERS,
+    ) -> BulkUploadToGCSOutput:
+        """Uploads all files concurrently and returns a result per file, in input order"""
+        results = [None] * len(params.files)
+        async for index, result in bounded_as_completed(
+            enumerate(params.files), self._upload_item, max_concurrency
+        ):
+            results[index] = result
+
+        return BulkUploadToGCSOutput(results=results)
+
+    def _read_blob(self, blob) -> BytesIO:
+        """Download a blob into memory"""
+        bytes_buffer = BytesIO()
+        blob.download_to_file(bytes_buffer)
+        bytes_buffer.seek(0)  # Move to the beginning of the file-like object
+        return bytes_buffer
+
+    def _read_blob_cached(self, bucket_name: str, blob) -> BytesIO:
+        """Read a blob of known generation, from the local cache when it holds it"""
+        if self.blob_cache is None or blob.generation is None:
+            return self._read_blob(blob)
+
+        key = f"gs://{bucket_name}/{blob.name}"
+        version = str(blob.generation)
+        content = self.blob_cache.get(key, version)
+        if content is not None:
+            logger.info(
+                "Served blob from local cache",
+                key=key,
+                hit_rate=self.blob_cache.stats.hit_rate,
+            )
+            return BytesIO(content)
+
+        # The blob carries its generation, so the download is pinned to it
+        bytes_buffer = self._read_blob(blob)
+        self.blob_cache.put(key, version, bytes_buffer.getvalue())
+        return bytes_buffer
+
+    async def _download_folder_blob(
+        self, bucket_name: str, folder_path: str, blob
+    ) -> GCSFileMetadata:
+        """Download one listed blob of a folder with its metadata"""
+        bytes_buffer = await self._run_io(self._read_blob_cached, bucket_name, blob)
+
+        # Extract relative path by removing the folder_path prefix
+        relative_path = blob.name.replace(folder_path, "").lstrip("/")
+        full_path = f"gs://{bucket_name}/{blob.name}"
+
+        return GCSFileMetadata(
+            name=os.path.basename(blob.name),
+            full_path=full_path,
+            relative_path=relative_path,
+            size=blob.size,
+            content_type=blob.content_type,
+            created=blob.time_created,
+            updated=blob.updated,
+            content=bytes_buffer,
+        )
+
+    async def iter_folder_from_gcs(
+        self,
+        bucket_name: str,
+        folder_path: str,
+        max_concurrency: int = DEFAULT_GCS_IO_WORKERS,
+    ) -> AsyncIterator[GCSFileMetadata]:
+        """
+        Yield the files of a GCS folder as their downloads finish.
+
+        Listing follows pagination and at most max_concurrency blobs are
+        downloaded or waiting to be consumed at once, so memory stays bounded
+        however large the folder is.
+        """
+        bucket = self.storage_client.bucket(bucket_name)
+        # The blob iterator fetches further pages lazily, so drain it off the event loop
+        blobs = await self._run_io(lambda: list(bucket.list_blobs(prefix=folder_path)))
+        blobs = [blob for blob in blobs if not blob.name.endswith("/")]
+
+        async for file in bounded_as_completed(
+            blobs,
+            partial(self._download_folder_blob, bucket_name, folder_path),
+            max_concurrency,
+        ):
+            yield file
+
     @ToolRegistry.register_tool_action(
         description="Download a folder from Google Cloud Storage"
     )
@@ -101,36 +305,84 @@ class GCSTool(BaseTool):
         folder_path: str,
     ) -> DownloadFolderFromGCSOutput:
         """Downloads all contents of a GCS folder and returns array of BytesIO objects with metadata"""
-        bucket = self.storage_client.get_bucket(bucket_name)
-        blobs = bucket.list_blobs(prefix=folder_path)
-
-        downloaded_files = []
-        for blob in blobs:
-            if blob.name.endswith("/"):  # Skip folder markers
-                continue
-
-            # Create BytesIO object for the file
-            bytes_buffer = BytesIO()
-            blob.download_to_file(bytes_buffer)
-            bytes_buffer.seek(0)  # Move to the beginning of the file-like object
-
-            # Extract relative path by removing the folder_path prefix
-            relative_path = blob.name.replace(folder_path, "").lstrip("/")
-            full_path = f"gs://{bucket_name}/{blob.name}"
-
-            # Create metadata object
-            metadata = GCSFileMetadata(
-                name=os.path.basename(blob.name),
-                full_path=full_path,
-                relative_path=relative_path,
-                size=blob.size,
-                content_type=blob.content_type,
-                created=blob.time_created,
-                updated=blob.updated,
-                content=bytes_buffer,
-            )
+        downloaded_files = [
+            file async for file in self.iter_folder_from_gcs(bucket_name, folder_path)
+        ]
+        # Downloads finish out of order, keep the listing order
+        downloaded_files.sort(key=lambda file: file.full_path)
+
+        return DownloadFolderFromGCSOutput(
+            message=f"Downloaded {len(downloaded_files)} files", files=downloaded_files
+        )
 
-            downloaded_files.append(metadata)
+    def _object_info(self, bucket_name: str, folder_path: str, blob) -> GCSObjectInfo:
+        """Build listing metadata for a blob"""
+        return GCSObjectInfo(
+            name=os.path.basename(blob.name),
+            blob_name=blob.name,
+            full_path=f"gs://{bucket_name}/{blob.name}",
+            relative_path=blob.name.replace(folder_path, "").lstrip("/"),
+            size=blob.size,
+            content_type=blob.content_type or "application/octet-stream",
+            generation=blob.generation,
+            created=blob.time_created,
+            updated=blob.updated,
+        )
+
+    @ToolRegistry.register_tool_action(
+        description="List the files of a Google Cloud Storage folder without downloading them"
+    )
+    async def list_folder_from_gcs(
+        self, bucket_name: str, folder_path: str
+    ) -> ListFolderFromGCSOutput:
+        """Returns metadata of every file in a folder, one request per page of objects"""
+        bucket = self.storage_client.bucket(bucket_name)
+        blobs = await self._run_io(
+            lambda: list(bucket.list_blobs(prefix=folder_path, fields=GCS_LIST_FIELDS))
+        )
+
+        return ListFolderFromGCSOutput(
+            files=[
+                self._object_info(bucket_name, folder_path, blob)
+                for blob in blobs
+                if not blob.name.endswith("/")  # Skip folder markers
+            ]
+        )
+
+    async def _download_listed_object(
+        self, bucket_name: str, info: GCSObjectInfo
+    ) -> GCSFileMetadata:
+        """Download a listed object, pinned to the generation it was listed at"""
+        blob = self.storage_client.bucket(bucket_name).blob(
+            info.blob_name, generation=info.generation
+        )
+        bytes_buffer = await self._run_io(self._read_blob_cached, bucket_name, blob)
+
+        return GCSFileMetadata(
+            **info.model_dump(exclude={"blob_name", "generation"}),
+            content=bytes_buffer,
+        )
+
+    @ToolRegistry.register_tool_action(
+        description="Download selected files from Google Cloud Storage"
+    )
+    async def download_objects_from_gcs(
+        self,
+        bucket_name: str,
+        objects: list[GCSObjectInfo],
+        max_concurrency: int = DEFAULT_GCS_IO_WORKERS,
+    ) -> DownloadFolderFromGCSOutput:
+        """Downloads only the given objects concurrently, keeping their order"""
+        downloaded_files = [
+            file
+            async for file in bounded_as_completed(
+                objects,
+                partial(self._download_listed_object, bucket_name),
+                max_concurrency,
+            )
+        ]
+        order = {info.full_path: index for index, info in enumerate(objects)}
+        downloaded_files.sort(key=lambda file: order[file.full_path])
 
         return DownloadFolderFromGCSOutput(
             message=f"Downloaded {len(downloaded_files)} files", files=downloaded_files
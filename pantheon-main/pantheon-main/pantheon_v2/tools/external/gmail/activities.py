@@ -6,14 +6,14 @@ from pantheon_v2.tools.external.gmail.models import (
 )
 from pantheon_v2.tools.external.gmail.config import GmailConfig
 from pantheon_v2.tools.core.activity_registry import ActivityRegistry
+from pantheon_v2.tools.core.tool_registry import ToolRegistry
 
 
 @ActivityRegistry.register_activity("Search for Gmail messages with various filters")
 async def search_messages(
     config: GmailConfig, params: GmailSearchParams
 ) -> GmailResponse:
-    tool = GmailTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(GmailTool, config)
     return await tool.search_messages(params)
 
 
@@ -21,6 +21,5 @@ async def search_messages(
     "Get a specific Gmail message EML content by its ID"
 )
 async def get_message_eml(config: GmailConfig, params: GmailGetMessageParams) -> bytes:
-    tool = GmailTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(GmailTool, config)
     return await tool.get_message_eml(params)
@@ -39,6 +39,12 @@ class GmailTool(BaseTool):
             logger.error("Failed to initialize Gmail tool", error=str(e))
             raise
 
+    async def cleanup(self) -> None:
+        """Close the Gmail service's HTTP connection"""
+        if self.service is not None:
+            self.service.close()
+            self.service = None
+
     async def _get_gmail_service(self, config: GmailConfig):
         """Initialize Gmail API service using JSON token data directly"""
         try:
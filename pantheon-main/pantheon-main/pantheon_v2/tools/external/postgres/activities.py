@@ -4,28 +4,38 @@ from pantheon_v2.tools.external.postgres.models import (
     QueryParams,
     BatchInsertParams,
     UpdateParams,
+    BatchUpdateParams,
     QueryResult,
     ExecuteResult,
+    BatchUpdateResult,
 )
 from pantheon_v2.tools.core.activity_registry import ActivityRegistry
+from pantheon_v2.tools.core.tool_registry import ToolRegistry
 
 
 @ActivityRegistry.register_activity("Execute a SELECT query on the PostgreSQL database")
 async def query(config: PostgresConfig, params: QueryParams) -> QueryResult:
-    tool = PostgresTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(PostgresTool, config)
     return await tool.query(params)
 
 
 @ActivityRegistry.register_activity("Insert data into the PostgreSQL database")
 async def insert(config: PostgresConfig, params: BatchInsertParams) -> ExecuteResult:
-    tool = PostgresTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(PostgresTool, config)
     return await tool.insert(params)
 
 
 @ActivityRegistry.register_activity("Update data in the PostgreSQL database")
 async def update(config: PostgresConfig, params: UpdateParams) -> ExecuteResult:
-    tool = PostgresTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(PostgresTool, config)
     return await tool.update(params)
+
+
+@ActivityRegistry.register_activity(
+    "Apply many updates to a PostgreSQL table in one transaction"
+)
+async def batch_update(
+    config: PostgresConfig, params: BatchUpdateParams
+) -> BatchUpdateResult:
+    tool = await ToolRegistry.get_tool_instance(PostgresTool, config)
+    return await tool.batch_update(params)
@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
 
+from pantheon_v2.settings.settings import Settings
+
 
 class PostgresConfig(BaseModel):
     host: str = Field(..., description="Database host")
@@ -19,3 +21,11 @@ class PostgresConfig(BaseModel):
     pool_recycle: int = Field(
         3600, description="Seconds after which a connection is automatically recycled"
     )
+    pool_pre_ping: bool = Field(
+        True,
+        description="Check connections with a cheap round-trip before handing them out",
+    )
+    slow_query_threshold_ms: int = Field(
+        default=Settings.DB_SLOW_QUERY_THRESHOLD_MS,
+        description="Statements taking at least this long are logged as slow queries",
+    )
@@ -0,0 +1,29 @@
+import pyarrow as pa
+
+# asyncpg sends parameters in a 16-bit count, larger multi-row inserts are split
+MAX_QUERY_PARAMETERS = 32767
+
+# Rows fetched per round-trip when a query streams through a server-side cursor
+DEFAULT_STREAM_BATCH_SIZE = 10000
+
+# Arrow types of the Postgres type OIDs reported in cursor descriptions by
+# asyncpg. Types missing here, such as uuid, numeric, json or arrays, are
+# written as strings since their values have no single fixed Arrow type.
+POSTGRES_ARROW_TYPES = {
+    16: pa.bool_(),  # bool
+    17: pa.binary(),  # bytea
+    19: pa.string(),  # name
+    20: pa.int64(),  # int8
+    21: pa.int16(),  # int2
+    23: pa.int32(),  # int4
+    25: pa.string(),  # text
+    26: pa.int64(),  # oid
+    700: pa.float32(),  # float4
+    701: pa.float64(),  # float8
+    1042: pa.string(),  # bpchar
+    1043: pa.string(),  # varchar
+    1082: pa.date32(),  # date
+    1083: pa.time64("us"),  # time
+    1114: pa.timestamp("us"),  # timestamp
+    1184: pa.timestamp("us", tz="UTC"),  # timestamptz
+}
@@ -1,12 +1,30 @@
+from enum import Enum
 from pydantic import BaseModel, Field
 from typing import Any, Dict, List, Optional, Union
 
+from pantheon_v2.core.custom_data_types.pydantic import SerializableBytesIO
+
+
+class QueryOutputFormat(str, Enum):
+    ROWS = "rows"
+    PARQUET = "parquet"
+
 
 class QueryParams(BaseModel):
     query: str = Field(..., description="SQL query to execute")
     parameters: Optional[Dict[str, Any]] = Field(
         None, description="Query parameters for parameterized queries"
     )
+    stream_batch_size: Optional[int] = Field(
+        None,
+        gt=0,
+        description="Fetch through a server-side cursor in batches of this many rows. "
+        "Parquet output always streams",
+    )
+    output_format: QueryOutputFormat = Field(
+        QueryOutputFormat.ROWS,
+        description="Return rows as dicts, or the whole result as Parquet content",
+    )
 
 
 class InsertParams(BaseModel):
@@ -22,15 +40,45 @@ class UpdateParams(BaseModel):
     where: Dict[str, Any] = Field(..., description="Where clause conditions")
 
 
+class RowUpdate(BaseModel):
+    """Values to set on the rows matching where"""
+
+    values: Dict[str, Any] = Field(..., description="Values to update")
+    where: Dict[str, Any] = Field(..., description="Where clause conditions")
+
+
+class BatchUpdateParams(BaseModel):
+    """Parameters for applying many updates to one table in a single transaction"""
+
+    table: str = Field(..., description="Table name to update")
+    updates: List[RowUpdate] = Field(..., description="Updates to apply, in order")
+
+
 class QueryResult(BaseModel):
     columns: List[str]
     rows: List[Dict[str, Any]]
     row_count: int
+    parquet_content: Optional[SerializableBytesIO] = Field(
+        None, description="Result as Parquet, set instead of rows for Parquet output"
+    )
 
 
 class ExecuteResult(BaseModel):
     success: bool
     affected_rows: int
+    returned_rows: Optional[List[Dict[str, Any]]] = Field(
+        None,
+        description="Rows of the RETURNING clause in the order of the operations, "
+        "if columns were requested",
+    )
+
+
+class BatchUpdateResult(BaseModel):
+    success: bool
+    affected_rows: int
+    row_counts: List[int] = Field(
+        ..., description="Rows affected by each update, in the order of the updates"
+    )
 
 
 class TableInsert(BaseModel):
@@ -46,3 +94,7 @@ class BatchInsertParams(BaseModel):
     operations: List[TableInsert] = Field(
         ..., description="List of insert operations to perform"
     )
+    returning: Optional[List[str]] = Field(
+        None,
+        description="Columns, such as generated keys, to return for every inserted row",
+    )
@@ -1,16 +1,45 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from pantheon_v2.tools.external.postgres.tool import PostgresTool
 from pantheon_v2.tools.external.postgres.models import (
     QueryParams,
     BatchInsertParams,
     UpdateParams,
+    BatchUpdateParams,
     QueryResult,
     ExecuteResult,
+    BatchUpdateResult,
 )
 
 
+def _stream_result(columns, partitions, type_codes=None):
+    """Mock of an AsyncResult returned by session.stream"""
+
+    async def iterate():
+        for partition in partitions:
+            yield partition
+
+    result = MagicMock()
+    result.keys.return_value = columns
+    result.partitions.return_value = iterate()
+    result._real_result.cursor.description = (
+        [
+            (name, type_code, None, None, None, None, None)
+            for name, type_code in zip(columns, type_codes)
+        ]
+        if type_codes
+        else None
+    )
+    return result
+
+
 @pytest.fixture
 def mock_tool():
     tool = PostgresTool({})
@@ -64,6 +93,93 @@ class TestPostgresActions:
         assert result.rows == []
         assert result.row_count == 0
 
+    @pytest.mark.asyncio
+    async def test_query_streamed_fetches_in_batches(self, mock_tool):
+        mock_session = AsyncMock()
+        mock_session.__aenter__.return_value = mock_session
+        mock_session.stream.return_value = _stream_result(
+            ["id", "name"], [[(1, "a"), (2, "b")], [(3, "c")]]
+        )
+        mock_tool.async_session.return_value = mock_session
+
+        result = await mock_tool.query(
+            QueryParams(query="SELECT * FROM test", stream_batch_size=2)
+        )
+
+        assert result.rows == [
+            {"id": 1, "name": "a"},
+            {"id": 2, "name": "b"},
+            {"id": 3, "name": "c"},
+        ]
+        assert result.row_count == 3
+        mock_session.stream.return_value.partitions.assert_called_once_with(2)
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_query_parquet_output(self, mock_tool):
+        mock_session = AsyncMock()
+        mock_session.__aenter__.return_value = mock_session
+        mock_session.stream.return_value = _stream_result(
+            ["id", "amount"], [[(1, 1.5), (2, None)], [(3, 2.5)]], [23, 701]
+        )
+        mock_tool.async_session.return_value = mock_session
+
+        result = await mock_tool.query(
+            QueryParams(query="SELECT * FROM test", output_format="parquet")
+        )
+
+        assert result.rows == []
+        assert result.row_count == 3
+        assert result.columns == ["id", "amount"]
+        table = pq.read_table(result.parquet_content)
+        assert table.to_pydict() == {"id": [1, 2, 3], "amount": [1.5, None, 2.5]}
+
+    @pytest.mark.asyncio
+    async def test_query_parquet_output_types_from_description(self, mock_tool):
+        mock_session = AsyncMock()
+        mock_session.__aenter__.return_value = mock_session
+        first_id = uuid.UUID("7c9e6679-7425-40de-944b-e07fc1f90ae7")
+        second_id = uuid.UUID("16fd2706-8baf-433b-82eb-8c7fd11b9fa2")
+        # uuid and numeric columns with a NULL-only first batch and a numeric
+        # scale changing between batches
+        mock_session.stream.return_value = _stream_result(
+            ["id", "amount", "approved_at"],
+            [
+                [(first_id, Decimal("1.5"), None)],
+                [(second_id, Decimal("2.125"), datetime(2024, 1, 2, 3, 4, 5))],
+            ],
+            [2950, 1700, 1114],
+        )
+        mock_tool.async_session.return_value = mock_session
+
+        result = await mock_tool.query(
+            QueryParams(query="SELECT * FROM test", output_format="parquet")
+        )
+
+        table = pq.read_table(result.parquet_content)
+        assert table.schema.field("id").type == pa.string()
+        assert table.schema.field("amount").type == pa.string()
+        assert table.schema.field("approved_at").type == pa.timestamp("us")
+        assert table.to_pydict() == {
+            "id": [str(first_id), str(second_id)],
+            "amount": ["1.5", "2.125"],
+            "approved_at": [None, datetime(2024, 1, 2, 3, 4, 5)],
+        }
+
+    @pytest.mark.asyncio
+    async def test_query_parquet_output_without_rows(self, mock_tool):
+        mock_session = AsyncMock()
+        mock_session.__aenter__.return_value = mock_session
+        mock_session.stream.return_value = _stream_result(["id"], [])
+        mock_tool.async_session.return_value = mock_session
+
+        result = await mock_tool.query(
+            QueryParams(query="SELECT * FROM test", output_format="parquet")
+        )
+
+        assert result.row_count == 0
+        assert result.parquet_content is None
+
     async def test_insert_single_record(self, mock_tool):
         # Mock setup
         mock_session = AsyncMock()
@@ -95,7 +211,7 @@ class TestPostgresActions:
         # Mock setup
         mock_session = AsyncMock()
         mock_result = MagicMock()
-        mock_result.rowcount = 1
+        mock_result.rowcount = 2
 
         mock_transaction = AsyncMock()
         mock_transaction.__aenter__.return_value = mock_transaction
@@ -118,7 +234,151 @@ class TestPostgresActions:
         assert isinstance(result, ExecuteResult)
         assert result.success is True
         assert result.affected_rows == 2
-        assert mock_session.execute.call_count == 2
+        # Rows with the same table and columns go out as one statement
+        mock_session.execute.assert_called_once()
+        query, parameters = mock_session.execute.call_args.args
+        assert str(query) == (
+            'INSERT INTO test_table ("name", "value") '
+            "VALUES (:p0_0, :p0_1), (:p1_0, :p1_1)"
+        )
+        assert parameters == {
+            "p0_0": "test1",
+            "p0_1": 123,
+            "p1_0": "test2",
+            "p1_1": 456,
+        }
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_insert_merges_consecutive_rows(self, mock_tool):
+        mock_session = AsyncMock()
+
+        def returning(*ids):
+            result = MagicMock()
+            result.rowcount = -1
+            result.mappings.return_value = [{"id": id} for id in ids]
+            return result
+
+        mock_session.__aenter__.return_value = mock_session
+        mock_session.begin.return_value = AsyncMock()
+        # Each statement returns the ids of its own rows, in VALUES order
+        mock_session.execute.side_effect = [
+            returning("x", "z"),
+            returning("w"),
+            returning("y"),
+        ]
+        mock_tool.async_session.return_value = mock_session
+
+        params = BatchInsertParams(
+            operations=[
+                {"table": "a", "values": {"name": "x"}},
+                {"table": "a", "values": {"name": "z"}},
+                {"table": "a", "values": {"name": "w", "value": 1}},
+                {"table": "b", "values": {"name": "y"}},
+            ],
+            returning=["id"],
+        )
+        result = await mock_tool.insert(params)
+
+        queries = [str(call.args[0]) for call in mock_session.execute.call_args_list]
+        assert queries == [
+            'INSERT INTO a ("name") VALUES (:p0_0), (:p1_0) RETURNING "id"',
+            'INSERT INTO a ("name", "value") VALUES (:p0_0, :p0_1) RETURNING "id"',
+            'INSERT INTO b ("name") VALUES (:p0_0) RETURNING "id"',
+        ]
+        # Row counts fall back to the rows sent when the driver reports none
+        assert result.affected_rows == 4
+        assert result.returned_rows == [
+            {"id": "x"},
+            {"id": "z"},
+            {"id": "w"},
+            {"id": "y"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_insert_keeps_order_of_interleaved_tables(self, mock_tool):
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.rowcount = -1
+
+        mock_session.__aenter__.return_value = mock_session
+        mock_session.begin.return_value = AsyncMock()
+        mock_session.execute.return_value = mock_result
+        mock_tool.async_session.return_value = mock_session
+
+        # The child row references the second parent, which must be inserted
+        # before it rather than merged with the first
+        params = BatchInsertParams(
+            operations=[
+                {"table": "parents", "values": {"id": "A1"}},
+                {"table": "children", "values": {"id": "B1", "parent_id": "A2"}},
+                {"table": "parents", "values": {"id": "A2"}},
+            ]
+        )
+        result = await mock_tool.insert(params)
+
+        statements = [
+            (str(call.args[0]), call.args[1])
+            for call in mock_session.execute.call_args_list
+        ]
+        assert statements == [
+            ('INSERT INTO parents ("id") VALUES (:p0_0)', {"p0_0": "A1"}),
+            (
+                'INSERT INTO children ("id", "parent_id") VALUES (:p0_0, :p0_1)',
+                {"p0_0": "B1", "p0_1": "A2"},
+            ),
+            ('INSERT INTO parents ("id") VALUES (:p0_0)', {"p0_0": "A2"}),
+        ]
+        assert result.affected_rows == 3
+
+    @pytest.mark.asyncio
+    async def test_insert_rejects_missing_returned_rows(self, mock_tool):
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.rowcount = 1
+        mock_result.mappings.return_value = [{"id": 1}]
+
+        mock_session.__aenter__.return_value = mock_session
+        mock_transaction = AsyncMock()
+        mock_session.begin.return_value = mock_transaction
+        mock_session.execute.return_value = mock_result
+        mock_tool.async_session.return_value = mock_session
+
+        with pytest.raises(ValueError, match="returned 1 rows for 2 inserted"):
+            await mock_tool.insert(
+                BatchInsertParams(
+                    operations=[
+                        {"table": "a", "values": {"name": "x"}},
+                        {"table": "a", "values": {"name": "y"}},
+                    ],
+                    returning=["id"],
+                )
+            )
+
+        mock_transaction.rollback.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_insert_splits_statements_at_parameter_limit(self, mock_tool):
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.rowcount = 1
+
+        mock_session.__aenter__.return_value = mock_session
+        mock_session.begin.return_value = AsyncMock()
+        mock_session.execute.return_value = mock_result
+        mock_tool.async_session.return_value = mock_session
+
+        with patch("pantheon_v2.tools.external.postgres.tool.MAX_QUERY_PARAMETERS", 4):
+            await mock_tool.insert(
+                BatchInsertParams(
+                    operations=[
+                        {"table": "t", "values": {"a": i, "b": i}} for i in range(5)
+                    ]
+                )
+            )
+
+        # Two columns fit two rows per statement
+        assert mock_session.execute.call_count == 3
         mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
@@ -150,6 +410,63 @@ class TestPostgresActions:
         mock_session.execute.assert_called_once()
         mock_session.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_batch_update(self, mock_tool):
+        mock_session = AsyncMock()
+
+        mock_session.__aenter__.return_value = mock_session
+        mock_session.begin.return_value = AsyncMock()
+        mock_session.execute.side_effect = [
+            MagicMock(rowcount=1),
+            MagicMock(rowcount=0),
+        ]
+        mock_tool.async_session.return_value = mock_session
+
+        params = BatchUpdateParams(
+            table="invoices",
+            updates=[
+                {"values": {"status": "done"}, "where": {"id": 1}},
+                {"values": {"status": "done"}, "where": {"id": 2}},
+            ],
+        )
+        result = await mock_tool.batch_update(params)
+
+        assert isinstance(result, BatchUpdateResult)
+        assert result.row_counts == [1, 0]
+        assert result.affected_rows == 1
+        assert mock_session.execute.call_count == 2
+        query, parameters = mock_session.execute.call_args_list[1].args
+        assert str(query) == "UPDATE invoices SET status = :status WHERE id = :id_where"
+        assert parameters == {"status": "done", "id_where": 2}
+        # Every update shares one commit
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_update_rolls_back_all_on_failure(self, mock_tool):
+        mock_session = AsyncMock()
+        mock_transaction = AsyncMock()
+
+        mock_session.__aenter__.return_value = mock_session
+        mock_session.begin.return_value = mock_transaction
+        mock_session.execute.side_effect = [
+            MagicMock(rowcount=1),
+            Exception("Database error"),
+        ]
+        mock_tool.async_session.return_value = mock_session
+
+        params = BatchUpdateParams(
+            table="invoices",
+            updates=[
+                {"values": {"status": "done"}, "where": {"id": 1}},
+                {"values": {"status": "done"}, "where": {"id": 2}},
+            ],
+        )
+        with pytest.raises(Exception, match="Database error"):
+            await mock_tool.batch_update(params)
+
+        mock_transaction.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+
     @pytest.mark.parametrize("action_method", ["query", "insert", "update"])
     @pytest.mark.asyncio
     async def test_error_handling(self, action_method, mock_tool):
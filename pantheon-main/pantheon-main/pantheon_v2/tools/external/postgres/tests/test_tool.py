@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from pantheon_v2.tools.external.postgres.tool import PostgresTool
 
@@ -22,6 +22,23 @@ def postgres_tool(postgres_config):
     return PostgresTool(config=postgres_config)
 
 
+@pytest.fixture(autouse=True)
+def clear_engines():
+    """Engines are shared process-wide, keep tests from seeing each other's"""
+    PostgresTool._engines.clear()
+    yield
+    PostgresTool._engines.clear()
+
+
+@pytest.fixture(autouse=True)
+def mock_instrument_engine():
+    """Mocked engines cannot take SQLAlchemy event listeners"""
+    with patch(
+        "pantheon_v2.tools.external.postgres.tool.instrument_engine"
+    ) as mock_instrument:
+        yield mock_instrument
+
+
 class TestPostgresTool:
     @pytest.mark.asyncio
     async def test_initialize_success(self, postgres_tool):
@@ -49,3 +66,58 @@ class TestPostgresTool:
                 await postgres_tool.initialize()
 
             assert str(exc_info.value) == "Database Error"
+
+    @pytest.mark.asyncio
+    async def test_engine_is_shared_by_tools_with_same_config(self, postgres_config):
+        """Tools with the same settings reuse one pooled engine"""
+        with patch(
+            "pantheon_v2.tools.external.postgres.tool.create_async_engine"
+        ) as mock_engine:
+            mock_engine.side_effect = lambda *args, **kwargs: MagicMock()
+
+            first = PostgresTool(config=postgres_config)
+            second = PostgresTool(config=postgres_config)
+            other = PostgresTool(config={**postgres_config, "database": "other_db"})
+            for tool in (first, second, other):
+                await tool.initialize()
+
+            assert mock_engine.call_count == 2
+            assert first.engine is second.engine
+            assert other.engine is not first.engine
+            kwargs = mock_engine.call_args.kwargs
+            assert kwargs["pool_pre_ping"] is True
+            assert kwargs["pool_recycle"] == 3600
+            assert kwargs["pool_timeout"] == 30
+
+    @pytest.mark.asyncio
+    async def test_dispose_engines(self, postgres_tool):
+        """Engines outlive tool cleanup and are disposed on shutdown"""
+        engine = MagicMock()
+        engine.dispose = AsyncMock()
+        with patch(
+            "pantheon_v2.tools.external.postgres.tool.create_async_engine",
+            return_value=engine,
+        ):
+            await postgres_tool.initialize()
+
+        await postgres_tool.cleanup()
+        engine.dispose.assert_not_called()
+
+        await PostgresTool.dispose_engines()
+        engine.dispose.assert_awaited_once()
+        assert PostgresTool._engines == {}
+
+    @pytest.mark.asyncio
+    async def test_engine_is_instrumented(self, postgres_tool, mock_instrument_engine):
+        """Statements and pool checkouts of the engine are recorded"""
+        with patch(
+            "pantheon_v2.tools.external.postgres.tool.create_async_engine"
+        ) as mock_engine:
+            await postgres_tool.initialize()
+
+        pool_class = mock_engine.call_args.kwargs["poolclass"]
+        assert pool_class.__name__ == "InstrumentedAsyncAdaptedQueuePool"
+        mock_instrument_engine.assert_called_once_with(
+            mock_engine.return_value.sync_engine, postgres_tool.metrics
+        )
+        assert postgres_tool.metrics.name == "postgres://localhost:5432/test_db"
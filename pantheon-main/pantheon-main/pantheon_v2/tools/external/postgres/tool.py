@@ -1,36 +1,105 @@
+import hashlib
+import json
+from io import BytesIO
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
 import structlog
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy import text
 
+from pantheon_v2.settings.settings import Settings
+from pantheon_v2.utils.db_metrics import (
+    DatabaseMetrics,
+    get_database_metrics,
+    instrument_engine,
+    instrumented_pool_class,
+)
 from pantheon_v2.tools.core.base import BaseTool
 from pantheon_v2.tools.core.tool_registry import ToolRegistry
 from pantheon_v2.tools.external.postgres.config import PostgresConfig
 from pantheon_v2.tools.external.postgres.models import (
     QueryParams,
+    QueryOutputFormat,
     UpdateParams,
     QueryResult,
     ExecuteResult,
     BatchInsertParams,
+    BatchUpdateParams,
+    BatchUpdateResult,
+    TableInsert,
+)
+from pantheon_v2.tools.external.postgres.constants import (
+    DEFAULT_STREAM_BATCH_SIZE,
+    MAX_QUERY_PARAMETERS,
+    POSTGRES_ARROW_TYPES,
 )
 
 logger = structlog.get_logger(__name__)
 
 
+def _arrow_schema(
+    columns: List[str], description: Optional[Sequence[Sequence[Any]]]
+) -> pa.Schema:
+    """
+    Arrow schema of a result from the type OIDs of its cursor description.
+
+    Types without a fixed Arrow equivalent fall back to strings, as do all
+    columns when the driver gives no description.
+    """
+    type_codes = [column[1] for column in description] if description else []
+    fields = []
+    for index, name in enumerate(columns):
+        type_code = type_codes[index] if index < len(type_codes) else None
+        fields.append(pa.field(name, POSTGRES_ARROW_TYPES.get(type_code, pa.string())))
+    return pa.schema(fields)
+
+
+def _to_text(value: Any) -> Optional[str]:
+    """String form of a value with no native Arrow type, like a UUID or Decimal"""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def _rows_to_record_batch(
+    rows: Sequence[Sequence[Any]], schema: pa.Schema
+) -> pa.RecordBatch:
+    """Build a record batch column by column with the types of schema"""
+    arrays = []
+    for index, field in enumerate(schema):
+        values = [row[index] for row in rows]
+        if pa.types.is_string(field.type):
+            values = [_to_text(value) for value in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
 @ToolRegistry.register_tool(
     "PostgreSQL database tool for executing queries and managing data"
 )
 class PostgresTool(BaseTool):
+    # Engines are shared process-wide by every tool using the same settings,
+    # so connections are pooled across activity calls instead of per tool
+    _engines: Dict[str, AsyncEngine] = {}
+
     def __init__(self, config: dict):
         self.engine = None
         self.async_session = None
+        self.metrics: Optional[DatabaseMetrics] = None
         self.config = config
 
     async def initialize(self) -> None:
         """Initialize the Postgres connection asynchronously"""
         try:
             config = PostgresConfig(**self.config)
-            self.engine = await self._create_engine(config)
+            self.metrics = self._get_metrics(config)
+            self.engine = await self._get_engine(config)
             self.async_session = sessionmaker(
                 self.engine, class_=AsyncSession, expire_on_commit=False
             )
@@ -39,6 +108,49 @@ class PostgresTool(BaseTool):
             logger.error("Failed to initialize Postgres tool", error=str(e))
             raise
 
+    async def cleanup(self) -> None:
+        """Release the shared engine, it is disposed by dispose_engines"""
+        self.engine = None
+        self.async_session = None
+
+    @classmethod
+    async def dispose_engines(cls) -> None:
+        """Dispose every shared engine and close its connections, called on worker shutdown"""
+        engines = list(cls._engines.values())
+        cls._engines.clear()
+        for engine in engines:
+            try:
+                await engine.dispose()
+            except Exception as e:
+                logger.error("Failed to dispose database engine", error=str(e))
+
+    @staticmethod
+    def _get_metrics(config: PostgresConfig) -> DatabaseMetrics:
+        return get_database_metrics(
+            f"postgres://{config.host}:{config.port}/{config.database}",
+            config.slow_query_threshold_ms,
+            Settings.DB_METRICS_LOG_INTERVAL_SECONDS,
+        )
+
+    def _record_rows_returned(self, count: int) -> None:
+        if self.metrics is not None:
+            self.metrics.record_rows_returned(count)
+
+    async def _get_engine(self, config: PostgresConfig) -> AsyncEngine:
+        """Return the shared engine for these settings, creating it on first use"""
+        key = hashlib.sha256(config.model_dump_json().encode()).hexdigest()
+        engine = self._engines.get(key)
+        if engine is None:
+            engine = await self._create_engine(config)
+            self._engines[key] = engine
+            logger.info(
+                "Created pooled database engine",
+                host=config.host,
+                database=config.database,
+                pool_size=config.pool_size,
+            )
+        return engine
+
     async def _create_engine(self, config: PostgresConfig):
         """Create async SQLAlchemy engine"""
         try:
@@ -46,11 +158,21 @@ class PostgresTool(BaseTool):
                 f"postgresql+asyncpg://{config.username}:{config.password}@"
                 f"{config.host}:{config.port}/{config.database}"
             )
+            metrics = self._get_metrics(config)
             engine = create_async_engine(
                 connection_string,
+                poolclass=instrumented_pool_class(
+                    AsyncAdaptedQueuePool,
+                    metrics,
+                    config.pool_size + config.max_overflow,
+                ),
                 pool_size=config.pool_size,
                 max_overflow=config.max_overflow,
+                pool_timeout=config.pool_timeout,
+                pool_recycle=config.pool_recycle,
+                pool_pre_ping=config.pool_pre_ping,
             )
+            instrument_engine(engine.sync_engine, metrics)
             return engine
 
         except Exception as e:
@@ -59,46 +181,191 @@ class PostgresTool(BaseTool):
 
     @ToolRegistry.register_tool_action("Execute a SELECT query on the database")
     async def query(self, params: QueryParams) -> QueryResult:
-        """Execute a SELECT query and return the results"""
+        """
+        Execute a SELECT query and return the results.
+
+        With stream_batch_size set, rows are fetched through a server-side
+        cursor instead of being buffered by the driver all at once. Parquet
+        output always streams and writes each batch as it arrives, so only
+        one batch is held as Python objects at a time.
+        """
         try:
+            if params.output_format == QueryOutputFormat.PARQUET:
+                return await self._query_parquet(params)
+            if params.stream_batch_size:
+                return await self._query_streamed(params)
+
             async with self.async_session() as session:
                 result = await session.execute(
                     text(params.query), params.parameters or {}
                 )
 
                 if result.returns_rows:
-                    columns = result.keys()
+                    columns = list(result.keys())
                     rows = [dict(zip(columns, row)) for row in result.fetchall()]
-                    return QueryResult(columns=columns, rows=rows, row_count=len(rows))
+                    self._record_rows_returned(len(rows))
+                    # Rows come straight from the driver, skip re-validating each one
+                    return QueryResult.model_construct(
+                        columns=columns,
+                        rows=rows,
+                        row_count=len(rows),
+                        parquet_content=None,
+                    )
                 return QueryResult(columns=[], rows=[], row_count=0)
         except Exception as e:
             logger.error("Query execution failed", error=str(e))
             raise
 
+    async def _query_streamed(self, params: QueryParams) -> QueryResult:
+        async with self.async_session() as session:
+            result = await session.stream(text(params.query), params.parameters or {})
+            columns = list(result.keys())
+            rows = []
+            async for partition in result.partitions(params.stream_batch_size):
+                rows.extend(dict(zip(columns, row)) for row in partition)
+            self._record_rows_returned(len(rows))
+            return QueryResult.model_construct(
+                columns=columns, rows=rows, row_count=len(rows), parquet_content=None
+            )
+
+    async def _query_parquet(self, params: QueryParams) -> QueryResult:
+        buffer = BytesIO()
+        writer = None
+        row_count = 0
+        columns: List[str] = []
+        try:
+            async for batch in self.stream_record_batches(params):
+                if writer is None:
+                    columns = batch.schema.names
+                    writer = pq.ParquetWriter(buffer, batch.schema)
+                writer.write_batch(batch)
+                row_count += batch.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+
+        buffer.seek(0)
+        return QueryResult(
+            columns=columns,
+            rows=[],
+            row_count=row_count,
+            parquet_content=buffer if writer is not None else None,
+        )
+
+    async def stream_record_batches(
+        self, params: QueryParams
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """
+        Run a query through a server-side cursor, yielding Arrow record batches.
+
+        The schema comes from the column types of the cursor description, so
+        every batch shares it whatever values the batch holds. Columns of
+        types like uuid, numeric or json are written as strings.
+        """
+        batch_size = params.stream_batch_size or DEFAULT_STREAM_BATCH_SIZE
+        async with self.async_session() as session:
+            result = await session.stream(text(params.query), params.parameters or {})
+            # AsyncResult does not expose the DBAPI cursor, read it from the
+            # underlying CursorResult
+            schema = _arrow_schema(
+                list(result.keys()), result._real_result.cursor.description
+            )
+            async for partition in result.partitions(batch_size):
+                batch = _rows_to_record_batch(partition, schema)
+                self._record_rows_returned(batch.num_rows)
+                yield batch
+
+    @staticmethod
+    def _group_inserts(
+        operations: List[TableInsert],
+    ) -> List[Tuple[str, Tuple[str, ...], List[Dict[str, Any]]]]:
+        """
+        Merge consecutive insert rows with the same table and column set.
+        Runs are not merged across other operations, so statements keep the
+        order of the operations, e.g. a parent row before its child rows.
+        """
+        groups: List[Tuple[str, Tuple[str, ...], List[Dict[str, Any]]]] = []
+        for operation in operations:
+            columns = tuple(operation.values.keys())
+            if groups and groups[-1][:2] == (operation.table, columns):
+                groups[-1][2].append(operation.values)
+            else:
+                groups.append((operation.table, columns, [operation.values]))
+        return groups
+
+    @staticmethod
+    def _build_insert(
+        table: str,
+        columns: Tuple[str, ...],
+        rows: List[Dict[str, Any]],
+        returning: Optional[List[str]] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build one multi-row INSERT statement with positional parameter names"""
+        # Quote column names to handle reserved keywords
+        columns_str = ", ".join(f'"{col}"' for col in columns)
+        values_clauses = []
+        parameters = {}
+        for row_index, row in enumerate(rows):
+            placeholders = []
+            for column_index, column in enumerate(columns):
+                name = f"p{row_index}_{column_index}"
+                placeholders.append(f":{name}")
+                parameters[name] = row[column]
+            values_clauses.append(f"({', '.join(placeholders)})")
+
+        query = (
+            f"INSERT INTO {table} ({columns_str}) VALUES {', '.join(values_clauses)}"
+        )
+        if returning:
+            query += " RETURNING " + ", ".join(f'"{col}"' for col in returning)
+        return query, parameters
+
     @ToolRegistry.register_tool_action("Insert data into the database")
     async def insert(self, params: BatchInsertParams) -> ExecuteResult:
-        """Insert multiple records across different tables within a single transaction"""
+        """
+        Insert multiple records across different tables within a single transaction.
+
+        Consecutive rows for the same table and columns are sent as one
+        multi-row INSERT statement instead of one round-trip per row.
+        Statements and returned_rows follow the order of the operations.
+        """
         try:
             async with self.async_session() as session:
                 transaction = await session.begin()
                 try:
                     total_rows = 0
+                    returned_rows = [] if params.returning else None
 
-                    for operation in params.operations:
-                        # Quote column names to handle reserved keywords
-                        quoted_columns = [f'"{col}"' for col in operation.values.keys()]
-                        columns_str = ", ".join(quoted_columns)
-                        placeholders = ", ".join(
-                            f":{col}" for col in operation.values.keys()
+                    for table, columns, rows in self._group_inserts(params.operations):
+                        chunk_size = max(
+                            1, MAX_QUERY_PARAMETERS // max(len(columns), 1)
                         )
-
-                        query = f"INSERT INTO {operation.table} ({columns_str}) VALUES ({placeholders})"
-
-                        result = await session.execute(text(query), operation.values)
-                        total_rows += result.rowcount
+                        for start in range(0, len(rows), chunk_size):
+                            chunk = rows[start : start + chunk_size]
+                            query, parameters = self._build_insert(
+                                table, columns, chunk, params.returning
+                            )
+                            result = await session.execute(text(query), parameters)
+                            if params.returning:
+                                returned = [dict(row) for row in result.mappings()]
+                                # Returned rows only line up with the
+                                # operations if every row came back
+                                if len(returned) != len(chunk):
+                                    raise ValueError(
+                                        f"Insert into {table} returned {len(returned)} "
+                                        f"rows for {len(chunk)} inserted"
+                                    )
+                                returned_rows.extend(returned)
+                            total_rows += (
+                                result.rowcount if result.rowcount >= 0 else len(chunk)
+                            )
 
                     await session.commit()
-                    return ExecuteResult(success=True, affected_rows=total_rows)
+                    return ExecuteResult(
+                        success=True,
+                        affected_rows=total_rows,
+                        returned_rows=returned_rows,
+                    )
                 except:
                     await transaction.rollback()
                     raise
@@ -106,21 +373,28 @@ class PostgresTool(BaseTool):
             logger.error("Insert operation failed", error=str(e))
             raise
 
+    @staticmethod
+    def _build_update(
+        table: str, values: Dict[str, Any], where: Dict[str, Any]
+    ) -> Tuple[str, Dict[str, Any]]:
+        set_clause = ", ".join(f"{k} = :{k}" for k in values.keys())
+        where_clause = " AND ".join(f"{k} = :{k}_where" for k in where.keys())
+
+        query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
+
+        # Prepare parameters
+        parameters = {**values}
+        parameters.update({f"{k}_where": v for k, v in where.items()})
+        return query, parameters
+
     @ToolRegistry.register_tool_action("Update data in the database")
     async def update(self, params: UpdateParams) -> ExecuteResult:
         """Update records in the specified table"""
         try:
-            set_clause = ", ".join(f"{k} = :{k}" for k in params.values.keys())
-            where_clause = " AND ".join(
-                f"{k} = :{k}_where" for k in params.where.keys()
+            query, parameters = self._build_update(
+                params.table, params.values, params.where
             )
 
-            query = f"UPDATE {params.table} SET {set_clause} WHERE {where_clause}"
-
-            # Prepare parameters
-            parameters = {**params.values}
-            parameters.update({f"{k}_where": v for k, v in params.where.items()})
-
             async with self.async_session() as session:
                 transaction = await session.begin()
                 try:
@@ -133,3 +407,38 @@ class PostgresTool(BaseTool):
         except Exception as e:
             logger.error("Update operation failed", error=str(e))
             raise
+
+    @ToolRegistry.register_tool_action(
+        "Apply many updates to a table in one transaction"
+    )
+    async def batch_update(self, params: BatchUpdateParams) -> BatchUpdateResult:
+        """
+        Apply many (where, values) updates to one table within a single transaction.
+
+        All updates share one connection and commit, and either all of them
+        apply or none do. Updates of the same shape reuse one prepared statement.
+        """
+        try:
+            async with self.async_session() as session:
+                transaction = await session.begin()
+                try:
+                    row_counts = []
+                    for row_update in params.updates:
+                        query, parameters = self._build_update(
+                            params.table, row_update.values, row_update.where
+                        )
+                        result = await session.execute(text(query), parameters)
+                        row_counts.append(result.rowcount)
+
+                    await session.commit()
+                    return BatchUpdateResult(
+                        success=True,
+                        affected_rows=sum(row_counts),
+                        row_counts=row_counts,
+                    )
+                except:
+                    await transaction.rollback()
+                    raise
+        except Exception as e:
+            logger.error("Batch update operation failed", error=str(e))
+            raise
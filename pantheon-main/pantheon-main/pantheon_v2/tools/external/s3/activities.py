@@ -1,10 +1,13 @@
 from pantheon_v2.tools.core.activity_registry import ActivityRegistry
+from pantheon_v2.tools.core.tool_registry import ToolRegistry
 from pantheon_v2.tools.external.s3.config import S3Config
 from pantheon_v2.tools.external.s3.models import (
     DownloadFromS3Input,
     DownloadFromS3Output,
     UploadToS3Input,
     UploadToS3Output,
+    BulkUploadToS3Input,
+    BulkUploadToS3Output,
     DownloadFolderFromS3Input,
     DownloadFolderFromS3Output,
 )
@@ -26,8 +29,7 @@ def get_internal_s3_config() -> (
 @ActivityRegistry.register_activity("Download a file from Amazon S3")
 async def download_from_s3(input: DownloadFromS3Input) -> DownloadFromS3Output:
     config = get_internal_s3_config()
-    tool = S3Tool(config.model_dump())
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(S3Tool, config.model_dump())
     output = await tool.download_from_s3(input)
     return output
 
@@ -35,16 +37,21 @@ async def download_from_s3(input: DownloadFromS3Input) -> DownloadFromS3Output:
 @ActivityRegistry.register_activity("Upload a file to Amazon S3")
 async def upload_to_s3(input: UploadToS3Input) -> UploadToS3Output:
     config = get_internal_s3_config()
-    tool = S3Tool(config.model_dump())
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(S3Tool, config.model_dump())
     return await tool.upload_to_s3(input)
 
 
+@ActivityRegistry.register_activity("Upload many files to Amazon S3 concurrently")
+async def bulk_upload_to_s3(input: BulkUploadToS3Input) -> BulkUploadToS3Output:
+    config = get_internal_s3_config()
+    tool = await ToolRegistry.get_tool_instance(S3Tool, config.model_dump())
+    return await tool.bulk_upload_to_s3(input)
+
+
 @ActivityRegistry.register_activity("Download a folder from Amazon S3")
 async def download_folder_from_s3(
     input: DownloadFolderFromS3Input,
 ) -> DownloadFolderFromS3Output:
     config = get_internal_s3_config()
-    tool = S3Tool(config.model_dump())
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(S3Tool, config.model_dump())
     return await tool.download_folder_from_s3(input.bucket_name, input.folder_path)
@@ -1,7 +1,42 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
+from pantheon_v2.settings.settings import Settings
+
+from pantheon_v2.tools.external.s3.constants import (
+    DEFAULT_S3_IO_WORKERS,
+    DEFAULT_S3_PART_SIZE,
+    DEFAULT_S3_TRANSFER_CONCURRENCY,
+    MIN_S3_PART_SIZE,
+)
+
 
 class S3Config(BaseModel):
     aws_access_key: str = Field(..., description="AWS Access Key")
     aws_secret_key: str = Field(..., description="AWS Secret Key")
     region_name: str = Field(default="us-east-1", description="AWS Region")
+    max_io_workers: int = Field(
+        default=DEFAULT_S3_IO_WORKERS,
+        gt=0,
+        description="Maximum concurrent S3 requests made by the tool",
+    )
+    part_size: int = Field(
+        default=DEFAULT_S3_PART_SIZE,
+        ge=MIN_S3_PART_SIZE,
+        description="Part size in bytes for multipart uploads and ranged downloads",
+    )
+    max_transfer_concurrency: int = Field(
+        default=DEFAULT_S3_TRANSFER_CONCURRENCY,
+        gt=0,
+        description="Maximum parts of a single object transferred in parallel",
+    )
+    cache_dir: Optional[str] = Field(
+        default=Settings.BLOB_CACHE_DIR or None,
+        description="Directory of the local download cache, caching is off when unset",
+    )
+    cache_max_bytes: int = Field(
+        default=Settings.BLOB_CACHE_MAX_BYTES,
+        gt=0,
+        description="Size cap of the local download cache in bytes",
+    )
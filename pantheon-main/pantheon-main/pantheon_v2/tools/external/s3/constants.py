@@ -1 +1,9 @@
 S3_HTTPS_BASE_URL = "https://s3.amazonaws.com"
+
+# Threads used for blocking boto3 calls, the client's connection pool is sized to match
+DEFAULT_S3_IO_WORKERS = 10
+
+# Multipart transfers, S3 requires parts of at least 5 MiB
+DEFAULT_S3_PART_SIZE = 8 * 1024 * 1024
+MIN_S3_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_S3_TRANSFER_CONCURRENCY = 8
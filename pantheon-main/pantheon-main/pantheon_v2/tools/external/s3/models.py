@@ -1,5 +1,5 @@
 from io import BytesIO
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 from pantheon_v2.core.custom_data_types.pydantic import SerializableBytesIO
@@ -44,6 +44,25 @@ class UploadToS3Output(BaseModel):
     )
 
 
+class BulkUploadToS3Input(BaseModel):
+    files: list[UploadToS3Input] = Field(..., description="Files to upload")
+
+
+class BulkUploadToS3ItemResult(BaseModel):
+    file_name: str = Field(..., description="Name of the file")
+    success: bool = Field(..., description="Whether the upload succeeded")
+    result: Optional[UploadToS3Output] = Field(
+        default=None, description="Upload result if it succeeded"
+    )
+    error: Optional[str] = Field(default=None, description="Error if it failed")
+
+
+class BulkUploadToS3Output(BaseModel):
+    results: list[BulkUploadToS3ItemResult] = Field(
+        ..., description="Per-file results in the order of the input files"
+    )
+
+
 class S3FileMetadata(BaseModel):
     name: str = Field(..., description="Name of the file")
     full_path: str = Field(..., description="Full path of the file in S3")
@@ -1,13 +1,25 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
+import threading
+import time
 from io import BytesIO
 from datetime import datetime
 
 from pantheon_v2.tools.external.s3.tool import S3Tool
+from pantheon_v2.tools.external.s3.constants import (
+    DEFAULT_S3_IO_WORKERS,
+    DEFAULT_S3_PART_SIZE,
+    DEFAULT_S3_TRANSFER_CONCURRENCY,
+    MIN_S3_PART_SIZE,
+)
+from botocore.exceptions import ClientError
 from pantheon_v2.tools.external.s3.models import (
     DownloadFromS3Input,
+    DownloadFromS3Output,
     UploadToS3Input,
+    BulkUploadToS3Input,
 )
+from pantheon_v2.utils.file_utils import new_spooled_file
 
 
 @pytest.fixture
@@ -39,7 +51,13 @@ class TestS3Tool:
                 aws_access_key_id=s3_config["aws_access_key"],
                 aws_secret_access_key=s3_config["aws_secret_key"],
                 region_name=s3_config["region_name"],
+                config=ANY,
+            )
+            assert (
+                mock_client.call_args.kwargs["config"].max_pool_connections
+                == DEFAULT_S3_IO_WORKERS + DEFAULT_S3_TRANSFER_CONCURRENCY
             )
+            assert tool.transfer_config.multipart_chunksize == DEFAULT_S3_PART_SIZE
             assert tool.s3_client is not None
 
     @pytest.mark.asyncio
@@ -72,7 +90,9 @@ class TestS3Tool:
 
         # Assert
         s3_tool.s3_client.get_object.assert_called_once_with(
-            Bucket="test-bucket", Key="test.pdf"
+            Bucket="test-bucket",
+            Key="test.pdf",
+            Range=f"bytes=0-{DEFAULT_S3_PART_SIZE - 1}",
         )
         assert result.content.getvalue() == test_content
 
@@ -87,40 +107,91 @@ class TestS3Tool:
             content_type="application/octet-stream",
         )
 
-        mock_head_response = {
-            "ContentLength": 1234,
-            "ContentType": "application/pdf",
+        s3_tool.s3_client.put_object.return_value = {
             "ETag": "test_etag",
-            "LastModified": datetime(2024, 1, 1),
+            "ResponseMetadata": {
+                "HTTPHeaders": {"date": "Mon, 01 Jan 2024 00:00:00 GMT"}
+            },
         }
-        s3_tool.s3_client.head_object.return_value = mock_head_response
 
         # Act
         result = await s3_tool.upload_to_s3(input_data)
 
         # Assert
-        s3_tool.s3_client.upload_fileobj.assert_called_once_with(
-            test_content,
-            "test-bucket",
-            "test.pdf",
-            ExtraArgs={"ContentType": "application/pdf"},
-        )
-
-        s3_tool.s3_client.head_object.assert_called_once_with(
-            Bucket="test-bucket", Key="test.pdf"
+        s3_tool.s3_client.put_object.assert_called_once_with(
+            Bucket="test-bucket",
+            Key="test.pdf",
+            Body=test_content,
+            ContentType="application/pdf",
         )
+        # The PUT response carries the ETag, so no HEAD request is made
+        s3_tool.s3_client.head_object.assert_not_called()
+        s3_tool.s3_client.upload_fileobj.assert_not_called()
 
         assert result.s3_url == "s3://test-bucket/test.pdf"
         assert result.https_url == "https://s3.amazonaws.com/test-bucket/test.pdf"
         assert result.metadata == {
             "bucket": "test-bucket",
             "name": "test.pdf",
-            "size": 1234,
+            "size": len(b"test content"),
             "content_type": "application/pdf",
             "etag": "test_etag",
             "last_modified": "2024-01-01 00:00:00",
         }
 
+    @pytest.mark.asyncio
+    async def test_upload_large_file_to_s3_uses_multipart(self, s3_config):
+        tool = S3Tool(config={**s3_config, "part_size": MIN_S3_PART_SIZE})
+        with patch("pantheon_v2.tools.external.s3.tool.boto3.client"):
+            await tool.initialize()
+        tool.s3_client = MagicMock()
+        test_content = BytesIO(b"x" * MIN_S3_PART_SIZE)
+
+        result = await tool.upload_to_s3(
+            UploadToS3Input(
+                bucket_name="test-bucket", file_name="big.csv", blob=test_content
+            )
+        )
+
+        tool.s3_client.upload_fileobj.assert_called_once_with(
+            test_content,
+            "test-bucket",
+            "big.csv",
+            ExtraArgs={"ContentType": "text/csv"},
+            Config=tool.transfer_config,
+        )
+        tool.s3_client.head_object.assert_not_called()
+        assert result.metadata["size"] == MIN_S3_PART_SIZE
+
+    @pytest.mark.asyncio
+    async def test_bulk_upload_to_s3(self, s3_tool):
+        """Every file is uploaded and failures are reported per file"""
+
+        def put_object(Bucket, Key, **kwargs):
+            if Key == "bad.pdf":
+                raise ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject")
+            return {"ETag": f'"{Key}"'}
+
+        s3_tool.s3_client.put_object.side_effect = put_object
+        files = [
+            UploadToS3Input(
+                bucket_name="test-bucket", file_name=name, blob=BytesIO(b"content")
+            )
+            for name in ["a.pdf", "bad.pdf", "c.pdf"]
+        ]
+
+        result = await s3_tool.bulk_upload_to_s3(BulkUploadToS3Input(files=files))
+
+        assert [item.file_name for item in result.results] == [
+            "a.pdf",
+            "bad.pdf",
+            "c.pdf",
+        ]
+        assert [item.success for item in result.results] == [True, False, True]
+        assert result.results[0].result.metadata["etag"] == '"a.pdf"'
+        assert "AccessDenied" in result.results[1].error
+        assert s3_tool.s3_client.put_object.call_count == 3
+
     @pytest.mark.asyncio
     async def test_download_folder_from_s3(self, s3_tool):
         # Arrange
@@ -189,3 +260,178 @@ class TestS3Tool:
         assert file2.content_type == "text/plain"
         assert file2.last_modified == datetime(2024, 1, 2)
         assert file2.content.getvalue() == b"test content"
+
+    @pytest.mark.asyncio
+    async def test_s3_calls_run_off_event_loop(self, s3_tool):
+        """Blocking boto3 calls run on the tool's I/O threads"""
+        calling_threads = []
+
+        def mock_get_object(Bucket, Key, **kwargs):
+            calling_threads.append(threading.current_thread().name)
+            return {"Body": MagicMock(read=lambda: b"test content")}
+
+        s3_tool.s3_client.get_object.side_effect = mock_get_object
+
+        await s3_tool.download_from_s3(
+            DownloadFromS3Input(bucket_name="test-bucket", file_name="test.pdf")
+        )
+
+        assert calling_threads[0].startswith("s3-io")
+        assert calling_threads[0] != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_download_large_object_in_parallel_ranges(self, s3_config):
+        """Objects larger than a part are fetched as concurrent ranged GETs"""
+        tool = S3Tool(config={**s3_config, "part_size": MIN_S3_PART_SIZE})
+        tool.s3_client = MagicMock()
+        content = bytes(range(256)) * (MIN_S3_PART_SIZE * 3 // 256 + 10)
+
+        def mock_get_object(Bucket, Key, Range, IfMatch=None):
+            start, end = (int(v) for v in Range.removeprefix("bytes=").split("-"))
+            return {
+                "Body": MagicMock(read=lambda: content[start : end + 1]),
+                "ContentRange": f"bytes {start}-{end}/{len(content)}",
+                "ETag": "etag-1",
+            }
+
+        tool.s3_client.get_object.side_effect = mock_get_object
+
+        result = await tool.download_from_s3(
+            DownloadFromS3Input(bucket_name="test-bucket", file_name="big.zip")
+        )
+
+        assert result.content.getvalue() == content
+        calls = tool.s3_client.get_object.call_args_list
+        assert len(calls) == 4
+        # Later ranges are pinned to the version of the first response
+        assert all(c.kwargs["IfMatch"] == "etag-1" for c in calls[1:])
+
+    @pytest.mark.asyncio
+    async def test_download_empty_object(self, s3_tool):
+        """Empty objects reject range requests and fall back to a plain GET"""
+        range_error = ClientError(
+            {"Error": {"Code": "InvalidRange", "Message": "invalid"}}, "GetObject"
+        )
+        s3_tool.s3_client.get_object.side_effect = [
+            range_error,
+            {"Body": MagicMock(read=lambda: b"")},
+        ]
+
+        result = await s3_tool.download_from_s3(
+            DownloadFromS3Input(bucket_name="test-bucket", file_name="empty.txt")
+        )
+
+        assert result.content.getvalue() == b""
+        s3_tool.s3_client.get_object.assert_called_with(
+            Bucket="test-bucket", Key="empty.txt"
+        )
+
+    @pytest.mark.asyncio
+    async def test_download_from_s3_to_file_spills_to_disk(self, s3_tool):
+        """Large bodies roll over to disk and still fit a SerializableBytesIO field"""
+        chunks = [b"x" * 1024] * 4
+        body = MagicMock()
+        body.iter_chunks.return_value = iter(chunks)
+        s3_tool.s3_client.get_object.return_value = {"Body": body}
+
+        with patch(
+            "pantheon_v2.tools.external.s3.tool.new_spooled_file",
+            lambda: new_spooled_file(max_size=2048),
+        ):
+            spooled_file = await s3_tool.download_from_s3_to_file(
+                DownloadFromS3Input(bucket_name="test-bucket", file_name="big.bin")
+            )
+
+        assert spooled_file._rolled
+        output = DownloadFromS3Output(content=spooled_file)
+        assert output.content.getvalue() == b"".join(chunks)
+
+    @pytest.mark.asyncio
+    async def test_stream_from_s3(self, s3_tool):
+        body = BytesIO(b"abcdefg")
+        s3_tool.s3_client.get_object.return_value = {"Body": body}
+
+        chunks = [
+            chunk
+            async for chunk in s3_tool.stream_from_s3(
+                DownloadFromS3Input(bucket_name="test-bucket", file_name="test.txt"),
+                chunk_size=3,
+            )
+        ]
+
+        assert chunks == [b"abc", b"def", b"g"]
+        assert body.closed
+
+    @pytest.mark.asyncio
+    async def test_download_folder_from_s3_concurrently(self, s3_config):
+        """Folder objects download concurrently and keep their listing order"""
+        tool = S3Tool(config={**s3_config, "max_io_workers": 4})
+        tool.s3_client = MagicMock()
+        keys = [f"folder/file{i:02}.txt" for i in range(12)]
+        tool.s3_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": key, "Size": 1, "LastModified": datetime(2024, 1, 1)}
+                    for key in keys[:6]
+                ]
+            },
+            {
+                "Contents": [
+                    {"Key": key, "Size": 1, "LastModified": datetime(2024, 1, 1)}
+                    for key in keys[6:]
+                ]
+            },
+        ]
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def mock_get_object(Bucket, Key):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return {"Body": MagicMock(read=lambda: Key.encode())}
+
+        tool.s3_client.get_object.side_effect = mock_get_object
+
+        result = await tool.download_folder_from_s3("test-bucket", "folder")
+
+        assert [f.full_path for f in result.files] == keys
+        assert all(f.content.getvalue() == f.full_path.encode() for f in result.files)
+        assert 1 < max_in_flight <= 4
+
+    @pytest.mark.asyncio
+    async def test_download_from_s3_uses_local_cache(self, s3_config, tmp_path):
+        """A second download of an unchanged object only costs a HEAD request"""
+        tool = S3Tool(config={**s3_config, "cache_dir": str(tmp_path)})
+        with patch("pantheon_v2.tools.external.s3.tool.boto3.client"):
+            await tool.initialize()
+        tool.s3_client = MagicMock()
+        tool.s3_client.head_object.return_value = {"ETag": '"abc"'}
+        mock_body = MagicMock()
+        mock_body.read.return_value = b"cached content"
+        tool.s3_client.get_object.return_value = {"Body": mock_body}
+        params = DownloadFromS3Input(bucket_name="test-bucket", file_name="test.txt")
+
+        first = await tool.download_from_s3(params)
+        second = await tool.download_from_s3(params)
+
+        assert first.content.getvalue() == b"cached content"
+        assert second.content.getvalue() == b"cached content"
+        tool.s3_client.get_object.assert_called_once_with(
+            Bucket="test-bucket",
+            Key="test.txt",
+            Range=f"bytes=0-{DEFAULT_S3_PART_SIZE - 1}",
+            IfMatch='"abc"',
+        )
+        assert tool.s3_client.head_object.call_count == 2
+        assert tool.blob_cache.stats.hits == 1
+
+        # A new ETag misses the cache and downloads again
+        tool.s3_client.head_object.return_value = {"ETag": '"def"'}
+        await tool.download_from_s3(params)
+        assert tool.s3_client.get_object.call_count == 2
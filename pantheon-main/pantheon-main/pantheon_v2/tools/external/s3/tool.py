@@ -1,21 +1,39 @@
 import structlog
 import os
+import asyncio
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import ClientError
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from io import BytesIO
 import mimetypes
+from tempfile import SpooledTemporaryFile
+from typing import Any, AsyncIterator, Callable
 
 from pantheon_v2.tools.external.s3.models import (
     DownloadFromS3Input,
     DownloadFromS3Output,
     UploadToS3Input,
     UploadToS3Output,
+    BulkUploadToS3Input,
+    BulkUploadToS3ItemResult,
+    BulkUploadToS3Output,
     DownloadFolderFromS3Output,
     S3FileMetadata,
 )
 from pantheon_v2.tools.core.base import BaseTool
 from pantheon_v2.tools.core.tool_registry import ToolRegistry
 from pantheon_v2.tools.external.s3.config import S3Config
-from pantheon_v2.tools.external.s3.constants import S3_HTTPS_BASE_URL
+from pantheon_v2.utils.async_utils import bounded_as_completed
+from pantheon_v2.utils.blob_cache import get_blob_cache
+from pantheon_v2.utils.file_utils import STREAM_CHUNK_SIZE, new_spooled_file
+from pantheon_v2.tools.external.s3.constants import (
+    S3_HTTPS_BASE_URL,
+    DEFAULT_S3_IO_WORKERS,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -24,7 +42,15 @@ logger = structlog.get_logger(__name__)
 class S3Tool(BaseTool):
     def __init__(self, config: dict):
         self.s3_client = None
+        self.transfer_config = None
+        self.blob_cache = None
         self.config = config
+        # boto3 is synchronous, so its calls run on a bounded pool of their own
+        # instead of blocking the worker's event loop
+        self.thread_pool = ThreadPoolExecutor(
+            max_workers=config.get("max_io_workers", DEFAULT_S3_IO_WORKERS),
+            thread_name_prefix="s3-io",
+        )
 
     async def initialize(self) -> None:
         """Initialize the S3 client asynchronously"""
@@ -36,26 +62,201 @@ class S3Tool(BaseTool):
                 aws_access_key_id=config.aws_access_key,
                 aws_secret_access_key=config.aws_secret_key,
                 region_name=config.region_name,
+                # Multipart uploads open their own connections next to the I/O threads
+                config=BotoConfig(
+                    max_pool_connections=config.max_io_workers
+                    + config.max_transfer_concurrency
+                ),
+            )
+            self.transfer_config = TransferConfig(
+                multipart_threshold=config.part_size,
+                multipart_chunksize=config.part_size,
+                max_concurrency=config.max_transfer_concurrency,
             )
+            if config.cache_dir:
+                self.blob_cache = get_blob_cache(
+                    config.cache_dir, config.cache_max_bytes
+                )
             logger.info("S3 tool initialized successfully")
         except Exception as e:
             logger.error("Failed to initialize S3 tool", error=str(e))
             raise
 
+    async def cleanup(self) -> None:
+        """Close the S3 client's connection pool and the I/O threads"""
+        if self.s3_client is not None:
+            self.s3_client.close()
+            self.s3_client = None
+        self.thread_pool.shutdown(wait=True)
+
+    async def _run_io(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking boto3 call on the tool's I/O thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.thread_pool, partial(func, *args, **kwargs)
+        )
+
+    def _read_object(self, bucket_name: str, key: str) -> tuple[bytes, dict]:
+        """Fetch an object and read its body, both of which block on the network"""
+        response = self.s3_client.get_object(Bucket=bucket_name, Key=key)
+        return response["Body"].read(), response
+
+    def _read_range(
+        self, bucket_name: str, key: str, start: int, end: int, etag: str | None = None
+    ) -> tuple[bytes, dict]:
+        """Fetch an inclusive byte range of an object, pinned to an ETag if given"""
+        extra_args = {"IfMatch": etag} if etag else {}
+        response = self.s3_client.get_object(
+            Bucket=bucket_name, Key=key, Range=f"bytes={start}-{end}", **extra_args
+        )
+        return response["Body"].read(), response
+
+    async def _download_object(
+        self, bucket_name: str, key: str, etag: str | None = None
+    ) -> BytesIO:
+        """Download an object, fetching parts of large objects in parallel.
+
+        The first request asks for one part, so objects no larger than a part
+        still cost a single GET. The total size from its Content-Range decides
+        how many more ranges are fetched concurrently. If etag is given, every
+        range is pinned to that version of the object.
+        """
+        config = S3Config(**self.config)
+        part_size = config.part_size
+        try:
+            first_part, response = await self._run_io(
+                self._read_range, bucket_name, key, 0, part_size - 1, etag
+            )
+        except ClientError as e:
+            # Empty objects cannot satisfy a range request
+            if e.response.get("Error", {}).get("Code") != "InvalidRange":
+                raise
+            first_part, response = await self._run_io(
+                self._read_object, bucket_name, key
+            )
+
+        content_range = response.get("ContentRange")
+        total_size = (
+            int(content_range.rsplit("/", 1)[1]) if content_range else len(first_part)
+        )
+
+        bytes_buffer = BytesIO()
+        bytes_buffer.write(first_part)
+        if total_size <= len(first_part):
+            bytes_buffer.seek(0)
+            return bytes_buffer
+
+        # Pin the remaining ranges to the same object version
+        etag = etag or response.get("ETag")
+        semaphore = asyncio.Semaphore(config.max_transfer_concurrency)
+
+        async def fetch_range(start: int) -> None:
+            end = min(start + part_size, total_size) - 1
+            async with semaphore:
+                body, _ = await self._run_io(
+                    self._read_range, bucket_name, key, start, end, etag
+                )
+            bytes_buffer.seek(start)
+            bytes_buffer.write(body)
+
+        await asyncio.gather(
+            *(
+                fetch_range(start)
+                for start in range(len(first_part), total_size, part_size)
+            )
+        )
+        logger.info(
+            "Downloaded object in parallel ranges",
+            key=key,
+            size=total_size,
+            parts=-(-total_size // part_size),
+        )
+        bytes_buffer.seek(0)
+        return bytes_buffer
+
+    def _spool_object(self, bucket_name: str, key: str) -> SpooledTemporaryFile:
+        """Copy an object body into a spooled file chunk by chunk"""
+        response = self.s3_client.get_object(Bucket=bucket_name, Key=key)
+        spooled_file = new_spooled_file()
+        for chunk in response["Body"].iter_chunks(STREAM_CHUNK_SIZE):
+            spooled_file.write(chunk)
+        spooled_file.seek(0)
+        return spooled_file
+
+    def _list_objects(self, bucket_name: str, prefix: str) -> list[dict]:
+        """List every object under a prefix, following pagination"""
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+        return [obj for page in pages for obj in page.get("Contents", [])]
+
     @ToolRegistry.register_tool_action(description="Download a file from Amazon S3")
     async def download_from_s3(
         self, params: DownloadFromS3Input
     ) -> DownloadFromS3Output:
-        response = self.s3_client.get_object(
-            Bucket=params.bucket_name, Key=params.file_name
-        )
+        if self.blob_cache is not None:
+            return DownloadFromS3Output(
+                content=await self._download_object_cached(
+                    params.bucket_name, params.file_name
+                )
+            )
 
-        # Create an in-memory file-like object
-        bytes_buffer = BytesIO(response["Body"].read())
-        bytes_buffer.seek(0)  # Move to the beginning of the file-like object
+        bytes_buffer = await self._download_object(params.bucket_name, params.file_name)
 
         return DownloadFromS3Output(content=bytes_buffer)
 
+    async def _download_object_cached(self, bucket_name: str, key: str) -> BytesIO:
+        """Download an object, from the local cache when it holds the current ETag"""
+        # A HEAD request is enough to tell whether the cached copy is current
+        head = await self._run_io(
+            self.s3_client.head_object, Bucket=bucket_name, Key=key
+        )
+        etag = head["ETag"]
+        cache_key = f"s3://{bucket_name}/{key}"
+
+        content = await self._run_io(self.blob_cache.get, cache_key, etag)
+        if content is not None:
+            logger.info(
+                "Served object from local cache",
+                key=cache_key,
+                hit_rate=self.blob_cache.stats.hit_rate,
+            )
+            return BytesIO(content)
+
+        bytes_buffer = await self._download_object(bucket_name, key, etag=etag)
+        await self._run_io(
+            self.blob_cache.put, cache_key, etag, bytes_buffer.getvalue()
+        )
+        return bytes_buffer
+
+    async def stream_from_s3(
+        self, params: DownloadFromS3Input, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Yield an object's body in chunks without holding it in memory"""
+        response = await self._run_io(
+            self.s3_client.get_object, Bucket=params.bucket_name, Key=params.file_name
+        )
+        body = response["Body"]
+        try:
+            while chunk := await self._run_io(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    @ToolRegistry.register_tool_action(
+        description="Download a file from Amazon S3 into a spooled temporary file"
+    )
+    async def download_from_s3_to_file(
+        self, params: DownloadFromS3Input
+    ) -> SpooledTemporaryFile:
+        """
+        Download an object into a file that stays in memory while small and
+        spills to disk when large. The handle can be passed to pandas or PDF
+        readers directly, or to any SerializableBytesIO field.
+        """
+        return await self._run_io(
+            self._spool_object, params.bucket_name, params.file_name
+        )
+
     @ToolRegistry.register_tool_action(description="Upload a file to Amazon S3")
     async def upload_to_s3(self, params: UploadToS3Input) -> UploadToS3Output:
         # Detect content type from the file name if not provided
@@ -66,32 +267,46 @@ class S3Tool(BaseTool):
                 content_type = guessed_type
 
         # Use the existing BytesIO object directly
+        params.blob.seek(0, os.SEEK_END)
+        size = params.blob.tell()
         params.blob.seek(0)  # Ensure we're at the start of the BytesIO object
 
-        # Upload the file
-        self.s3_client.upload_fileobj(
-            params.blob,
-            params.bucket_name,
-            params.file_name,
-            ExtraArgs={"ContentType": content_type},
-        )
-
-        # Get object metadata
-        response = self.s3_client.head_object(
-            Bucket=params.bucket_name, Key=params.file_name
-        )
-
-        # Convert last_modified to string if it exists
-        last_modified = response.get("LastModified", "")
-        if last_modified:
-            last_modified = last_modified.strftime("%Y-%m-%d %H:%M:%S")
+        etag = ""
+        last_modified = ""
+        if size < S3Config(**self.config).part_size:
+            # A single PUT returns the ETag, so no HEAD request is needed afterwards
+            response = await self._run_io(
+                self.s3_client.put_object,
+                Bucket=params.bucket_name,
+                Key=params.file_name,
+                Body=params.blob,
+                ContentType=content_type,
+            )
+            etag = response.get("ETag", "")
+            date = (
+                response.get("ResponseMetadata", {}).get("HTTPHeaders", {}).get("date")
+            )
+            if date:
+                last_modified = parsedate_to_datetime(date).strftime(
+                    "%Y-%m-%d %H:%M:%S"
+                )
+        else:
+            # Objects above one part are uploaded as concurrent multipart parts
+            await self._run_io(
+                self.s3_client.upload_fileobj,
+                params.blob,
+                params.bucket_name,
+                params.file_name,
+                ExtraArgs={"ContentType": content_type},
+                Config=self.transfer_config,
+            )
 
         metadata = {
             "bucket": params.bucket_name,
             "name": params.file_name,
-            "size": response.get("ContentLength", 0),
-            "content_type": response.get("ContentType", content_type),
-            "etag": response.get("ETag", ""),
+            "size": size,
+            "content_type": content_type,
+            "etag": etag,
             "last_modified": last_modified,
         }
 
@@ -100,6 +315,85 @@ class S3Tool(BaseTool):
 
         return UploadToS3Output(metadata=metadata, s3_url=s3_url, https_url=https_url)
 
+    async def _upload_item(
+        self, item: tuple[int, UploadToS3Input]
+    ) -> tuple[int, BulkUploadToS3ItemResult]:
+        """Upload one file of a bulk upload, reporting failure instead of raising"""
+        index, params = item
+        try:
+            result = await self.upload_to_s3(params)
+        except Exception as e:
+            logger.error(
+                "Failed to upload file", file_name=params.file_name, error=str(e)
+            )
+            return index, BulkUploadToS3ItemResult(
+                file_name=params.file_name, success=False, error=str(e)
+            )
+        return index, BulkUploadToS3ItemResult(
+            file_name=params.file_name, success=True, result=result
+        )
+
+    @ToolRegistry.register_tool_action(
+        description="Upload many files to Amazon S3 concurrently"
+    )
+    async def bulk_upload_to_s3(
+        self, params: BulkUploadToS3Input, max_concurrency: int | None = None
+    ) -> BulkUploadToS3Output:
+        """Uploads all files concurrently and returns a result per file, in input order"""
+        if max_concurrency is None:
+            max_concurrency = S3Config(**self.config).max_io_workers
+
+        results = [None] * len(params.files)
+        async for index, result in bounded_as_completed(
+            enumerate(params.files), self._upload_item, max_concurrency
+        ):
+            results[index] = result
+
+        return BulkUploadToS3Output(results=results)
+
+    async def _download_folder_object(
+        self, bucket_name: str, folder_path: str, obj: dict
+    ) -> S3FileMetadata:
+        """Download one listed object of a folder with its metadata"""
+        body, response = await self._run_io(self._read_object, bucket_name, obj["Key"])
+
+        # Extract relative path by removing the folder_path prefix
+        relative_path = obj["Key"].replace(folder_path, "").lstrip("/")
+
+        return S3FileMetadata(
+            name=os.path.basename(obj["Key"]),
+            full_path=obj["Key"],
+            relative_path=relative_path,
+            size=obj["Size"],
+            content_type=response.get("ContentType", "application/octet-stream"),
+            last_modified=obj["LastModified"],
+            content=BytesIO(body),
+        )
+
+    async def iter_folder_from_s3(
+        self, bucket_name: str, folder_path: str, max_concurrency: int | None = None
+    ) -> AsyncIterator[S3FileMetadata]:
+        """
+        Yield the files of an S3 folder as their downloads finish.
+
+        Listing follows pagination and at most max_concurrency objects are
+        downloaded or waiting to be consumed at once, so memory stays bounded
+        however large the folder is.
+        """
+        if max_concurrency is None:
+            max_concurrency = S3Config(**self.config).max_io_workers
+
+        # List objects in the folder, skipping folder markers
+        objects = await self._run_io(self._list_objects, bucket_name, folder_path)
+        objects = [obj for obj in objects if not obj["Key"].endswith("/")]
+
+        async for file in bounded_as_completed(
+            objects,
+            partial(self._download_folder_object, bucket_name, folder_path),
+            max_concurrency,
+        ):
+            yield file
+
     @ToolRegistry.register_tool_action(description="Download a folder from Amazon S3")
     async def download_folder_from_s3(
         self,
@@ -107,40 +401,11 @@ class S3Tool(BaseTool):
         folder_path: str,
     ) -> DownloadFolderFromS3Output:
         """Downloads all contents of an S3 folder and returns array of BytesIO objects with metadata"""
-        # List objects in the folder
-        paginator = self.s3_client.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=bucket_name, Prefix=folder_path)
-
-        downloaded_files = []
-        for page in pages:
-            for obj in page.get("Contents", []):
-                if obj["Key"].endswith("/"):  # Skip folder markers
-                    continue
-
-                # Download the file
-                response = self.s3_client.get_object(Bucket=bucket_name, Key=obj["Key"])
-
-                # Create BytesIO object for the file
-                bytes_buffer = BytesIO(response["Body"].read())
-                bytes_buffer.seek(0)
-
-                # Extract relative path by removing the folder_path prefix
-                relative_path = obj["Key"].replace(folder_path, "").lstrip("/")
-
-                # Create metadata object
-                metadata = S3FileMetadata(
-                    name=os.path.basename(obj["Key"]),
-                    full_path=obj["Key"],
-                    relative_path=relative_path,
-                    size=obj["Size"],
-                    content_type=response.get(
-                        "ContentType", "application/octet-stream"
-                    ),
-                    last_modified=obj["LastModified"],
-                    content=bytes_buffer,
-                )
-
-                downloaded_files.append(metadata)
+        downloaded_files = [
+            file async for file in self.iter_folder_from_s3(bucket_name, folder_path)
+        ]
+        # Downloads finish out of order, keep the listing order
+        downloaded_files.sort(key=lambda file: file.full_path)
 
         return DownloadFolderFromS3Output(
             message=f"Downloaded {len(downloaded_files)} files", files=downloaded_files
@@ -13,14 +13,14 @@ from pantheon_v2.tools.external.snowflake.models import (
 )
 
 from pantheon_v2.tools.core.activity_registry import ActivityRegistry
+from pantheon_v2.tools.core.tool_registry import ToolRegistry
 
 
 @ActivityRegistry.register_activity("Execute a SELECT query on the Snowflake database")
 async def query_snowflake_data(
     config: SnowflakeConfig, params: QueryParams
 ) -> QueryResult:
-    tool = SnowflakeTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(SnowflakeTool, config)
     return await tool.query(params)
 
 
@@ -28,8 +28,7 @@ async def query_snowflake_data(
 async def insert_snowflake_data(
     config: SnowflakeConfig, params: InsertParams
 ) -> ExecuteResult:
-    tool = SnowflakeTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(SnowflakeTool, config)
     return await tool.insert(params)
 
 
@@ -37,8 +36,7 @@ async def insert_snowflake_data(
 async def update_snowflake_data(
     config: SnowflakeConfig, params: UpdateParams
 ) -> ExecuteResult:
-    tool = SnowflakeTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(SnowflakeTool, config)
     return await tool.update(params)
 
 
@@ -46,6 +44,5 @@ async def update_snowflake_data(
 async def delete_snowflake_data(
     config: SnowflakeConfig, params: DeleteParams
 ) -> ExecuteResult:
-    tool = SnowflakeTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(SnowflakeTool, config)
     return await tool.delete(params)
@@ -1,5 +1,11 @@
 from pydantic import BaseModel, Field
 
+from pantheon_v2.settings.settings import Settings
+from pantheon_v2.tools.external.snowflake.constants import (
+    DEFAULT_BULK_LOAD_MIN_ROWS,
+    DEFAULT_SNOWFLAKE_QUERY_WORKERS,
+)
+
 
 class SnowflakeConfig(BaseModel):
     user: str = Field(..., description="Snowflake user")
@@ -8,3 +14,22 @@ class SnowflakeConfig(BaseModel):
     warehouse: str = Field(..., description="Snowflake warehouse")
     database: str = Field(..., description="Snowflake database")
     schema: str = Field(..., description="Snowflake schema")
+    pool_size: int = Field(5, description="Connection pool size")
+    max_overflow: int = Field(
+        10,
+        description="Maximum number of connections that can be created beyond pool_size",
+    )
+    max_concurrent_queries: int = Field(
+        DEFAULT_SNOWFLAKE_QUERY_WORKERS,
+        gt=0,
+        description="Maximum Snowflake calls the tool runs at once, each on its own thread",
+    )
+    bulk_load_min_rows: int = Field(
+        DEFAULT_BULK_LOAD_MIN_ROWS,
+        gt=0,
+        description="Inserts of at least this many rows are staged and loaded with COPY INTO",
+    )
+    slow_query_threshold_ms: int = Field(
+        default=Settings.DB_SLOW_QUERY_THRESHOLD_MS,
+        description="Statements taking at least this long are logged as slow queries",
+    )
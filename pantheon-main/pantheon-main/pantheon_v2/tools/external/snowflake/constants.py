@@ -0,0 +1,6 @@
+# Blocking Snowflake calls run on a pool this size unless configured
+DEFAULT_SNOWFLAKE_QUERY_WORKERS = 4
+
+# Inserts of at least this many rows are staged as Parquet and loaded with
+# COPY INTO, smaller ones are sent as a single multi-row INSERT
+DEFAULT_BULK_LOAD_MIN_ROWS = 1000
@@ -0,0 +1,200 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pyarrow as pa
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from pantheon_v2.tools.external.snowflake.models import (
+    DeleteParams,
+    InsertParams,
+    QueryParams,
+    UpdateParams,
+)
+from pantheon_v2.tools.external.snowflake.tool import SnowflakeTool
+
+Base = declarative_base()
+
+
+class Invoice(Base):
+    __tablename__ = "INVOICES"
+    id = Column("ID", Integer, primary_key=True)
+    invoice_status = Column("STATUS", String)
+
+
+@pytest.fixture
+def tool():
+    """Tool backed by an in-memory SQLite engine instead of Snowflake"""
+    tool = SnowflakeTool({})
+    # One shared connection, so every thread sees the same in-memory database
+    tool.engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(tool.engine)
+    tool.session = sessionmaker(bind=tool.engine)
+    tool.thread_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snowflake")
+    yield tool
+    tool.thread_pool.shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+async def test_insert_query_update_delete(tool):
+    await tool.insert(
+        InsertParams(
+            table="INVOICES",
+            values=[
+                {"id": 1, "invoice_status": "new"},
+                {"id": 2, "invoice_status": "new"},
+            ],
+            model=Invoice,
+        )
+    )
+    updated = await tool.update(
+        UpdateParams(
+            table="INVOICES",
+            values={"invoice_status": "paid"},
+            where={"id": 1},
+            model=Invoice,
+        )
+    )
+    deleted = await tool.delete(
+        DeleteParams(table="INVOICES", where={"id": 2}, model=Invoice)
+    )
+
+    result = await tool.query(
+        QueryParams(query="", parameters={"invoice_status": "paid"}, model=Invoice)
+    )
+
+    assert updated.affected_rows == 1
+    assert deleted.affected_rows == 1
+    assert result.columns == ["ID", "STATUS"]
+    assert result.rows == [{"id": 1, "invoice_status": "paid"}]
+    assert result.row_count == 1
+
+
+@pytest.mark.asyncio
+async def test_calls_run_off_the_event_loop(tool):
+    thread_names = []
+    original = tool._fetch_arrow_table
+
+    def record_thread(params):
+        thread_names.append(threading.current_thread().name)
+        return original(params)
+
+    tool._fetch_arrow_table = record_thread
+
+    result = await tool.query(QueryParams(query="", parameters={}, model=Invoice))
+
+    assert result.row_count == 0
+    assert thread_names[0].startswith("snowflake")
+
+
+@pytest.mark.asyncio
+async def test_query_fetches_arrow_batches(tool):
+    # The connector yields one table per result chunk, number columns may be
+    # narrowed differently in each
+    chunks = [
+        pa.table({"ID": pa.array([1], pa.int8()), "STATUS": ["new"]}),
+        pa.table({"ID": pa.array([300], pa.int16()), "STATUS": ["paid"]}),
+    ]
+    result = MagicMock()
+    result.cursor.fetch_arrow_batches.return_value = iter(chunks)
+    connection = MagicMock()
+    connection.execute.return_value = result
+    tool.engine = MagicMock()
+    tool.engine.connect.return_value.__enter__.return_value = connection
+
+    table = await tool.fetch_arrow_table(
+        QueryParams(query="", parameters={}, model=Invoice)
+    )
+
+    # Columns are renamed to the model's attribute names
+    assert table.to_pylist() == [
+        {"id": 1, "invoice_status": "new"},
+        {"id": 300, "invoice_status": "paid"},
+    ]
+    assert table.schema.field("id").type == pa.int16()
+    result.fetchall.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_large_inserts_are_bulk_loaded(tool):
+    tool.bulk_load_min_rows = 2
+    with patch(
+        "pantheon_v2.tools.external.snowflake.tool.write_pandas",
+        return_value=(True, 1, 2, []),
+    ) as mock_write_pandas:
+        result = await tool.insert(
+            InsertParams(
+                table="INVOICES",
+                values=[
+                    {"id": 1, "invoice_status": "new"},
+                    {"id": 2, "invoice_status": "paid"},
+                ],
+                model=Invoice,
+            )
+        )
+
+    assert result.affected_rows == 2
+    mock_write_pandas.assert_called_once()
+    df = mock_write_pandas.call_args.args[1]
+    # Rows are staged under the table's column names
+    assert df.to_dict("records") == [
+        {"ID": 1, "STATUS": "new"},
+        {"ID": 2, "STATUS": "paid"},
+    ]
+    assert mock_write_pandas.call_args.kwargs["table_name"] == "INVOICES"
+    assert mock_write_pandas.call_args.kwargs["compression"] == "snappy"
+
+
+@pytest.mark.asyncio
+async def test_bulk_load_uppercases_lowercase_identifiers(tool):
+    # Own metadata, the table is never created in the SQLite database
+    class Payment(declarative_base()):
+        __tablename__ = "payments"
+        __table_args__ = {"schema": "finance"}
+        id = Column(Integer, primary_key=True)
+        payment_status = Column("status", String)
+        memo = Column("Memo", String)
+
+    tool.bulk_load_min_rows = 1
+    with patch(
+        "pantheon_v2.tools.external.snowflake.tool.write_pandas",
+        return_value=(True, 1, 1, []),
+    ) as mock_write_pandas:
+        await tool.insert(
+            InsertParams(
+                table="payments",
+                values=[{"id": 1, "payment_status": "new", "memo": "first"}],
+                model=Payment,
+            )
+        )
+
+    # Unquoted lowercase names resolve to uppercase in Snowflake, mixed case
+    # names stay case-sensitive
+    df = mock_write_pandas.call_args.args[1]
+    assert list(df.columns) == ["ID", "STATUS", "Memo"]
+    assert mock_write_pandas.call_args.kwargs["table_name"] == "PAYMENTS"
+    assert mock_write_pandas.call_args.kwargs["schema"] == "FINANCE"
+
+
+@pytest.mark.asyncio
+async def test_failed_bulk_load_raises(tool):
+    tool.bulk_load_min_rows = 1
+    with patch(
+        "pantheon_v2.tools.external.snowflake.tool.write_pandas",
+        return_value=(False, 1, 0, []),
+    ):
+        with pytest.raises(ValueError, match="INVOICES"):
+            await tool.insert(
+                InsertParams(
+                    table="INVOICES",
+                    values={"id": 1, "invoice_status": "new"},
+                    model=Invoice,
+                )
+            )
@@ -1,8 +1,23 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pandas as pd
+import pyarrow as pa
 import structlog
-from sqlalchemy import create_engine
+from snowflake.connector.pandas_tools import write_pandas
+from sqlalchemy import create_engine, inspect, insert, select
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from pantheon_v2.tools.external.snowflake.config import SnowflakeConfig
+from pantheon_v2.tools.external.snowflake.constants import DEFAULT_BULK_LOAD_MIN_ROWS
+from pantheon_v2.settings.settings import Settings
+from pantheon_v2.utils.db_metrics import (
+    get_database_metrics,
+    instrument_engine,
+    instrumented_pool_class,
+)
 from pantheon_v2.tools.core.base import BaseTool
 from pantheon_v2.tools.core.tool_registry import ToolRegistry
 from pantheon_v2.tools.external.snowflake.models import (
@@ -14,7 +29,7 @@ from pantheon_v2.tools.external.snowflake.models import (
     DeleteParams,
 )
 
-from typing import Type, TypeVar
+from typing import Any, Callable, TypeVar
 from pydantic import BaseModel  # Import Pydantic BaseModel
 
 logger = structlog.get_logger(__name__)
@@ -29,6 +44,9 @@ class SnowflakeTool(BaseTool):
     def __init__(self, config: dict):
         self.engine = None
         self.session = None
+        self.metrics = None
+        self.thread_pool = None
+        self.bulk_load_min_rows = DEFAULT_BULK_LOAD_MIN_ROWS
         self.config = config
 
     async def initialize(self) -> None:
@@ -39,68 +57,205 @@ class SnowflakeTool(BaseTool):
                 f"snowflake://{config.user}:{config.password}@{config.account}/"
                 f"{config.database}/{config.schema}?warehouse={config.warehouse}"
             )
-            self.engine = create_engine(connection_string)
+            self.metrics = get_database_metrics(
+                f"snowflake://{config.account}/{config.database}",
+                config.slow_query_threshold_ms,
+                Settings.DB_METRICS_LOG_INTERVAL_SECONDS,
+            )
+            self.engine = create_engine(
+                connection_string,
+                poolclass=instrumented_pool_class(
+                    QueuePool, self.metrics, config.pool_size + config.max_overflow
+                ),
+                pool_size=config.pool_size,
+                max_overflow=config.max_overflow,
+            )
+            instrument_engine(self.engine, self.metrics)
             self.session = sessionmaker(bind=self.engine)
+            self.bulk_load_min_rows = config.bulk_load_min_rows
+            # Snowflake calls block for seconds, they run here instead of on
+            # the event loop, at most max_concurrent_queries at a time
+            self.thread_pool = ThreadPoolExecutor(
+                max_workers=config.max_concurrent_queries,
+                thread_name_prefix="snowflake",
+            )
             logger.info("Snowflake tool initialized successfully")
         except Exception as e:
             logger.error("Failed to initialize Snowflake tool", error=str(e))
             raise
 
+    async def cleanup(self) -> None:
+        """Wait for running queries, then close the engine's connections"""
+        if self.thread_pool is not None:
+            self.thread_pool.shutdown(wait=True)
+        if self.engine is not None:
+            self.engine.dispose()
+
+    async def _run_io(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking Snowflake call on the tool's bounded thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.thread_pool, partial(func, *args, **kwargs)
+        )
+
     @ToolRegistry.register_tool_action(
         description="Execute a SELECT query on the database"
     )
     async def query(self, params: QueryParams[T]) -> QueryResult:
         """Execute a SELECT query and return the results"""
         try:
-            with self.session() as session:
-                query = session.query(params.model).filter_by(**params.parameters)
-                rows = query.all()
-                columns = params.model.__table__.columns.keys()
-                return QueryResult(
-                    columns=columns,
-                    rows=[row.to_dict() for row in rows],
-                    row_count=len(rows),
-                )
+            table = await self.fetch_arrow_table(params)
+            rows = table.to_pylist()
+            return QueryResult(
+                columns=params.model.__table__.columns.keys(),
+                rows=rows,
+                row_count=len(rows),
+            )
         except Exception as e:
             logger.error("Query execution failed", error=str(e))
             raise
 
+    async def fetch_arrow_table(self, params: QueryParams[T]) -> pa.Table:
+        """
+        Run a query and return its result as an Arrow table.
+
+        Columns are named after the model's attributes, matching the keys of
+        query rows.
+        """
+        table = await self._run_io(self._fetch_arrow_table, params)
+        if self.metrics is not None:
+            self.metrics.record_rows_returned(table.num_rows)
+        return table
+
+    def _fetch_arrow_table(self, params: QueryParams[T]) -> pa.Table:
+        statement = select(params.model).filter_by(**(params.parameters or {}))
+        mapper = inspect(params.model)
+        names = [
+            mapper.get_property_by_column(column).key
+            for column in statement.selected_columns
+        ]
+
+        with self.engine.connect() as connection:
+            result = connection.execute(statement)
+            cursor = result.cursor
+            if hasattr(cursor, "fetch_arrow_batches"):
+                # Result chunks are decoded straight into columnar tables,
+                # one per chunk, instead of one Python row object per row
+                tables = [
+                    table.rename_columns(names)
+                    for table in cursor.fetch_arrow_batches()
+                ]
+            else:
+                # Drivers without Arrow support return plain rows
+                rows = result.fetchall()
+                tables = (
+                    [pa.Table.from_pylist([dict(zip(names, row)) for row in rows])]
+                    if rows
+                    else []
+                )
+
+        if not tables:
+            return pa.table({name: pa.array([]) for name in names})
+        # Chunks may narrow number columns differently, widen them to match
+        return pa.concat_tables(tables, promote_options="permissive")
+
     @ToolRegistry.register_tool_action(description="Insert data into the database")
     async def insert(self, params: InsertParams[T]) -> ExecuteResult:
         """Insert records into the specified table"""
         try:
-            with self.session() as session:
-                for values in params.values:
-                    new_record = params.model(**values)
-                    session.add(new_record)
-                session.commit()
-                return ExecuteResult(success=True, affected_rows=len(params.values))
+            return await self._run_io(self._insert, params)
         except Exception as e:
             logger.error("Insert operation failed", error=str(e))
             raise
 
+    def _insert(self, params: InsertParams[T]) -> ExecuteResult:
+        """
+        Insert rows without building an ORM object per row.
+
+        Large batches are written to a compressed Parquet stage file and loaded
+        with a single COPY INTO, smaller ones go out as one multi-row INSERT.
+        """
+        values = params.values if isinstance(params.values, list) else [params.values]
+        if not values:
+            return ExecuteResult(success=True, affected_rows=0)
+
+        # Rows are keyed by model attribute, the table by column name
+        mapper = inspect(params.model)
+        column_names = {
+            attribute.key: attribute.columns[0].name
+            for attribute in mapper.column_attrs
+        }
+        rows = [
+            {column_names.get(key, key): value for key, value in record.items()}
+            for record in values
+        ]
+
+        if len(rows) >= self.bulk_load_min_rows:
+            affected_rows = self._bulk_load(params.model.__table__, rows)
+        else:
+            with self.engine.begin() as connection:
+                connection.execute(insert(params.model.__table__), rows)
+            affected_rows = len(rows)
+        return ExecuteResult(success=True, affected_rows=affected_rows)
+
+    def _bulk_load(self, table, rows: list[dict]) -> int:
+        """Stage rows as Parquet and load them with COPY INTO, returning the rows loaded"""
+        # write_pandas quotes every identifier, so names are given in the case
+        # Snowflake stores them, as SQLAlchemy would when rendering them:
+        # lowercase names are case-insensitive and stored uppercase
+        denormalize = self.engine.dialect.denormalize_name
+        df = pd.DataFrame.from_records(rows)
+        df.columns = [denormalize(column) for column in df.columns]
+        with self.engine.connect() as connection:
+            success, chunks, loaded_rows, _ = write_pandas(
+                connection.connection.dbapi_connection,
+                df,
+                table_name=denormalize(table.name),
+                schema=denormalize(table.schema),
+                compression="snappy",
+                quote_identifiers=True,
+                use_logical_type=True,
+            )
+            connection.commit()
+
+        if not success:
+            raise ValueError(f"Bulk load into {table.name} failed")
+        logger.info(
+            "Bulk loaded rows into Snowflake",
+            table=table.name,
+            rows=loaded_rows,
+            chunks=chunks,
+        )
+        return loaded_rows
+
     @ToolRegistry.register_tool_action(description="Update data in the database")
-    async def update(self, model: Type[T], params: UpdateParams) -> ExecuteResult:
+    async def update(self, params: UpdateParams[T]) -> ExecuteResult:
         """Update records in the specified table"""
         try:
-            with self.session() as session:
-                query = session.query(model).filter_by(**params.where)
-                affected_rows = query.update(params.values, synchronize_session="fetch")
-                session.commit()
-                return ExecuteResult(success=True, affected_rows=affected_rows)
+            return await self._run_io(self._update, params)
         except Exception as e:
             logger.error("Update operation failed", error=str(e))
             raise
 
+    def _update(self, params: UpdateParams[T]) -> ExecuteResult:
+        with self.session() as session:
+            query = session.query(params.model).filter_by(**params.where)
+            affected_rows = query.update(params.values, synchronize_session="fetch")
+            session.commit()
+            return ExecuteResult(success=True, affected_rows=affected_rows)
+
     @ToolRegistry.register_tool_action(description="Delete data from the database")
     async def delete(self, params: DeleteParams[T]) -> ExecuteResult:
         """Delete records from the specified table"""
         try:
-            with self.session() as session:
-                query = session.query(params.model).filter_by(**params.where)
-                affected_rows = query.delete(synchronize_session="fetch")
-                session.commit()
-                return ExecuteResult(success=True, affected_rows=affected_rows)
+            return await self._run_io(self._delete, params)
         except Exception as e:
             logger.error("Delete operation failed", error=str(e))
             raise
+
+    def _delete(self, params: DeleteParams[T]) -> ExecuteResult:
+        with self.session() as session:
+            query = session.query(params.model).filter_by(**params.where)
+            affected_rows = query.delete(synchronize_session="fetch")
+            session.commit()
+            return ExecuteResult(success=True, affected_rows=affected_rows)
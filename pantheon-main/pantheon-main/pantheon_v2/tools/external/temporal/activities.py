@@ -6,12 +6,12 @@ from pantheon_v2.tools.external.temporal.models import (
 )
 
 from pantheon_v2.tools.core.activity_registry import ActivityRegistry
+from pantheon_v2.tools.core.tool_registry import ToolRegistry
 
 
 @ActivityRegistry.register_activity("Invoke a Temporal workflow")
 async def invoke_workflow(
     config: TemporalConfig, params: WorkflowParams
 ) -> WorkflowResponse:
-    tool = TemporalTool(config)
-    await tool.initialize()
+    tool = await ToolRegistry.get_tool_instance(TemporalTool, config)
     return await tool.invoke_workflow(params)
@@ -26,6 +26,10 @@ class TemporalTool(BaseTool):
     async def initialize(self) -> None:
         pass
 
+    async def cleanup(self) -> None:
+        """Drop the cached Temporal client"""
+        self.client = None
+
     @staticmethod
     async def get_api_handle(self):
         config = TemporalConfig(**self.config)
@@ -44,7 +48,10 @@ class TemporalTool(BaseTool):
     async def invoke_workflow(self, params: WorkflowParams) -> WorkflowResponse:
         """Invoke a Temporal workflow and return the result"""
         try:
-            api = await TemporalTool.get_api_handle(self)
+            # Connect once and reuse the client for later invocations
+            if self.client is None:
+                self.client = await TemporalTool.get_api_handle(self)
+            api = self.client
 
             result = await api.start_async_workflow(
                 RunWorkflowParams(
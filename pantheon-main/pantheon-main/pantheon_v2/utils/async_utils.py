@@ -0,0 +1,43 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def bounded_as_completed(
+    items: Iterable[T], func: Callable[[T], Awaitable[R]], limit: int
+) -> AsyncIterator[R]:
+    """
+    Run func over items with at most limit calls in flight, yielding results as they finish.
+
+    A new call is only started once a finished result has been handed to the
+    consumer, so at most limit results are held in memory at any time.
+    Remaining calls are cancelled if the consumer stops early or a call fails.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    items = iter(items)
+    pending = set()
+
+    def start_next() -> None:
+        for item in items:
+            pending.add(asyncio.ensure_future(func(item)))
+            return
+
+    try:
+        for _ in range(limit):
+            start_next()
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                yield task.result()
+                start_next()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
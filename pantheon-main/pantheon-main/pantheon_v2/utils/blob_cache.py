@@ -0,0 +1,152 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+CACHE_FILE_SUFFIX = ".blob"
+
+
+@dataclass
+class BlobCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size_bytes: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class BlobCache:
+    """
+    On-disk LRU cache of downloaded objects.
+
+    Entries are stored under a hash of the object's location and version
+    (GCS generation or S3 ETag), so a changed object is never served from a
+    stale entry and simply misses. Least recently used entries are evicted
+    once the cache grows past max_size_bytes. Safe to share between threads.
+    """
+
+    def __init__(self, directory: str, max_size_bytes: int):
+        self.directory = directory
+        self.max_size_bytes = max_size_bytes
+        self.stats = BlobCacheStats()
+        self._lock = threading.Lock()
+        # Cache file name -> size, least recently used first
+        self._entries: OrderedDict[str, int] = OrderedDict()
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_entries()
+
+    def _load_entries(self) -> None:
+        """Index entries left by earlier processes, oldest access first"""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(CACHE_FILE_SUFFIX):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self.stats.size_bytes += size
+        self.stats.entries = len(self._entries)
+        self._evict()
+
+    @staticmethod
+    def _entry_name(key: str, version: str) -> str:
+        digest = hashlib.sha256(f"{key}\0{version}".encode()).hexdigest()
+        return f"{digest}{CACHE_FILE_SUFFIX}"
+
+    def get(self, key: str, version: str) -> Optional[bytes]:
+        """Return the cached content of key at version, or None on a miss"""
+        name = self._entry_name(key, version)
+        with self._lock:
+            if name not in self._entries:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(name)
+
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+            # Access times are often not updated by the filesystem, record
+            # recency explicitly so a restarted process evicts in LRU order
+            os.utime(path)
+        except FileNotFoundError:
+            # Removed behind our back, e.g. by another process evicting it
+            with self._lock:
+                self._forget(name)
+                self.stats.misses += 1
+            return None
+
+        with self._lock:
+            self.stats.hits += 1
+        return content
+
+    def put(self, key: str, version: str, content: bytes) -> None:
+        """Store content of key at version, evicting old entries to stay under the cap"""
+        if len(content) > self.max_size_bytes:
+            return
+
+        name = self._entry_name(key, version)
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, os.path.join(self.directory, name))
+        except OSError as e:
+            logger.warning("Failed to write blob cache entry", key=key, error=str(e))
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            self._forget(name)
+            self._entries[name] = len(content)
+            self.stats.size_bytes += len(content)
+            self.stats.entries = len(self._entries)
+            self._evict()
+
+    def _forget(self, name: str) -> None:
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self.stats.size_bytes -= size
+            self.stats.entries = len(self._entries)
+
+    def _evict(self) -> None:
+        while self.stats.size_bytes > self.max_size_bytes and self._entries:
+            name, size = self._entries.popitem(last=False)
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            self.stats.size_bytes -= size
+            self.stats.evictions += 1
+        self.stats.entries = len(self._entries)
+
+
+_caches: dict[str, BlobCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_blob_cache(directory: str, max_size_bytes: int) -> BlobCache:
+    """Return the process-wide cache for a directory, shared by every tool using it"""
+    directory = os.path.abspath(directory)
+    with _caches_lock:
+        cache = _caches.get(directory)
+        if cache is None:
+            cache = BlobCache(directory, max_size_bytes)
+            _caches[directory] = cache
+        return cache
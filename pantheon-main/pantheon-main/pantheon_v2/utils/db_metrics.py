@@ -0,0 +1,325 @@
+import bisect
+import hashlib
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Type
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+logger = structlog.get_logger(__name__)
+
+# Upper bounds of the latency histogram buckets in milliseconds, the last
+# bucket collects everything slower
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Distinct slow statements kept for the summary, the least seen are dropped
+MAX_SLOW_FINGERPRINTS = 100
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:e[+-]?\d+)?\b", re.IGNORECASE)
+_BIND_RE = re.compile(r"(?<!:):\w+|%\(\w+\)s|%s|\$\d+|\?")
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_RE = re.compile(r"\(\?\+\)(?:\s*,\s*\(\?\+\))+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+DML_KEYWORDS = ("insert", "update", "delete", "merge", "copy")
+
+
+def fingerprint_sql(sql: str) -> str:
+    """
+    Normalise a statement so queries differing only in literals group together.
+
+    Comments are dropped, literals and bind parameters become ?, lists of
+    placeholders such as IN lists and multi-row VALUES collapse to (?+), and
+    whitespace and case are normalised.
+    """
+    sql = _COMMENT_RE.sub(" ", sql)
+    sql = _STRING_RE.sub("?", sql)
+    sql = _BIND_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = _LIST_RE.sub("(?+)", sql)
+    sql = _VALUES_RE.sub("(?+)", sql)
+    return _WHITESPACE_RE.sub(" ", sql).strip().rstrip(";").strip().lower()
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    """Short stable identifier of a fingerprint, for grouping in log queries"""
+    return hashlib.sha256(fingerprint.encode()).hexdigest()[:16]
+
+
+def statement_kind(fingerprint: str) -> str:
+    """Leading keyword of a fingerprint, e.g. select or insert"""
+    keyword = fingerprint.split(" ", 1)[0] if fingerprint else ""
+    return keyword if keyword in ("select", "with", *DML_KEYWORDS) else "other"
+
+
+@dataclass
+class LatencyHistogram:
+    """Counts of durations per bucket of LATENCY_BUCKETS_MS"""
+
+    counts: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given fraction of observations"""
+        if not self.count:
+            return None
+        threshold = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= threshold:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(LATENCY_BUCKETS_MS[index])
+                return self.max_ms
+        return self.max_ms
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 2),
+            "buckets": dict(
+                zip([*map(str, LATENCY_BUCKETS_MS), "inf"], self.counts, strict=True)
+            ),
+        }
+
+
+@dataclass
+class SlowQueryStats:
+    fingerprint: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class DatabaseMetrics:
+    """
+    Statement, row and connection pool metrics of one database.
+
+    Statements slower than slow_query_threshold_ms are logged with their
+    fingerprint as they happen. A summary of everything recorded is logged at
+    most every log_interval_seconds and is available from snapshot(). Safe to
+    share between threads.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        slow_query_threshold_ms: float,
+        log_interval_seconds: float,
+    ):
+        self.name = name
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.log_interval_seconds = log_interval_seconds
+        self._lock = threading.Lock()
+        self._statement_latency: Dict[str, LatencyHistogram] = {}
+        self._pool_wait = LatencyHistogram()
+        self._rows_returned = 0
+        self._rows_affected = 0
+        self._errors = 0
+        self._pool_checked_out = 0
+        self._pool_capacity = 0
+        self._pool_peak_checked_out = 0
+        self._slow_queries: Dict[str, SlowQueryStats] = {}
+        self._last_logged = time.monotonic()
+
+    def record_statement(
+        self, sql: str, duration_ms: float, rowcount: Optional[int] = None
+    ) -> None:
+        """Record one executed statement; rowcount counts as affected rows for DML"""
+        fingerprint = fingerprint_sql(sql)
+        kind = statement_kind(fingerprint)
+        slow = duration_ms >= self.slow_query_threshold_ms
+
+        with self._lock:
+            self._statement_latency.setdefault(kind, LatencyHistogram()).observe(
+                duration_ms
+            )
+            if kind in DML_KEYWORDS and rowcount is not None and rowcount >= 0:
+                self._rows_affected += rowcount
+            if slow:
+                self._record_slow_query(fingerprint, duration_ms)
+
+        if slow:
+            logger.warning(
+                "Slow query",
+                database=self.name,
+                fingerprint=fingerprint,
+                fingerprint_id=fingerprint_id(fingerprint),
+                duration_ms=round(duration_ms, 2),
+                rowcount=rowcount,
+            )
+        self._maybe_log_summary()
+
+    def record_error(self) -> None:
+        with self._lock:
+            self._errors += 1
+
+    def record_rows_returned(self, count: int) -> None:
+        with self._lock:
+            self._rows_returned += count
+
+    def record_pool_checkout(
+        self, wait_ms: float, checked_out: int, capacity: int
+    ) -> None:
+        """Record the wait for a pooled connection and the pool usage after it"""
+        with self._lock:
+            self._pool_wait.observe(wait_ms)
+            self._pool_checked_out = checked_out
+            self._pool_capacity = capacity
+            self._pool_peak_checked_out = max(self._pool_peak_checked_out, checked_out)
+
+    def _record_slow_query(self, fingerprint: str, duration_ms: float) -> None:
+        stats = self._slow_queries.get(fingerprint)
+        if stats is None:
+            if len(self._slow_queries) >= MAX_SLOW_FINGERPRINTS:
+                rarest = min(self._slow_queries.values(), key=lambda s: s.count)
+                del self._slow_queries[rarest.fingerprint]
+            stats = self._slow_queries[fingerprint] = SlowQueryStats(fingerprint)
+        stats.count += 1
+        stats.total_ms += duration_ms
+        stats.max_ms = max(stats.max_ms, duration_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            slow_queries = sorted(
+                self._slow_queries.values(), key=lambda s: s.total_ms, reverse=True
+            )
+            return {
+                "database": self.name,
+                "statements": {
+                    kind: histogram.summary()
+                    for kind, histogram in self._statement_latency.items()
+                },
+                "rows_returned": self._rows_returned,
+                "rows_affected": self._rows_affected,
+                "errors": self._errors,
+                "pool": {
+                    "wait": self._pool_wait.summary(),
+                    "checked_out": self._pool_checked_out,
+                    "peak_checked_out": self._pool_peak_checked_out,
+                    "capacity": self._pool_capacity,
+                    "utilisation": round(
+                        self._pool_checked_out / self._pool_capacity, 3
+                    )
+                    if self._pool_capacity
+                    else None,
+                },
+                "slow_queries": [
+                    {
+                        "fingerprint": stats.fingerprint,
+                        "fingerprint_id": fingerprint_id(stats.fingerprint),
+                        "count": stats.count,
+                        "total_ms": round(stats.total_ms, 2),
+                        "max_ms": round(stats.max_ms, 2),
+                    }
+                    for stats in slow_queries[:10]
+                ],
+            }
+
+    def log_summary(self) -> None:
+        logger.info("Database metrics", **self.snapshot())
+
+    def _maybe_log_summary(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_logged < self.log_interval_seconds:
+                return
+            self._last_logged = now
+        self.log_summary()
+
+
+_metrics: Dict[str, DatabaseMetrics] = {}
+_metrics_lock = threading.Lock()
+
+
+def get_database_metrics(
+    name: str, slow_query_threshold_ms: float, log_interval_seconds: float
+) -> DatabaseMetrics:
+    """Return the process-wide metrics of a database, shared by every tool using it"""
+    with _metrics_lock:
+        metrics = _metrics.get(name)
+        if metrics is None:
+            metrics = DatabaseMetrics(
+                name, slow_query_threshold_ms, log_interval_seconds
+            )
+            _metrics[name] = metrics
+        return metrics
+
+
+def log_database_metrics() -> None:
+    """Log the summary of every database, called on worker shutdown"""
+    with _metrics_lock:
+        metrics = list(_metrics.values())
+    for database_metrics in metrics:
+        database_metrics.log_summary()
+
+
+def instrumented_pool_class(
+    base: Type[Pool], metrics: DatabaseMetrics, capacity: int
+) -> Type[Pool]:
+    """
+    Subclass of a QueuePool type that records how long each checkout waited.
+
+    The wait covers queueing for a free connection and opening a new one, so
+    a slow activity can be told apart from a slow query.
+    """
+
+    class InstrumentedPool(base):
+        def _do_get(self):
+            start = time.perf_counter()
+            connection = super()._do_get()
+            metrics.record_pool_checkout(
+                (time.perf_counter() - start) * 1000, self.checkedout(), capacity
+            )
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def instrument_engine(engine: Engine, metrics: DatabaseMetrics) -> None:
+    """Time every statement run on a (sync) engine and record its row count"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        start = conn.info["query_start_time"].pop()
+        rowcount = getattr(cursor, "rowcount", None)
+        metrics.record_statement(
+            statement, (time.perf_counter() - start) * 1000, rowcount
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_time"):
+            start = conn.info["query_start_time"].pop()
+            if exception_context.statement is not None:
+                metrics.record_statement(
+                    exception_context.statement, (time.perf_counter() - start) * 1000
+                )
+        metrics.record_error()
@@ -1,4 +1,5 @@
 import base64
+from tempfile import SpooledTemporaryFile
 
 MIME_TYPE_SIGNATURES = {
     b"%PDF": "application/pdf",
@@ -16,6 +17,15 @@ MIME_TYPE_SIGNATURES = {
 
 MIME_TYPE_TEXT = "text"
 
+# Streamed downloads stay in memory up to this size and then roll over to disk
+SPOOL_MAX_MEMORY_BYTES = 16 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def new_spooled_file(max_size: int = SPOOL_MAX_MEMORY_BYTES) -> SpooledTemporaryFile:
+    """Create a binary buffer that spills to a temporary file past max_size bytes."""
+    return SpooledTemporaryFile(max_size=max_size, mode="w+b")
+
 
 def infer_file_type(base64_content: str) -> str:
     """Infer the file type from the content."""
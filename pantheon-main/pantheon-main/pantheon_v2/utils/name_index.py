@@ -0,0 +1,100 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+def normalise_name(name: str) -> str:
+    """Lowercase a name and drop everything but letters and digits"""
+    return "".join(c.lower() for c in name if c.isalnum())
+
+
+def trigrams(normalised: str) -> Set[str]:
+    """Character trigrams of a normalised name, padded so short names still match"""
+    padded = f"  {normalised} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass
+class NameMatch:
+    id: str
+    name: str
+    # Jaccard similarity of the trigrams, 1.0 for an exact normalised match
+    similarity: float
+
+
+class NameIndex:
+    """
+    In-memory index of names by their normalised form.
+
+    Exact lookups are a dict hit on the normalised name. Fuzzy lookups score
+    only the names sharing at least one trigram with the query, found through
+    an inverted trigram index, instead of comparing against every name.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        self._by_normalised: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._normalised_by_trigram: Dict[str, Set[str]] = defaultdict(set)
+
+        for entry_id, name in entries:
+            normalised = normalise_name(name)
+            if not normalised:
+                continue
+            self._by_normalised[normalised].append((entry_id, name))
+            if normalised not in self._trigrams:
+                grams = trigrams(normalised)
+                self._trigrams[normalised] = grams
+                for gram in grams:
+                    self._normalised_by_trigram[gram].add(normalised)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_normalised.values())
+
+    def exact(self, name: str) -> List[NameMatch]:
+        """Every entry whose normalised name equals the normalised query"""
+        return [
+            NameMatch(id=entry_id, name=entry_name, similarity=1.0)
+            for entry_id, entry_name in self._by_normalised.get(
+                normalise_name(name), []
+            )
+        ]
+
+    def best_match(self, name: str, min_similarity: float) -> Optional[NameMatch]:
+        """
+        Closest entry to name, or None when nothing reaches min_similarity.
+
+        Exact normalised matches win outright. Ties are broken by the
+        normalised name so the result does not depend on insertion order.
+        """
+        exact = self.exact(name)
+        if exact:
+            return exact[0]
+
+        normalised = normalise_name(name)
+        if not normalised:
+            return None
+
+        query_grams = trigrams(normalised)
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in query_grams:
+            for candidate in self._normalised_by_trigram.get(gram, ()):
+                shared[candidate] += 1
+
+        best: Optional[Tuple[float, str]] = None
+        for candidate, count in shared.items():
+            union = len(query_grams) + len(self._trigrams[candidate]) - count
+            similarity = count / union
+            if similarity < min_similarity:
+                continue
+            if (
+                best is None
+                or similarity > best[0]
+                or (similarity == best[0] and candidate < best[1])
+            ):
+                best = (similarity, candidate)
+
+        if best is None:
+            return None
+        similarity, candidate = best
+        entry_id, entry_name = self._by_normalised[candidate][0]
+        return NameMatch(id=entry_id, name=entry_name, similarity=similarity)
@@ -0,0 +1,61 @@
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from pantheon_v2.utils.async_utils import bounded_as_completed
+
+
+@pytest.mark.asyncio
+async def test_bounded_as_completed_limits_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def work(item):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01 * (item % 3))
+        in_flight -= 1
+        return item * 2
+
+    results = [result async for result in bounded_as_completed(range(10), work, 3)]
+
+    assert sorted(results) == [i * 2 for i in range(10)]
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_bounded_as_completed_cancels_pending_on_early_exit():
+    started = []
+    cancelled = []
+
+    async def work(item):
+        started.append(item)
+        try:
+            await asyncio.sleep(0 if item == 0 else 10)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+        return item
+
+    async with aclosing(bounded_as_completed(range(100), work, 4)) as results:
+        async for result in results:
+            assert result == 0
+            break
+
+    # Only the first window was ever started
+    assert len(started) == 4
+    assert sorted(cancelled) == sorted(started[1:])
+
+
+@pytest.mark.asyncio
+async def test_bounded_as_completed_propagates_errors():
+    async def work(item):
+        if item == 1:
+            raise RuntimeError("failed")
+        await asyncio.sleep(10)
+
+    with pytest.raises(RuntimeError, match="failed"):
+        async for _ in bounded_as_completed(range(5), work, 2):
+            pass
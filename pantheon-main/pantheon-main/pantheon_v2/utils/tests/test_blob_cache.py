@@ -0,0 +1,49 @@
+from pantheon_v2.utils.blob_cache import BlobCache, get_blob_cache
+
+
+def test_get_returns_content_for_matching_version(tmp_path):
+    cache = BlobCache(str(tmp_path), max_size_bytes=1024)
+    cache.put("gs://bucket/a.pdf", "1", b"first")
+
+    assert cache.get("gs://bucket/a.pdf", "1") == b"first"
+    assert cache.get("gs://bucket/a.pdf", "2") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = BlobCache(str(tmp_path), max_size_bytes=10)
+    cache.put("a", "1", b"aaaa")
+    cache.put("b", "1", b"bbbb")
+    # Touch a so b becomes the least recently used entry
+    cache.get("a", "1")
+    cache.put("c", "1", b"cccc")
+
+    assert cache.get("b", "1") is None
+    assert cache.get("a", "1") == b"aaaa"
+    assert cache.get("c", "1") == b"cccc"
+    assert cache.stats.evictions == 1
+    assert cache.stats.size_bytes == 8
+    assert len(list(tmp_path.glob("*.blob"))) == 2
+
+
+def test_entries_larger_than_the_cap_are_not_stored(tmp_path):
+    cache = BlobCache(str(tmp_path), max_size_bytes=4)
+    cache.put("a", "1", b"too large")
+
+    assert cache.get("a", "1") is None
+    assert cache.stats.size_bytes == 0
+
+
+def test_entries_survive_a_restart(tmp_path):
+    BlobCache(str(tmp_path), max_size_bytes=1024).put("a", "1", b"content")
+
+    cache = BlobCache(str(tmp_path), max_size_bytes=1024)
+
+    assert cache.stats.entries == 1
+    assert cache.get("a", "1") == b"content"
+
+
+def test_get_blob_cache_is_shared_per_directory(tmp_path):
+    assert get_blob_cache(str(tmp_path), 1024) is get_blob_cache(str(tmp_path), 1024)
@@ -0,0 +1,104 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from pantheon_v2.utils.db_metrics import (
+    DatabaseMetrics,
+    LatencyHistogram,
+    fingerprint_sql,
+    instrument_engine,
+    instrumented_pool_class,
+)
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        (
+            "SELECT * FROM t WHERE id = 5 AND name = 'o''b' -- trailing",
+            "select * from t where id = ? and name = ?",
+        ),
+        (
+            "select * from t where id IN (:a, :b, :c)",
+            "select * from t where id in (?+)",
+        ),
+        (
+            'INSERT INTO t ("a", "b") VALUES (:p0_0, :p0_1), (:p1_0, :p1_1);',
+            'insert into t ("a", "b") values (?+)',
+        ),
+        (
+            "update t set a = %(a)s where b = $1 and c::text = ?",
+            "update t set a = ? where b = ? and c::text = ?",
+        ),
+    ],
+)
+def test_fingerprint_sql(sql, expected):
+    assert fingerprint_sql(sql) == expected
+
+
+def test_fingerprint_groups_statements_differing_only_in_literals():
+    assert fingerprint_sql("SELECT * FROM t WHERE id = 1") == fingerprint_sql(
+        "select *\n  from t where id = 42"
+    )
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for duration_ms in [1, 2, 3, 40, 20000]:
+        histogram.observe(duration_ms)
+
+    assert histogram.percentile(0.5) == 5
+    assert histogram.percentile(0.8) == 50
+    # Observations beyond the last bucket report the maximum
+    assert histogram.percentile(1.0) == 20000
+    assert histogram.summary()["buckets"]["inf"] == 1
+
+
+def test_slow_queries_are_logged_and_summarised():
+    metrics = DatabaseMetrics(
+        "db", slow_query_threshold_ms=100, log_interval_seconds=60
+    )
+
+    metrics.record_statement("SELECT * FROM t WHERE id = 1", 150)
+    metrics.record_statement("SELECT * FROM t WHERE id = 2", 250)
+    metrics.record_statement("SELECT 1", 1)
+    metrics.record_statement("UPDATE t SET a = 1", 5, rowcount=3)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["statements"]["select"]["count"] == 3
+    assert snapshot["rows_affected"] == 3
+    assert snapshot["slow_queries"] == [
+        {
+            "fingerprint": "select * from t where id = ?",
+            "fingerprint_id": snapshot["slow_queries"][0]["fingerprint_id"],
+            "count": 2,
+            "total_ms": 400,
+            "max_ms": 250,
+        }
+    ]
+
+
+def test_instrumented_engine_records_statements_and_pool_checkouts():
+    metrics = DatabaseMetrics(
+        "sqlite", slow_query_threshold_ms=0, log_interval_seconds=60
+    )
+    engine = create_engine(
+        "sqlite://", poolclass=instrumented_pool_class(QueuePool, metrics, capacity=4)
+    )
+    instrument_engine(engine, metrics)
+
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE t (id INTEGER)"))
+        connection.execute(text("INSERT INTO t VALUES (1), (2)"))
+        connection.execute(text("SELECT * FROM t")).fetchall()
+        with pytest.raises(Exception):
+            connection.execute(text("SELECT * FROM missing"))
+
+    snapshot = metrics.snapshot()
+    assert snapshot["statements"]["insert"]["count"] == 1
+    assert snapshot["statements"]["select"]["count"] == 2
+    assert snapshot["rows_affected"] == 2
+    assert snapshot["errors"] == 1
+    assert snapshot["pool"]["wait"]["count"] == 1
+    assert snapshot["pool"]["checked_out"] == 1
+    assert snapshot["pool"]["utilisation"] == 0.25
@@ -0,0 +1,42 @@
+from pantheon_v2.utils.name_index import NameIndex, normalise_name
+
+
+def test_normalise_name_drops_case_and_punctuation():
+    assert normalise_name("Acme Games, Inc.") == "acmegamesinc"
+
+
+def test_exact_matches_ignore_case_and_punctuation():
+    index = NameIndex([("1", "Acme Games, Inc."), ("2", "ACME games inc")])
+
+    matches = index.exact("acme-games inc")
+
+    assert [match.id for match in matches] == ["1", "2"]
+    assert all(match.similarity == 1.0 for match in matches)
+
+
+def test_best_match_prefers_exact_match():
+    index = NameIndex([("1", "Acme Games Inc"), ("2", "Acme Game Inc")])
+
+    assert index.best_match("acme game inc", min_similarity=0.5).id == "2"
+
+
+def test_best_match_finds_close_names():
+    index = NameIndex([("1", "Night School Studio"), ("2", "Boss Fight Entertainment")])
+
+    match = index.best_match("Night School Studios", min_similarity=0.8)
+
+    assert match.id == "1"
+    assert 0.8 <= match.similarity < 1.0
+
+
+def test_best_match_rejects_names_below_threshold():
+    index = NameIndex([("1", "Night School Studio")])
+
+    assert index.best_match("Boss Fight", min_similarity=0.8) is None
+    assert index.best_match("!!!", min_similarity=0.8) is None
+
+
+def test_names_without_letters_or_digits_are_skipped():
+    index = NameIndex([("1", "---"), ("2", "Acme")])
+
+    assert len(index) == 1
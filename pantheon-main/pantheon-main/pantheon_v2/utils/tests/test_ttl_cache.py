@@ -0,0 +1,84 @@
+import pytest
+
+from pantheon_v2.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_their_ttl():
+    clock = FakeClock()
+    cache = TTLCache(max_entries=10, clock=clock)
+    cache.put("a", 1, ttl_seconds=10)
+
+    clock.now = 9
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = TTLCache(max_entries=2)
+    cache.put("a", 1, ttl_seconds=60)
+    cache.put("b", 2, ttl_seconds=60)
+    # Touch a so b becomes the least recently used entry
+    cache.get("a")
+    cache.put("c", 3, ttl_seconds=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_invalidate_tag_drops_only_tagged_entries():
+    cache = TTLCache(max_entries=10)
+    cache.put("vendors", 1, ttl_seconds=60, tags=["vendors"])
+    cache.put("joined", 2, ttl_seconds=60, tags=["vendors", "invoices"])
+    cache.put("emails", 3, ttl_seconds=60, tags=["emails"])
+
+    assert cache.invalidate_tag("vendors") == 2
+    assert cache.get("vendors") is None
+    assert cache.get("joined") is None
+    assert cache.get("emails") == 3
+    # The joined entry is no longer indexed under its other tag either
+    assert cache.invalidate_tag("invoices") == 0
+
+
+def test_replacing_an_entry_updates_its_tags():
+    cache = TTLCache(max_entries=10)
+    cache.put("a", 1, ttl_seconds=60, tags=["old"])
+    cache.put("a", 2, ttl_seconds=60, tags=["new"])
+
+    assert cache.invalidate_tag("old") == 0
+    assert cache.get("a") == 2
+    assert cache.invalidate_tag("new") == 1
+
+
+def test_put_skips_values_loaded_before_an_invalidation():
+    cache = TTLCache(max_entries=10)
+    generations = cache.generations(["vendors"])
+    cache.invalidate_tag("vendors")
+
+    assert not cache.put(
+        "a", 1, ttl_seconds=60, tags=["vendors"], generations=generations
+    )
+    assert cache.get("a") is None
+    # Reading the generations again after the invalidation allows the put
+    generations = cache.generations(["vendors"])
+    assert cache.put("a", 2, ttl_seconds=60, tags=["vendors"], generations=generations)
+    assert cache.get("a") == 2
+
+
+def test_max_entries_must_be_positive():
+    with pytest.raises(ValueError):
+        TTLCache(max_entries=0)
@@ -0,0 +1,131 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+
+@dataclass
+class TTLCacheStats:
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    tags: Tuple[str, ...]
+
+
+class TTLCache:
+    """
+    In-memory LRU cache whose entries expire after their own time to live.
+
+    Entries carry tags, such as the tables a query reads, so writers can drop
+    every entry depending on what they changed with invalidate_tag. A value
+    loaded while one of its tags was invalidated is dropped by put when given
+    the tag generations read before loading it. Least recently used entries
+    are evicted beyond max_entries. Safe to share between threads.
+    """
+
+    def __init__(self, max_entries: int, clock: Callable[[], float] = time.monotonic):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.stats = TTLCacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._keys_by_tag: Dict[str, Set[Hashable]] = {}
+        # Bumped by invalidate_tag, never reset so a stale load is always seen
+        self._generations: Dict[str, int] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the live value of key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value
+
+    def generations(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        """Invalidation counters of tags, read before loading a value to put"""
+        with self._lock:
+            return tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl_seconds: float,
+        tags: Iterable[str] = (),
+        generations: Optional[Tuple[int, ...]] = None,
+    ) -> bool:
+        """
+        Store value under key for ttl_seconds, dropped early if any tag is invalidated.
+
+        With generations from before the value was loaded, the value is not
+        stored if any tag was invalidated since. Returns whether it was stored.
+        """
+        tags = tuple(tags)
+        with self._lock:
+            if generations is not None and generations != tuple(
+                self._generations.get(tag, 0) for tag in tags
+            ):
+                return False
+            self._remove(key)
+            self._entries[key] = _Entry(value, self._clock() + ttl_seconds, tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats.evictions += 1
+            return True
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Drop every entry carrying tag, returning how many were dropped"""
+        with self._lock:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            keys = self._keys_by_tag.pop(tag, set())
+            for key in keys:
+                self._remove(key)
+            self.stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
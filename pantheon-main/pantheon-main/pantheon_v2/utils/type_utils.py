@@ -1,7 +1,10 @@
 import importlib
 import os
+from functools import lru_cache
 from pathlib import Path
 
+from pydantic import BaseModel, TypeAdapter
+
 
 def get_fqn(cls):
     if cls.__module__ == "builtins":
@@ -53,3 +56,14 @@ def get_model_class(model_name: str) -> type:
         return getattr(module, class_name)
     except (ImportError, AttributeError) as e:
         raise ValueError(f"Could not load model class '{model_name}': {str(e)}")
+
+
+@lru_cache(maxsize=256)
+def get_list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """
+    Return a cached TypeAdapter validating a list of model in one call.
+
+    Building an adapter compiles a validator, so it is done once per model
+    instead of on every query.
+    """
+    return TypeAdapter(list[model])